@@ -124,6 +124,8 @@ function performSave() {
             action: 'saveComplete',
             imageCount: response.imageCount,
             promptCount: response.promptCount,
+            addedImages: response.addedImages,
+            addedPrompts: response.addedPrompts,
             autoDownloadEnabled: autoDownloadEnabled
           });
           
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sora Auto Save 파일 정리 프로그램 - 벤치마크
+임시 폴더에 가상의 다운로드/백업 폴더를 만들고 정리 단계별 소요 시간을 측정하여 JSON으로 저장
+
+사용 예:
+    python benchmark_organizer.py                                  # 10, 1000개 파일
+    python benchmark_organizer.py --sizes 10 1000 100000 --repeat 3
+    python benchmark_organizer.py --compare benchmark_baseline.json --threshold 0.25
+    python benchmark_organizer.py --backend legacy                 # 기존 검색/복사 방식으로 측정
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import statistics
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+
+from file_organizer import FileOrganizer, start_log_listener
+
+PHASES = [
+    "find_files",
+    "get_latest_file",
+    "validate_json_file",
+    "copy_file",
+    "backup_old_files",
+    "cleanup_old_backups",
+    "move_sync_latest",
+    "move_sync_exact",
+]
+
+# 이 값보다 짧은 측정치는 잡음으로 보고 회귀 판정에서 제외
+NOISE_FLOOR_SECONDS = 0.005
+
+
+def make_sora_json(target_kb: int, seed: int) -> str:
+    """실제 수집 데이터와 같은 구조의 Sora JSON 문자열 생성 (대략 target_kb 크기)"""
+    rng = random.Random(seed)
+    images = []
+    prompts = []
+    data = {
+        "metadata": {
+            "created_at": datetime.now().isoformat(),
+            "version": "1.0.0",
+            "source": "Sora ChatGPT Auto Save Extension - benchmark",
+            "total_images": 0,
+            "total_prompts": 0,
+            "data_index_filter": "1",
+        },
+        "images": images,
+        "prompts": prompts,
+    }
+
+    size = 0
+    index = 0
+    while size < target_kb * 1024:
+        index += 1
+        prompt = " ".join(rng.choice(["리그 오브 레전드", "cinematic", "neon city", "portrait",
+                                      "wide shot", "golden hour", "대회 중", "slow motion"])
+                          for _ in range(rng.randint(8, 30)))
+        image = {
+            "id": f"video_{1732983569123 + index}_{index}",
+            "url": f"https://videos.openai.com/vg-assets/{rng.getrandbits(64):016x}/{index}.mp4",
+            "alt": "Generated video",
+            "width": rng.choice([1024, 1080, 1536]),
+            "height": rng.choice([1024, 1536, 1920]),
+            "pageUrl": "https://sora.chatgpt.com/library",
+            "prompt": prompt,
+            "originalPrompt": f"Image prompt {prompt}",
+            "title": f"Benchmark Item {index}",
+            "mediaType": rng.choice(["image", "video"]),
+        }
+        images.append(image)
+        prompts.append({
+            "id": f"prompt_{1732983569123 + index}_{index}",
+            "text": prompt,
+            "timestamp": datetime.now().isoformat(),
+            "pageUrl": "https://sora.chatgpt.com/library",
+            "source": "data-index-1",
+        })
+        size += len(json.dumps(image, ensure_ascii=False)) + len(prompt) + 200
+
+    data["metadata"]["total_images"] = len(images)
+    data["metadata"]["total_prompts"] = len(prompts)
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def build_tree(root: Path, file_count: int, file_kb: int, latest_kb: int, collisions: int) -> Dict[str, Path]:
+    """가상의 다운로드/백업/이동 소스 폴더 생성"""
+    download = root / "Downloads"
+    backup = root / "backup"
+    target = root / "organized"
+    move_source = root / "move_source"
+    move_target = root / "move_target"
+    for folder in (download, backup, target, move_source, move_target):
+        folder.mkdir(parents=True, exist_ok=True)
+
+    # 대부분의 파일은 같은 내용을 공유 (이동/검색 비용은 내용과 무관)
+    bulk = make_sora_json(file_kb, seed=1)
+    latest = make_sora_json(latest_kb, seed=2)
+
+    base_time = time.time() - file_count - 10
+    for i in range(file_count):
+        path = download / f"sora_auto_save_{i}.json"
+        path.write_text(latest if i == file_count - 1 else bulk, encoding="utf-8")
+        os.utime(path, (base_time + i, base_time + i))
+
+        move_file = move_source / f"data_{i}.json"
+        move_file.write_text(bulk, encoding="utf-8")
+        os.utime(move_file, (base_time + i, base_time + i))
+    (move_source / "data.json").write_text(latest, encoding="utf-8")
+
+    # 이름이 겹치는 기존 백업 파일 (backup_old_files의 이름 변경 루프 부하)
+    for i in range(min(file_count, 100)):
+        for n in range(collisions + 1):
+            name = f"sora_auto_save_{i}.json" if n == 0 else f"sora_auto_save_{i}_{n}.json"
+            (backup / name).write_text("{}", encoding="utf-8")
+
+    return {
+        "root": root,
+        "download": download,
+        "backup": backup,
+        "target": target,
+        "move_source": move_source,
+        "move_target": move_target,
+    }
+
+
+def timed(func, *args):
+    """함수 실행 시간 측정 (결과, 초)"""
+    start = time.perf_counter()
+    value = func(*args)
+    return value, time.perf_counter() - start
+
+
+def run_once(file_count: int, args) -> Dict[str, float]:
+    """한 번의 전체 측정 (트리 생성은 측정에서 제외)"""
+    # GUI의 이동 메서드는 log_message와 config만 사용하므로 Tk 없이 호출
+    from file_organizer_gui import FileOrganizerGUI
+
+    with tempfile.TemporaryDirectory(prefix="sora_bench_") as tmp:
+        tree = build_tree(Path(tmp), file_count, args.file_kb, args.latest_kb, args.collisions)
+
+        config_file = tree["root"] / "bench_config.json"
+        config_file.write_text(json.dumps({
+            "download_folder": str(tree["download"]),
+            "target_folder": str(tree["target"]),
+            "backup_folder": str(tree["backup"]),
+            "file_pattern": "sora_auto_save_*.json",
+            "output_filename": "sora_auto_save.json",
+            "backup_old_files": True,
+            "max_backup_files": args.max_backup_files,
+            "backend": args.backend,
+        }), encoding="utf-8")
+
+        organizer = FileOrganizer(str(config_file))
+        timings = {}
+
+        files, timings["find_files"] = timed(organizer.find_files, organizer.config["file_pattern"])
+        latest, timings["get_latest_file"] = timed(organizer.get_latest_file, files)
+        _, timings["validate_json_file"] = timed(organizer.validate_json_file, latest)
+        target = tree["target"] / organizer.config["output_filename"]
+        _, timings["copy_file"] = timed(organizer.copy_file, latest, target)
+        _, timings["backup_old_files"] = timed(organizer.backup_old_files, files)
+        _, timings["cleanup_old_backups"] = timed(organizer.cleanup_old_backups)
+
+        gui = SimpleNamespace(log_message=lambda message: None, config={"backend": args.backend})
+        _, timings["move_sync_latest"] = timed(
+            FileOrganizerGUI.execute_file_move_sync, gui, 1,
+            str(tree["move_source"]), str(tree["move_target"]), "")
+        _, timings["move_sync_exact"] = timed(
+            FileOrganizerGUI.execute_file_move_sync, gui, 2,
+            str(tree["move_source"]), str(tree["move_target"]), "data.json")
+
+        return timings
+
+
+def run_benchmark(args) -> Dict:
+    """모든 크기에 대해 측정하고 결과 딕셔너리 반환"""
+    results = {}
+    for file_count in args.sizes:
+        runs: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+        for repeat in range(args.repeat):
+            print(f"▶ {file_count:,}개 파일 - {repeat + 1}/{args.repeat}회", flush=True)
+            for phase, seconds in run_once(file_count, args).items():
+                runs[phase].append(seconds)
+
+        results[str(file_count)] = {
+            phase: {
+                "median": statistics.median(values),
+                "min": min(values),
+                "max": max(values),
+            }
+            for phase, values in runs.items()
+        }
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": args.sizes,
+            "repeat": args.repeat,
+            "file_kb": args.file_kb,
+            "latest_kb": args.latest_kb,
+            "collisions": args.collisions,
+            "backend": args.backend,
+        },
+        "results": results,
+    }
+
+
+def compare_results(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """기준 결과 대비 느려진 단계 목록 반환"""
+    regressions = []
+    for size, phases in current["results"].items():
+        base_phases = baseline.get("results", {}).get(size)
+        if not base_phases:
+            continue
+        for phase, stats in phases.items():
+            base = base_phases.get(phase)
+            if not base:
+                continue
+            now, before = stats["median"], base["median"]
+            if now < NOISE_FLOOR_SECONDS:
+                continue
+            if now > before * (1 + threshold):
+                change = (now / before - 1) * 100 if before else float("inf")
+                regressions.append(f"{size}개 / {phase}: {before * 1000:.1f}ms → {now * 1000:.1f}ms (+{change:.0f}%)")
+    return regressions
+
+
+def print_table(report: Dict):
+    """결과 표 출력"""
+    sizes = list(report["results"].keys())
+    print()
+    print(f"{'단계':<22}" + "".join(f"{int(size):>14,}" for size in sizes))
+    for phase in PHASES:
+        row = f"{phase:<22}"
+        for size in sizes:
+            row += f"{report['results'][size][phase]['median'] * 1000:>12.1f}ms"
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sora Auto Save 파일 정리 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000], help="다운로드 폴더 파일 수 (예: 10 1000 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="크기별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--file-kb", type=int, default=4, help="일반 파일 크기 (KB)")
+    parser.add_argument("--latest-kb", type=int, default=2048, help="최신 파일 크기 (KB, 검사/복사 대상)")
+    parser.add_argument("--collisions", type=int, default=20, help="이름이 겹치는 기존 백업 파일 수 (파일당)")
+    parser.add_argument("--max-backup-files", type=int, default=10, help="최대 백업 파일 수")
+    parser.add_argument("--backend", choices=["fast", "legacy"], default="fast", help="검색/복사 방식")
+    parser.add_argument("--output", default="benchmark_results.json", help="결과 JSON 파일")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.25, help="회귀로 판단할 증가율 (0.25 = 25%%)")
+
+    args = parser.parse_args()
+
+    # 파일마다 남기는 로그가 콘솔을 덮지 않도록 파일로만 기록
+    start_log_listener(log_dir=str(Path(tempfile.gettempdir()) / "sora_bench_logs"), console=False)
+
+    report = run_benchmark(args)
+    print_table(report)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건 (기준: +{args.threshold * 100:.0f}%)")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n✅ 기준 대비 회귀 없음 (기준: +{args.threshold * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,35 @@ function getLocalizedMessage(messageKey, substitutions = []) {
 let savedImages = [];
 let savedPrompts = [];
 
+// 이미 수집한 미디어 URL / 프롬프트 텍스트 (다시 읽지 않음)
+const seenImageUrls = new Set();
+const seenPromptTexts = new Set();
+
+// chrome.storage 저장 형식 - 항목마다 키 하나 (savedImages:<URL 해시>, savedPrompts:<텍스트 해시>), 값은 { order, item }
+// 키가 저장 순번이 아니라 항목으로 정해지므로 여러 탭이 같이 저장해도 서로 덮어쓰지 않고,
+// 오래된 항목을 지울 때도 남은 항목의 키는 다시 쓰지 않음
+const SAVED_DATA_KEYS = ['savedImages', 'savedPrompts'];
+// 저장소에 있거나 저장할 항목 - 키 → { prefix, order, item } (다른 탭의 변경은 storage.onChanged로 반영)
+const savedShards = new Map();
+// 아직 저장하지 않은 항목 키 / 저장소에서 지울 (상한을 넘어 삭제한) 항목 키
+const unsavedShardKeys = new Set();
+const evictedShardKeys = new Set();
+// 항목 → 키 (해시를 다시 계산하지 않음)
+const shardKeyCache = new WeakMap();
+// 마지막으로 매긴 저장 순서 (시각 기반이라 여러 탭의 항목도 저장한 순서대로 정렬됨)
+let lastShardOrder = 0;
+// 예전 형식(배열 하나 / 순번 키 savedImages_0 + 개수 키)으로 남아 있는 키 - 항목별 키로 옮긴 뒤 삭제
+let legacyStorageKeys = [];
+// 기존 데이터를 다 불러오기 전에는 수집/저장하지 않음 (먼저 저장하면 저장된 기록 위에 쓰고, 수집한 항목은 다시 읽지 않음)
+let dataLoaded = false;
+// 불러오는 동안 들어온 저장소 변경 (다른 탭) - 불러온 뒤 반영
+let pendingStorageChanges = [];
+// 저장 개수 상한 - chrome.storage.local 기본 용량(10MB) 안에 머물도록 넘으면 오래된 항목부터 삭제
+const MAX_SAVED_IMAGES = 2000;
+const MAX_SAVED_PROMPTS = 2000;
+// 상한을 넘으면 이만큼 더 지워 삭제를 모아서 함
+const SAVED_EVICT_BATCH = 200;
+
 // 언어 설정
 let currentLanguage = 'en';
 
@@ -24,13 +53,63 @@ let isPanelCreated = false;
 let pageCountdownTimer = null;
 let pageCountdownInterval = null;
 
+// 데이터 수집 스케줄러 - DOM 변경이 이어지는 동안은 모아 두었다가 한 번만 수집
+const COLLECT_DEBOUNCE_MS = 1000; // 마지막 변경 후 이 시간 동안 조용하면 수집
+const COLLECT_MAX_WAIT_MS = 5000; // 변경이 계속되어도 첫 변경 후 이 시간 안에는 수집
+const COLLECT_IDLE_TIMEOUT_MS = 2000; // 브라우저가 바빠도 이 시간 안에는 수집 (requestIdleCallback)
+
+let collectDebounceTimer = null;
+let collectMaxWaitTimer = null;
+let collectIdleHandle = null;
+
+// 변경 기록에서 모은, 다음 예약 수집 때 확인할 data-index 컨테이너
+const pendingContainers = new Set();
+
+// 수집 횟수 통계 (팝업에서 getCollectStats로 조회)
+const collectStats = {
+  startedAt: Date.now(),
+  mutationRecords: 0, // 관찰한 변경 기록 수
+  relevantRecords: 0, // data-index 컨테이너 안의 변경
+  ignoredRecords: 0, // 그 밖의 변경 (무시)
+  scheduledCollections: 0, // 스케줄러가 실행한 수집
+  collections: 0, // 전체 수집 (스케줄러 + 초기 로드 + 팝업 요청)
+  containersCollected: 0, // 수집에서 확인한 data-index 컨테이너 수
+  storageWrites: 0, // chrome.storage 쓰기 횟수
+  storageKeysWritten: 0, // 쓰기에 포함된 키 수
+  storageSkips: 0, // 바뀐 내용이 없어 건너뛴 저장
+  evictedItems: 0, // 상한을 넘어 삭제한 오래된 이미지/프롬프트 수
+  externalChanges: 0, // 다른 탭이 저장/삭제하여 이 탭에 반영한 항목 수
+  lastCollectMs: 0,
+  totalCollectMs: 0
+};
+
 // 페이지 로드 시 기존 데이터 불러오기
-chrome.storage.local.get(['savedImages', 'savedPrompts', 'language'], function(result) {
-  if (result.savedImages) {
-    savedImages = result.savedImages;
+loadSavedData(['language'], function(result) {
+  if (result && result.success === false) {
+    console.error('❌ 기존 데이터 불러오기 실패:', result.error);
+    return;
   }
-  if (result.savedPrompts) {
-    savedPrompts = result.savedPrompts;
+  
+  savedImages = result.savedImages;
+  savedImages.forEach(image => seenImageUrls.add(image.url));
+  savedPrompts = result.savedPrompts;
+  savedPrompts.forEach(prompt => seenPromptTexts.add(prompt.text));
+  
+  // 불러온 항목은 이미 저장소에 있으므로 다시 쓰지 않음 (예전 형식 항목은 첫 저장 때 항목별 키로 옮김)
+  for (const shard of result.shards) {
+    savedShards.set(shard.key, { prefix: shard.prefix, order: shard.order, item: shard.item });
+    if (shard.legacy) {
+      unsavedShardKeys.add(shard.key);
+    }
+  }
+  legacyStorageKeys = result.legacyKeys;
+  
+  dataLoaded = true;
+  pendingStorageChanges.forEach(applyStorageChanges);
+  pendingStorageChanges = [];
+  // 불러오는 동안 쌓인 컨테이너 수집
+  if (pendingContainers.size > 0) {
+    scheduleCollection();
   }
   
   // 언어 설정 로드
@@ -45,15 +124,23 @@ chrome.storage.local.get(['savedImages', 'savedPrompts', 'language'], function(r
   });
 });
 
-// Chrome 저장소 변경 감지 (실시간 언어 변경)
+// Chrome 저장소 변경 감지 (실시간 언어 변경, 다른 탭이 저장/삭제한 항목)
 chrome.storage.onChanged.addListener(function(changes, namespace) {
-  if (namespace === 'local' && changes.language) {
+  if (namespace !== 'local') return;
+  
+  if (changes.language) {
     const newLanguage = changes.language.newValue;
     if (newLanguage && newLanguage !== currentLanguage) {
       console.log('언어 설정 변경 감지:', newLanguage);
       changePanelLanguage(newLanguage);
     }
   }
+  
+  if (dataLoaded) {
+    applyStorageChanges(changes);
+  } else {
+    pendingStorageChanges.push(changes);
+  }
 });
 
 // 팝업으로부터의 메시지 수신
@@ -101,7 +188,7 @@ function startPageCountdown(seconds) {
         const result = saveImagesAndPrompts();
         
         if (result.success) {
-          updateProcessStep(2, 'success', `이미지 ${result.imageCount}개, 프롬프트 ${result.promptCount}개`);
+          updateProcessStep(2, 'success', `이미지 ${result.imageCount}개, 프롬프트 ${result.promptCount}개 (새 항목 ${result.addedImages + result.addedPrompts}개)`);
           updateProcessStep(3, 'running', '자동 저장 중...');
           
           setTimeout(() => {
@@ -324,7 +411,7 @@ function addPanelEventListeners() {
         const result = saveImagesAndPrompts();
         
         if (result.success) {
-          updateProcessStep(2, 'success', `이미지 ${result.imageCount}개, 프롬프트 ${result.promptCount}개`);
+          updateProcessStep(2, 'success', `이미지 ${result.imageCount}개, 프롬프트 ${result.promptCount}개 (새 항목 ${result.addedImages + result.addedPrompts}개)`);
           
           // Step 3: 데이터 저장
           updateProcessStep(3, 'running', '저장 중...');
@@ -406,6 +493,20 @@ function safeChromeStorageSet(data, callback) {
   }
 }
 
+function safeChromeStorageRemove(keys, callback) {
+  if (!isExtensionContextValid()) {
+    if (callback) callback({ success: false, error: 'Extension context invalidated' });
+    return;
+  }
+  
+  try {
+    chrome.storage.local.remove(keys, callback);
+  } catch (error) {
+    console.error('❌ chrome.storage 삭제 실패:', error);
+    if (callback) callback({ success: false, error: error.message });
+  }
+}
+
 function safeChromeStorageGet(keys, callback) {
   if (!isExtensionContextValid()) {
     console.warn('⚠️ 확장 프로그램 컨텍스트가 무효화되어 데이터를 가져올 수 없습니다.');
@@ -421,6 +522,224 @@ function safeChromeStorageGet(keys, callback) {
   }
 }
 
+// 문자열 해시 (FNV-1a 32비트, seed는 시작 값)
+function hashText(text, seed) {
+  let hash = seed;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(16).padStart(8, '0');
+}
+
+// 항목을 구분하는 값 (이미지는 URL, 프롬프트는 텍스트)
+function shardIdentity(prefix, item) {
+  return prefix === 'savedImages' ? item.url : item.text;
+}
+
+// 항목별 키 이름 - 구분 값의 64비트 해시 (시작 값이 다른 해시 두 개)
+function shardKey(prefix, item) {
+  let key = shardKeyCache.get(item);
+  if (key === undefined) {
+    const text = String(shardIdentity(prefix, item));
+    key = `${prefix}:${hashText(text, 0x811c9dc5)}${hashText(text, 0x050c5d1f)}`;
+    shardKeyCache.set(item, key);
+  }
+  return key;
+}
+
+// 이 탭이 새로 저장하는 항목의 순서 (시각 기반, 같은 시각이면 1씩 증가)
+function nextShardOrder() {
+  lastShardOrder = Math.max(lastShardOrder + 1, Date.now() * 1000);
+  return lastShardOrder;
+}
+
+function savedItemsOf(prefix) {
+  return prefix === 'savedImages' ? savedImages : savedPrompts;
+}
+
+function seenSetOf(prefix) {
+  return prefix === 'savedImages' ? seenImageUrls : seenPromptTexts;
+}
+
+// 저장된 이미지/프롬프트 불러오기 - 항목별 키를 저장 순서대로 (예전 배열 / 순번 키 형식도 읽음)
+// 반환: extraKeys 값 + savedImages/savedPrompts 배열 + shards (키/순서, 예전 형식이면 legacy) + legacyKeys
+function loadSavedData(extraKeys, callback) {
+  safeChromeStorageGet(null, function(result) {
+    if (result && result.success === false) {
+      callback(result);
+      return;
+    }
+    
+    const data = { shards: [], legacyKeys: [] };
+    extraKeys.forEach(key => {
+      if (key in result) data[key] = result[key];
+    });
+    
+    for (const prefix of SAVED_DATA_KEYS) {
+      const shards = [];
+      const keys = new Set();
+      for (const key in result) {
+        const value = result[key];
+        if (key.startsWith(`${prefix}:`) && value && value.item) {
+          shards.push({ key: key, prefix: prefix, order: value.order, item: value.item, legacy: false });
+          keys.add(key);
+        }
+      }
+      
+      // 예전 형식 - 배열 하나 또는 순번 키 (새 형식 항목보다 먼저 저장된 것으로 봄)
+      const legacyItems = [];
+      if (Array.isArray(result[prefix])) {
+        legacyItems.push(...result[prefix]);
+        data.legacyKeys.push(prefix);
+      }
+      if (`${prefix}Count` in result) {
+        data.legacyKeys.push(`${prefix}Count`);
+      }
+      const legacyShardKey = new RegExp(`^${prefix}_(\\d+)$`);
+      const numbered = [];
+      for (const key in result) {
+        const match = key.match(legacyShardKey);
+        if (match) {
+          numbered.push({ index: Number(match[1]), item: result[key] });
+          data.legacyKeys.push(key);
+        }
+      }
+      numbered.sort((a, b) => a.index - b.index);
+      legacyItems.push(...numbered.map(entry => entry.item));
+      
+      legacyItems.forEach((item, index) => {
+        if (!item) return;
+        const key = shardKey(prefix, item);
+        if (!keys.has(key)) {
+          keys.add(key);
+          shards.push({ key: key, prefix: prefix, order: index, item: item, legacy: true });
+        }
+      });
+      
+      shards.sort((a, b) => a.order - b.order);
+      data[prefix] = shards.map(shard => shard.item);
+      data.shards.push(...shards);
+    }
+    callback(data);
+  });
+}
+
+// 새로 수집한 항목 추가 (다음 저장 때 그 항목 키만 씀)
+function addSavedShard(prefix, item) {
+  const key = shardKey(prefix, item);
+  if (savedShards.has(key)) {
+    return;
+  }
+  savedShards.set(key, { prefix: prefix, order: nextShardOrder(), item: item });
+  unsavedShardKeys.add(key);
+  savedItemsOf(prefix).push(item);
+}
+
+// 다른 탭이 저장/삭제한 항목 반영 - 이 탭이 쓰거나 지운 키는 이미 반영되어 있으므로 건너뜀
+function applyStorageChanges(changes) {
+  let applied = 0;
+  for (const key in changes) {
+    const colon = key.indexOf(':');
+    const prefix = key.slice(0, colon);
+    if (colon < 0 || !SAVED_DATA_KEYS.includes(prefix)) continue;
+    
+    const value = changes[key].newValue;
+    const items = savedItemsOf(prefix);
+    if (value && value.item && !savedShards.has(key)) {
+      // 저장 순서에 맞는 자리에 끼워 넣음 (보통은 맨 뒤)
+      let index = items.length;
+      while (index > 0 && savedShards.get(shardKey(prefix, items[index - 1])).order > value.order) {
+        index--;
+      }
+      shardKeyCache.set(value.item, key);
+      savedShards.set(key, { prefix: prefix, order: value.order, item: value.item });
+      items.splice(index, 0, value.item);
+      seenSetOf(prefix).add(shardIdentity(prefix, value.item));
+      applied++;
+    } else if (!value && savedShards.has(key)) {
+      const index = items.indexOf(savedShards.get(key).item);
+      if (index >= 0) items.splice(index, 1);
+      savedShards.delete(key);
+      unsavedShardKeys.delete(key);
+      applied++;
+    }
+  }
+  
+  if (applied > 0) {
+    collectStats.externalChanges += applied;
+    updatePageStats();
+  }
+}
+
+// 상한을 넘으면 오래된 항목부터 SAVED_EVICT_BATCH만큼 더 지움 (저장된 항목은 다음 저장 때 그 키만 삭제)
+function evictOldest(prefix, limit) {
+  const items = savedItemsOf(prefix);
+  if (items.length <= limit) {
+    return 0;
+  }
+  const removed = items.splice(0, Math.min(items.length, items.length - limit + SAVED_EVICT_BATCH));
+  for (const item of removed) {
+    const key = shardKey(prefix, item);
+    savedShards.delete(key);
+    if (!unsavedShardKeys.delete(key)) {
+      evictedShardKeys.add(key);
+    }
+  }
+  return removed.length;
+}
+
+// 새 항목 키만 chrome.storage에 쓰고 삭제한 항목 키만 지움 - 바뀐 내용이 없으면 storage.onChanged도 발생하지 않음
+function persistSavedData(callback) {
+  const changes = {};
+  for (const key of unsavedShardKeys) {
+    const shard = savedShards.get(key);
+    changes[key] = { order: shard.order, item: shard.item };
+  }
+  const keys = Object.keys(changes);
+  
+  if (keys.length === 0 && evictedShardKeys.size === 0 && legacyStorageKeys.length === 0) {
+    collectStats.storageSkips++;
+    callback({ success: true, written: 0 });
+    return;
+  }
+  
+  // 쓰는 동안 상한으로 삭제되면 저장소에서도 지우도록 미리 저장된 것으로 표시 (실패하면 되돌림)
+  keys.forEach(key => unsavedShardKeys.delete(key));
+  
+  const removeStaleKeys = function() {
+    const staleKeys = Array.from(evictedShardKeys).concat(legacyStorageKeys);
+    evictedShardKeys.clear();
+    // 예전 형식 키는 항목별 키로 옮겼으므로 삭제
+    legacyStorageKeys = [];
+    if (staleKeys.length > 0) {
+      safeChromeStorageRemove(staleKeys);
+    }
+    callback({ success: true, written: keys.length, removed: staleKeys.length });
+  };
+  
+  if (keys.length === 0) {
+    removeStaleKeys();
+    return;
+  }
+  
+  changes.lastSaveTime = new Date().toLocaleString();
+  collectStats.storageWrites++;
+  collectStats.storageKeysWritten += keys.length;
+  
+  safeChromeStorageSet(changes, function(result) {
+    if (result && result.success === false) {
+      // 다음 수집 때 다시 쓰도록 되돌림
+      keys.forEach(key => {
+        if (savedShards.has(key)) unsavedShardKeys.add(key);
+      });
+      callback(result);
+      return;
+    }
+    removeStaleKeys();
+  });
+}
+
 // 패널 상태 저장
 function savePanelState() {
   const autoSaveEnabled = document.getElementById('page-auto-save-toggle').checked;
@@ -605,74 +924,69 @@ function updateCountdownText() {
 
 // 페이지 통계 업데이트
 function updatePageStats() {
-  safeChromeStorageGet(['savedImages', 'savedPrompts'], function(result) {
-    if (result && result.success === false) {
-      console.error('❌ 페이지 통계 업데이트 실패:', result.error);
-      return;
-    }
-    
-    const stats = document.getElementById('page-stats');
-    if (!stats) return;
-    
-    const imageCount = result.savedImages ? result.savedImages.length : 0;
-    const promptCount = result.savedPrompts ? result.savedPrompts.length : 0;
-    
-    const statsText = currentLanguage === 'ko' 
-      ? `📊 저장 통계<br>이미지: ${imageCount}개 | 프롬프트: ${promptCount}개`
-      : `📊 Save Stats<br>Images: ${imageCount} | Prompts: ${promptCount}`;
-    
-    stats.innerHTML = statsText;
-  });
+  const stats = document.getElementById('page-stats');
+  if (!stats) return;
+  
+  // 저장소를 다시 읽지 않고 이 탭의 목록 개수 사용 (다른 탭이 저장/삭제한 항목은 storage.onChanged로 반영됨)
+  const imageCount = savedImages.length;
+  const promptCount = savedPrompts.length;
+  
+  const statsText = currentLanguage === 'ko' 
+    ? `📊 저장 통계<br>이미지: ${imageCount}개 | 프롬프트: ${promptCount}개`
+    : `📊 Save Stats<br>Images: ${imageCount} | Prompts: ${promptCount}`;
+  
+  stats.innerHTML = statsText;
 }
 
 // 다운로드 실행
 function performDownload() {
-  console.log('💾 data-index="1" 다운로드 시작');
+  console.log('💾 data-index 다운로드 시작');
   
-  // 먼저 현재 페이지에서 직접 data-index="1" 데이터 수집 시도
-  const currentImages = collectImages();
-  const currentPrompts = collectPrompts();
+  // 먼저 현재 페이지의 data-index 컨테이너에서 새 항목을 수집해 누적 데이터에 합침
+  const current = saveData(collectImages(), collectPrompts());
   
-  console.log('📊 data-index="1" 현재 수집된 데이터:', {
-    images: currentImages.length,
-    prompts: currentPrompts.length,
-    source: 'data-index-1-only'
+  console.log('📊 data-index 현재 수집된 데이터:', {
+    images: current.imageCount,
+    prompts: current.promptCount,
+    newImages: current.addedImages,
+    newPrompts: current.addedPrompts,
+    source: 'data-index-all'
   });
   
-  // 저장된 데이터와 현재 데이터를 합침
-  safeChromeStorageGet(['savedImages', 'savedPrompts'], function(result) {
-    let savedImages = [];
-    let savedPrompts = [];
+  // 저장된 데이터(다른 탭에서 수집한 항목 포함)와 누적 데이터를 합침
+  loadSavedData([], function(result) {
+    let storedImages = [];
+    let storedPrompts = [];
     
     if (result && result.success !== false) {
-      savedImages = result.savedImages || [];
-      savedPrompts = result.savedPrompts || [];
-      console.log('📊 data-index="1" 저장된 데이터:', {
-        images: savedImages.length,
-        prompts: savedPrompts.length,
-        source: 'data-index-1-only'
+      storedImages = result.savedImages || [];
+      storedPrompts = result.savedPrompts || [];
+      console.log('📊 data-index 저장된 데이터:', {
+        images: storedImages.length,
+        prompts: storedPrompts.length,
+        source: 'data-index-all'
       });
     }
     
-    // 현재 데이터가 있으면 우선 사용, 없으면 저장된 데이터 사용
-    const finalImages = currentImages.length > 0 ? currentImages : savedImages;
-    const finalPrompts = currentPrompts.length > 0 ? currentPrompts : savedPrompts;
+    // 누적 데이터가 있으면 우선 사용, 없으면 저장된 데이터 사용
+    const finalImages = savedImages.length > 0 ? savedImages : storedImages;
+    const finalPrompts = savedPrompts.length > 0 ? savedPrompts : storedPrompts;
     
     const data = {
       metadata: {
         created_at: new Date().toISOString(),
         version: '1.0.0',
-        source: 'Sora ChatGPT Auto Save Extension (Page Control) - data-index-1-only',
+        source: 'Sora ChatGPT Auto Save Extension (Page Control) - data-index-all',
         total_images: finalImages.length,
         total_prompts: finalPrompts.length,
-        download_method: currentImages.length > 0 ? 'current_page_data_index_1' : 'stored_data_index_1',
-        data_index_filter: '1'
+        download_method: savedImages.length > 0 ? 'current_page_data_index' : 'stored_data_index',
+        data_index_filter: 'all'
       },
       images: finalImages,
       prompts: finalPrompts
     };
     
-    console.log('📊 data-index="1" 다운로드 데이터:', {
+    console.log('📊 data-index 다운로드 데이터:', {
       total_images: data.images.length,
       total_prompts: data.prompts.length,
       method: data.metadata.download_method,
@@ -680,7 +994,7 @@ function performDownload() {
     });
     
     if (data.images.length === 0 && data.prompts.length === 0) {
-      console.error('❌ data-index="1"에서 다운로드할 데이터가 없습니다.');
+      console.error('❌ data-index 컨테이너에서 다운로드할 데이터가 없습니다.');
       return;
     }
     
@@ -689,74 +1003,85 @@ function performDownload() {
       downloadWithFileManagement(data);
       
     } catch (error) {
-      console.error('❌ data-index="1" 다운로드 중 오류:', error);
+      console.error('❌ data-index 다운로드 중 오류:', error);
     }
   });
 }
 
-// 이미지 수집 함수
-function collectImages() {
-  console.log(getLocalizedMessage('consoleLogs.imageCollectionStarted'));
-  
-  // data-index="1"인 컨테이너만 찾기
-  const container = document.querySelector('[data-index="1"]');
-  
-  if (!container) {
-    console.log('❌ data-index="1" 컨테이너를 찾을 수 없습니다.');
-    return [];
-  }
-  
-  console.log('✅ data-index="1" 컨테이너 발견');
+// 페이지의 모든 data-index 컨테이너 (전체 수집용 - 초기 로드, 다운로드, 팝업 요청)
+function getAllDataIndexContainers() {
+  return Array.from(document.querySelectorAll('[data-index]'));
+}
+
+// 컨테이너 하나에서 완성된 미디어 추출 (이미 수집한 URL이면 null)
+function extractImageFromContainer(container) {
+  const dataIndex = container.getAttribute('data-index');
   
-  // data-index="1" 컨테이너에서 비디오, 이미지와 프롬프트 찾기
+  // 컨테이너에서 비디오, 이미지와 프롬프트 찾기
   const videoElement = container.querySelector('video[src*="videos.openai.com"]');
   const imgElement = container.querySelector('img[src*="videos.openai.com"]');
-  const promptElement = container.querySelector('.text-token-text-primary');
   
   // 비디오 또는 이미지 중 하나라도 있으면 처리
   const mediaElement = videoElement || imgElement;
+  const mediaSrc = mediaElement ? mediaElement.src : '';
   
-  if (mediaElement && promptElement) {
-    // 미디어 소스 URL 가져오기
-    const mediaSrc = mediaElement.src;
-    const promptText = promptElement.textContent?.trim() || '';
-    
-    // 원본 프롬프트를 위해 컨테이너 전체에서 텍스트 수집
-    const originalPromptText = container.textContent?.trim() || '';
-    
-    if (mediaSrc && promptText && mediaSrc.includes('videos.openai.com')) {
-      // 제목 정보만 찾기 (시간 정보는 제외)
-      const titleElement = container.querySelector('a[href*="/g/"]');
-      const titleText = titleElement?.textContent?.trim() || '';
-      
-      // originalPrompt에서 "Prompt"로 split해서 두 번째 부분(인덱스 1) 사용
-      const cleanPrompt = originalPromptText.split('Prompt')[1] || promptText;
-      
-      // 미디어 타입 결정
-      const mediaType = videoElement ? 'video' : 'image';
-      
-      const imageData = {
-        id: `${mediaType}_${Date.now()}_1`,
-        url: mediaSrc,
-        alt: mediaElement.alt || `Generated ${mediaType}`,
-        width: mediaElement.naturalWidth || mediaElement.videoWidth || 1024,
-        height: mediaElement.naturalHeight || mediaElement.videoHeight || 1536,
-        pageUrl: window.location.href,
-        prompt: cleanPrompt,
-        originalPrompt: originalPromptText,
-        title: titleText,
-        mediaType: mediaType
-      };
-      
-      console.log(`✅ data-index="1" ${mediaType} 발견:`, mediaSrc.substring(0, 50) + '...');
-      console.log('✅ data-index="1" 프롬프트:', cleanPrompt.substring(0, 50) + '...');
-      
-      return [imageData];
+  // 이미 수집한 URL이면 텍스트를 읽기 전에 건너뜀
+  if (!mediaSrc || !mediaSrc.includes('videos.openai.com') || seenImageUrls.has(mediaSrc)) {
+    return null;
+  }
+  
+  const promptElement = container.querySelector('.text-token-text-primary');
+  const promptText = promptElement?.textContent?.trim() || '';
+  if (!promptText) {
+    return null;
+  }
+  
+  // 원본 프롬프트를 위해 컨테이너 전체에서 텍스트 수집
+  const originalPromptText = container.textContent?.trim() || '';
+  
+  // 제목 정보만 찾기 (시간 정보는 제외)
+  const titleElement = container.querySelector('a[href*="/g/"]');
+  const titleText = titleElement?.textContent?.trim() || '';
+  
+  // originalPrompt에서 "Prompt"로 split해서 두 번째 부분(인덱스 1) 사용
+  const cleanPrompt = originalPromptText.split('Prompt')[1] || promptText;
+  
+  // 미디어 타입 결정
+  const mediaType = videoElement ? 'video' : 'image';
+  
+  console.log(`✅ data-index="${dataIndex}" ${mediaType} 발견:`, mediaSrc.substring(0, 50) + '...');
+  
+  return {
+    id: `${mediaType}_${Date.now()}_${dataIndex}`,
+    url: mediaSrc,
+    alt: mediaElement.alt || `Generated ${mediaType}`,
+    width: mediaElement.naturalWidth || mediaElement.videoWidth || 1024,
+    height: mediaElement.naturalHeight || mediaElement.videoHeight || 1536,
+    pageUrl: window.location.href,
+    prompt: cleanPrompt,
+    originalPrompt: originalPromptText,
+    title: titleText,
+    mediaType: mediaType
+  };
+}
+
+// 이미지 수집 함수 - containers를 주지 않으면 페이지 전체 컨테이너를 수집
+function collectImages(containers = getAllDataIndexContainers()) {
+  console.log(getLocalizedMessage('consoleLogs.imageCollectionStarted'));
+  
+  const images = [];
+  const urls = new Set();
+  for (const container of containers) {
+    if (!container.isConnected) continue;
+    const imageData = extractImageFromContainer(container);
+    if (imageData && !urls.has(imageData.url)) {
+      urls.add(imageData.url);
+      images.push(imageData);
     }
   }
   
-  console.log('❌ data-index="1"에서 완성된 이미지를 찾을 수 없습니다.');
-  return [];
+  console.log(`✅ data-index 컨테이너 ${containers.length}개에서 새 이미지 ${images.length}개 발견`);
+  return images;
 }
 
 // 현재 페이지의 프롬프트 가져오기 함수
@@ -786,21 +1111,42 @@ function getCurrentPagePrompt() {
   return '';
 }
 
-// 프롬프트 수집 함수
-function collectPrompts() {
-  console.log(getLocalizedMessage('consoleLogs.promptCollectionStarted'));
-  
-  // data-index="1"인 컨테이너만 찾기
-  const container = document.querySelector('[data-index="1"]');
+// 프롬프트 텍스트 확인 (길이와 문자 포함 여부)
+function isPromptText(text) {
+  return !!text && text.length > 10 && text.length < 1000 && /[a-zA-Z가-힣]/.test(text);
+}
+
+// 컨테이너 하나에서 프롬프트 추출 (첫 번째 프롬프트만, 이미 수집한 텍스트면 null)
+function extractPromptFromContainer(container) {
+  const dataIndex = container.getAttribute('data-index');
+  const makePrompt = (text, selector) => {
+    if (seenPromptTexts.has(text)) {
+      return null;
+    }
+    console.log(`✅ data-index="${dataIndex}" 프롬프트 발견:`, text.substring(0, 50) + '...');
+    return {
+      id: `prompt_${Date.now()}_${dataIndex}`,
+      text: text,
+      timestamp: new Date().toISOString(),
+      pageUrl: window.location.href,
+      selector: selector,
+      source: `data-index-${dataIndex}`
+    };
+  };
   
-  if (!container) {
-    console.log('❌ data-index="1" 컨테이너를 찾을 수 없습니다.');
-    return [];
+  // 먼저 "Image prompt" 라벨 다음에 있는 텍스트를 찾기 (라벨 옆의 truncate 요소만 확인)
+  const labeled = container.querySelectorAll('div.truncate.text-token-text-primary');
+  for (const element of labeled) {
+    const label = element.previousElementSibling;
+    if (label && label.tagName === 'DIV' && label.textContent?.includes('Image prompt')) {
+      const text = element.textContent?.trim();
+      if (isPromptText(text)) {
+        return makePrompt(text, 'div.truncate.text-token-text-primary');
+      }
+    }
   }
   
-  console.log('✅ data-index="1" 컨테이너에서 프롬프트 수집 시작');
-  
-  // data-index="1" 컨테이너 내에서 프롬프트 찾기
+  // 일반적인 선택자로 찾기
   const promptSelectors = [
     'div.truncate.text-token-text-primary',
     '.text-token-text-primary',
@@ -816,88 +1162,94 @@ function collectPrompts() {
     'div[class*="text-token-text"]'
   ];
   
-  // 먼저 "Image prompt" 라벨 다음에 있는 텍스트를 찾기
-  const allDivs = container.querySelectorAll('div');
-  for (let i = 0; i < allDivs.length; i++) {
-    const div = allDivs[i];
-    if (div.textContent?.includes('Image prompt')) {
-      const nextElement = div.nextElementSibling;
-      if (nextElement && nextElement.classList.contains('truncate') && nextElement.classList.contains('text-token-text-primary')) {
-        const text = nextElement.textContent?.trim();
-        if (text && text.length > 10 && text.length < 1000 && /[a-zA-Z가-힣]/.test(text)) {
-          const promptData = {
-            id: `prompt_${Date.now()}_1`,
-            text: text,
-            timestamp: new Date().toISOString(),
-            pageUrl: window.location.href,
-            selector: 'div.truncate.text-token-text-primary',
-            source: 'data-index-1'
-          };
-          console.log('✅ data-index="1" 프롬프트 발견 (Image prompt 라벨 다음):', text.substring(0, 50) + '...');
-          return [promptData];
-        }
-      }
-    }
-  }
-  
-  // 일반적인 선택자로 찾기
   for (const selector of promptSelectors) {
     const elements = container.querySelectorAll(selector);
     for (let index = 0; index < elements.length; index++) {
-      const element = elements[index];
-      const text = element.textContent?.trim();
-      if (text && text.length > 10 && text.length < 1000 && /[a-zA-Z가-힣]/.test(text)) {
-        const promptData = {
-          id: `prompt_${Date.now()}_1`,
-          text: text,
-          timestamp: new Date().toISOString(),
-          pageUrl: window.location.href,
-          selector: selector,
-          source: 'data-index-1'
-        };
-        console.log('✅ data-index="1" 프롬프트 발견:', text.substring(0, 50) + '...');
-        return [promptData]; // data-index="1"의 첫 번째 프롬프트만 반환
+      const text = elements[index].textContent?.trim();
+      if (isPromptText(text)) {
+        return makePrompt(text, selector);
       }
     }
   }
   
-  console.log('❌ data-index="1"에서 프롬프트를 찾을 수 없습니다.');
-  return [];
+  return null;
 }
 
-// 데이터 저장 함수
+// 프롬프트 수집 함수 - containers를 주지 않으면 페이지 전체 컨테이너를 수집
+function collectPrompts(containers = getAllDataIndexContainers()) {
+  console.log(getLocalizedMessage('consoleLogs.promptCollectionStarted'));
+  
+  const prompts = [];
+  const texts = new Set();
+  for (const container of containers) {
+    if (!container.isConnected) continue;
+    const promptData = extractPromptFromContainer(container);
+    if (promptData && !texts.has(promptData.text)) {
+      texts.add(promptData.text);
+      prompts.push(promptData);
+    }
+  }
+  
+  console.log(`✅ data-index 컨테이너 ${containers.length}개에서 새 프롬프트 ${prompts.length}개 발견`);
+  return prompts;
+}
+
+// 데이터 저장 함수 - 새 항목만 누적 (URL / 프롬프트 텍스트 기준으로 중복 제외)
 function saveData(newImages, newPrompts) {
-  console.log('📝 data-index="1" 데이터 저장 시작');
+  console.log('📝 data-index 데이터 저장 시작');
+  
+  // 기존 데이터를 불러오기 전에는 저장하지 않음
+  if (!dataLoaded) {
+    return {
+      imageCount: savedImages.length,
+      promptCount: savedPrompts.length,
+      addedImages: 0,
+      addedPrompts: 0,
+      totalImages: savedImages.length,
+      totalPrompts: savedPrompts.length,
+      source: 'data-index-all'
+    };
+  }
   
-  // 배열을 1개만 유지 (새 데이터로 교체)
-  if (newImages.length > 0) {
-    savedImages = newImages; // 기존 배열을 새 배열로 교체
-    console.log('✅ data-index="1" 이미지 데이터 저장:', newImages.length + '개');
+  const addedImages = newImages.filter(image => !seenImageUrls.has(image.url));
+  for (const image of addedImages) {
+    seenImageUrls.add(image.url);
+    addSavedShard('savedImages', image);
+  }
+  if (addedImages.length > 0) {
+    console.log('✅ data-index 이미지 데이터 추가:', addedImages.length + '개');
   }
   
-  if (newPrompts.length > 0) {
-    savedPrompts = newPrompts; // 기존 배열을 새 배열로 교체
-    console.log('✅ data-index="1" 프롬프트 데이터 저장:', newPrompts.length + '개');
+  const addedPrompts = newPrompts.filter(prompt => !seenPromptTexts.has(prompt.text));
+  for (const prompt of addedPrompts) {
+    seenPromptTexts.add(prompt.text);
+    addSavedShard('savedPrompts', prompt);
+  }
+  if (addedPrompts.length > 0) {
+    console.log('✅ data-index 프롬프트 데이터 추가:', addedPrompts.length + '개');
   }
   
-  // chrome.storage에 저장
-  const saveData = {
-    savedImages: savedImages,
-    savedPrompts: savedPrompts,
-    lastSaveTime: new Date().toLocaleString(),
-    source: 'data-index-1-only'
-  };
+  // 상한을 넘으면 오래된 항목부터 삭제 (seen 집합에는 남겨 같은 페이지에서 다시 수집하지 않음)
+  const evicted = evictOldest('savedImages', MAX_SAVED_IMAGES) + evictOldest('savedPrompts', MAX_SAVED_PROMPTS);
+  if (evicted > 0) {
+    collectStats.evictedItems += evicted;
+    console.log('🧹 저장 상한 초과로 오래된 항목 삭제:', evicted + '개');
+  }
   
-  safeChromeStorageSet(saveData, function(result) {
+  // chrome.storage에 저장 (새 항목 키만 쓰고 삭제한 항목 키만 지움)
+  persistSavedData(function(result) {
     if (result && result.success === false) {
-      console.error('❌ data-index="1" 데이터 저장 실패:', result.error);
+      console.error('❌ data-index 데이터 저장 실패:', result.error);
+    } else if (result.written === 0) {
+      console.log('⏭️ data-index 데이터 변경 없음, 저장 건너뜀');
     } else {
-      console.log('✅ data-index="1" 데이터 저장 완료:', {
+      console.log('✅ data-index 데이터 저장 완료:', {
         totalImages: savedImages.length,
         totalPrompts: savedPrompts.length,
-        newImages: newImages.length,
-        newPrompts: newPrompts.length,
-        source: 'data-index-1-only'
+        newImages: addedImages.length,
+        newPrompts: addedPrompts.length,
+        writtenKeys: result.written,
+        source: 'data-index-all'
       });
       
       // 페이지 통계 업데이트
@@ -905,47 +1257,70 @@ function saveData(newImages, newPrompts) {
     }
   });
   
+  // imageCount/promptCount는 지금까지 수집한 전체 개수 (이번에 새로 추가된 개수는 addedImages/addedPrompts)
   return {
-    imageCount: newImages.length,
-    promptCount: newPrompts.length,
+    imageCount: savedImages.length,
+    promptCount: savedPrompts.length,
+    addedImages: addedImages.length,
+    addedPrompts: addedPrompts.length,
     totalImages: savedImages.length,
     totalPrompts: savedPrompts.length,
-    source: 'data-index-1-only'
+    source: 'data-index-all'
   };
 }
 
-// 메인 저장 함수
-function saveImagesAndPrompts() {
-  console.log('=== Sora ChatGPT data-index="1" 데이터 저장 시작 ===');
+// 메인 저장 함수 - containers를 주면 그 컨테이너만 수집 (DOM 변경 기록에서 모은 컨테이너)
+function saveImagesAndPrompts(containers = getAllDataIndexContainers()) {
+  console.log('=== Sora ChatGPT data-index 데이터 저장 시작 ===');
+  
+  // 기존 데이터를 불러오는 중이면 컨테이너만 모아 두고 불러온 뒤 수집
+  if (!dataLoaded) {
+    containers.forEach(container => pendingContainers.add(container));
+    console.log('⏳ 기존 데이터를 불러오는 중 - 불러온 뒤 수집합니다.');
+    return {
+      success: false,
+      error: '기존 데이터를 불러오는 중입니다. 잠시 후 다시 시도해주세요.',
+      source: 'data-index-all'
+    };
+  }
+  
+  const collectStart = performance.now();
   
   try {
-    // data-index="1" 이미지 수집
-    const newImages = collectImages();
+    // data-index 이미지 수집
+    const newImages = collectImages(containers);
     
-    // data-index="1" 프롬프트 수집
-    const newPrompts = collectPrompts();
+    // data-index 프롬프트 수집
+    const newPrompts = collectPrompts(containers);
     
-    // data-index="1" 데이터 저장
+    // data-index 데이터 저장
     const result = saveData(newImages, newPrompts);
     
-    console.log('✅ data-index="1" 저장 결과:', result);
+    console.log('✅ data-index 저장 결과:', result);
     
     return {
       success: true,
       imageCount: result.imageCount,
       promptCount: result.promptCount,
+      addedImages: result.addedImages,
+      addedPrompts: result.addedPrompts,
       totalImages: result.totalImages,
       totalPrompts: result.totalPrompts,
-      source: 'data-index-1-only'
+      source: 'data-index-all'
     };
     
   } catch (error) {
-    console.error('❌ data-index="1" 저장 중 오류 발생:', error);
+    console.error('❌ data-index 저장 중 오류 발생:', error);
     return {
       success: false,
       error: error.message,
-      source: 'data-index-1-only'
+      source: 'data-index-all'
     };
+  } finally {
+    collectStats.collections++;
+    collectStats.containersCollected += containers.length;
+    collectStats.lastCollectMs = performance.now() - collectStart;
+    collectStats.totalCollectMs += collectStats.lastCollectMs;
   }
 }
 
@@ -956,6 +1331,8 @@ chrome.runtime.onMessage.addListener(function(request, sender, sendResponse) {
   if (request.action === 'saveImagesAndPrompts') {
     const result = saveImagesAndPrompts();
     sendResponse(result);
+  } else if (request.action === 'getCollectStats') {
+    sendResponse(Object.assign({ uptimeMs: Date.now() - collectStats.startedAt }, collectStats));
   }
 });
 
@@ -971,27 +1348,102 @@ window.addEventListener('load', function() {
   }, 3000); // 3초 대기
 });
 
-// DOM 변경 감지 (MutationObserver)
+// 변경 기록이 가리키는 data-index 컨테이너를 pendingContainers에 추가 (추가했으면 true)
+function addMutationContainers(mutation) {
+  const before = pendingContainers.size;
+  const target = mutation.target.nodeType === Node.ELEMENT_NODE ? mutation.target : mutation.target.parentElement;
+  const owner = target && target.closest('[data-index]');
+  if (owner) {
+    pendingContainers.add(owner);
+  }
+  for (const node of mutation.addedNodes) {
+    if (node.nodeType !== Node.ELEMENT_NODE) continue;
+    if (node.matches('[data-index]')) {
+      pendingContainers.add(node);
+    }
+    node.querySelectorAll('[data-index]').forEach(container => pendingContainers.add(container));
+  }
+  return Boolean(owner) || pendingContainers.size > before;
+}
+
+// 수집 예약 - 변경이 이어지면 타이머를 미루되 첫 변경 후 COLLECT_MAX_WAIT_MS는 넘기지 않음
+function scheduleCollection() {
+  if (collectMaxWaitTimer === null) {
+    collectMaxWaitTimer = setTimeout(runScheduledCollection, COLLECT_MAX_WAIT_MS);
+  }
+  clearTimeout(collectDebounceTimer);
+  collectDebounceTimer = setTimeout(runScheduledCollection, COLLECT_DEBOUNCE_MS);
+}
+
+// 예약된 수집 실행 - 브라우저가 한가할 때 (이미 대기 중이면 그 수집에 합침)
+function runScheduledCollection() {
+  clearTimeout(collectDebounceTimer);
+  clearTimeout(collectMaxWaitTimer);
+  collectDebounceTimer = null;
+  collectMaxWaitTimer = null;
+  if (collectIdleHandle !== null) {
+    return;
+  }
+  
+  const collect = () => {
+    collectIdleHandle = null;
+    // 기존 데이터를 불러오는 중이면 모아 둔 컨테이너를 그대로 두고 불러온 뒤 다시 예약
+    if (!dataLoaded) {
+      return;
+    }
+    console.log('DOM 변경 감지, 데이터 재수집');
+    collectStats.scheduledCollections++;
+    // 변경된 컨테이너만 수집 (그 사이 페이지에서 빠진 컨테이너는 제외)
+    const containers = Array.from(pendingContainers).filter(container => container.isConnected);
+    pendingContainers.clear();
+    saveImagesAndPrompts(containers);
+    console.log('📊 수집 통계:', {
+      mutationRecords: collectStats.mutationRecords,
+      ignoredRecords: collectStats.ignoredRecords,
+      collections: collectStats.collections,
+      containers: containers.length,
+      lastCollectMs: Math.round(collectStats.lastCollectMs)
+    });
+  };
+  
+  if (typeof window.requestIdleCallback === 'function') {
+    collectIdleHandle = window.requestIdleCallback(collect, { timeout: COLLECT_IDLE_TIMEOUT_MS });
+  } else {
+    collectIdleHandle = setTimeout(collect, 0);
+  }
+}
+
+// DOM 변경 감지 (MutationObserver) - 변경된 컨테이너만 모아 두고 스케줄러에 예약
 const observer = new MutationObserver(function(mutations) {
-  mutations.forEach(function(mutation) {
-    if (mutation.type === 'childList' && mutation.addedNodes.length > 0) {
-      // 새로운 노드가 추가되면 잠시 후 데이터 수집
-      setTimeout(() => {
-        console.log('DOM 변경 감지, 데이터 재수집');
-        saveImagesAndPrompts();
-      }, 1000);
+  let relevant = false;
+  for (const mutation of mutations) {
+    collectStats.mutationRecords++;
+    if (mutation.type === 'childList' && mutation.addedNodes.length > 0 && addMutationContainers(mutation)) {
+      collectStats.relevantRecords++;
+      relevant = true;
+    } else {
+      collectStats.ignoredRecords++;
     }
-  });
+  }
+  if (relevant) {
+    scheduleCollection();
+  }
 });
 
-// 페이지 로드 후 MutationObserver 시작
-document.addEventListener('DOMContentLoaded', function() {
+// MutationObserver 시작 (document_end에서는 DOMContentLoaded가 이미 지났을 수 있음)
+function startObserver() {
   observer.observe(document.body, {
     childList: true,
     subtree: true
   });
   console.log('DOM 변경 감지 시작');
-});
+}
+
+if (document.readyState === 'loading') {
+  document.addEventListener('DOMContentLoaded', startObserver);
+} else {
+  startObserver();
+}
 
 // 진행 단계 업데이트 함수
 function updateProcessStep(stepNumber, status, message = '') {
@@ -6,51 +6,1803 @@ Sora Auto Save 파일 정리 프로그램
 """
 
 import os
+import re
 import json
+import math
 import shutil
 import glob
+import fnmatch
+import hashlib
 import logging
+import logging.handlers
+import queue
+import atexit
+import sys
+import tempfile
+import sqlite3
+from array import array
 from datetime import datetime
 from pathlib import Path
 import argparse
-from typing import List, Dict, Optional
+import time
+import threading
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Callable, Tuple, Iterable
+
+try:
+    from PIL import Image  # 선택: 있으면 JPEG/WebP 등 썸네일을 작업 스레드에서 생성
+except ImportError:
+    Image = None
+
+LOGGER_NAME = "file_organizer"
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 로그 레코드는 큐에 넣기만 하고, 파일/콘솔 쓰기는 리스너 스레드가 담당
+_log_queue = queue.SimpleQueue()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_file: Optional[Path] = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def start_log_listener(log_dir: str = "logs", max_bytes: int = 5 * 1024 * 1024,
+                       backup_count: int = 5, json_lines: bool = False, console: bool = True) -> Path:
+    """로그 리스너 시작 (프로세스당 한 번) - 실제 로그 파일 경로 반환"""
+    global _log_listener, _log_file
+
+    if _log_listener is not None:
+        return _log_file
+
+    log_path = Path(log_dir)
+    log_path.mkdir(parents=True, exist_ok=True)
+    _log_file = log_path / ("file_organizer.jsonl" if json_lines else "file_organizer.log")
+
+    # 크기 기준 순환 (file_organizer.log, .log.1 ... .log.N)
+    file_handler = logging.handlers.RotatingFileHandler(
+        _log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+    )
+    file_handler.setFormatter(JsonLinesFormatter() if json_lines else logging.Formatter(LOG_FORMAT))
+
+    handlers = [file_handler]
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(console_handler)
+
+    _log_listener = logging.handlers.QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(stop_log_listener)
+
+    return _log_file
+
+
+def stop_log_listener():
+    """남은 로그를 모두 기록하고 리스너 종료"""
+    global _log_listener
+
+    if _log_listener is None:
+        return
+
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+
+class FilenameTemplate:
+    """한 번 컴파일해 두고 파일마다 빠르게 채우는 파일명 패턴
+
+    토큰: {name} {ext} {fullname} {date} {time} {datetime} {year} {month} {day} {hour} {minute} {second}
+          {seq} (폴더별 일련번호) {mtime} (파일 수정시간) {size} (바이트) {hash8} (내용 해시 8자리)
+          {title} (JSON의 프롬프트 제목 슬러그)
+    모르는 토큰은 그대로 둔다.
+    """
+
+    TOKEN_RE = re.compile(r"\{(\w+)\}")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        # 리터럴과 토큰을 번갈아 저장: [문자열, 토큰, 문자열, 토큰, ..., 문자열]
+        self.parts = self.TOKEN_RE.split(pattern)
+        self.tokens = {self.parts[i] for i in range(1, len(self.parts), 2)}
+        self.uses_seq = "seq" in self.tokens
+
+    def values(self, file_path: Path, now: Optional[datetime] = None,
+               stat: Optional[os.stat_result] = None) -> Dict[str, str]:
+        """패턴에 쓰인 토큰 값 계산 ({seq} 제외)"""
+        tokens = self.tokens
+        values = {"name": file_path.stem, "ext": file_path.suffix, "fullname": file_path.name}
+        if tokens & {"date", "time", "datetime", "year", "month", "day", "hour", "minute", "second"}:
+            if now is None:
+                now = datetime.now()
+            values.update({
+                "date": now.strftime("%Y%m%d"),
+                "time": now.strftime("%H%M%S"),
+                "datetime": now.strftime("%Y%m%d_%H%M%S"),
+                "year": str(now.year),
+                "month": f"{now.month:02d}",
+                "day": f"{now.day:02d}",
+                "hour": f"{now.hour:02d}",
+                "minute": f"{now.minute:02d}",
+                "second": f"{now.second:02d}",
+            })
+        if tokens & {"mtime", "size"}:
+            if stat is None:
+                stat = file_path.stat()
+            values["mtime"] = datetime.fromtimestamp(stat.st_mtime).strftime("%Y%m%d_%H%M%S")
+            values["size"] = str(stat.st_size)
+        if "hash8" in tokens:
+            values["hash8"] = file_hash(file_path)[:8]
+        if "title" in tokens:
+            values["title"] = slugify(prompt_title(file_path)) or file_path.stem
+        return values
+
+    def expand(self, values: Dict[str, str], seq: int = 1) -> str:
+        """계산된 토큰 값으로 파일명 조립 (확장자가 없으면 원본 확장자 추가)"""
+        parts = self.parts
+        pieces = []
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                pieces.append(part)
+            elif part == "seq":
+                pieces.append(f"{seq:04d}")
+            else:
+                pieces.append(values.get(part, "{" + part + "}"))
+        new_filename = "".join(pieces)
+
+        # 확장자가 패턴에 포함되지 않은 경우 추가
+        extension = values["ext"]
+        if not new_filename.endswith(extension) and not new_filename.endswith(extension.lower()):
+            new_filename += extension
+        return new_filename
+
+    def render(self, file_path: Path, now: Optional[datetime] = None, seq: int = 1,
+               stat: Optional[os.stat_result] = None) -> str:
+        """파일 하나의 실제 파일명 생성"""
+        return self.expand(self.values(file_path, now, stat), seq)
+
+
+@lru_cache(maxsize=64)
+def compile_template(pattern: str) -> FilenameTemplate:
+    """파일명 패턴 컴파일 (같은 패턴은 캐시 재사용)"""
+    return FilenameTemplate(pattern)
+
+
+def format_filename(file_path: Path, pattern: str, now: Optional[datetime] = None) -> str:
+    """파일명 패턴({name}, {ext}, {date} 등)에서 실제 파일명 생성"""
+    return compile_template(pattern).render(file_path, now)
+
+
+def file_hash(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-1 해시 (16진수)"""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def prompt_title(file_path: Path) -> str:
+    """수집 JSON의 첫 번째 제목(없으면 프롬프트) - JSON이 아니면 빈 문자열"""
+    if file_path.suffix.lower() != ".json":
+        return ""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return ""
+    if not isinstance(data, dict):
+        return ""
+    for image in data.get("images") or []:
+        text = image.get("title") or image.get("prompt")
+        if text:
+            return text
+    for prompt in data.get("prompts") or []:
+        if prompt.get("text"):
+            return prompt["text"]
+    return ""
+
+
+def slugify(text: str, max_length: int = 40) -> str:
+    """파일명에 쓸 수 있는 짧은 문자열로 변환 (한글 유지, 나머지 기호는 _)"""
+    slug = re.sub(r"[^\w]+", "_", text, flags=re.UNICODE).strip("_").lower()
+    return slug[:max_length].rstrip("_")
+
+
+class NameAllocator:
+    """대상 폴더 하나에 대한 파일명 배정 - 이름이 겹치지 않게 원자적으로 할당
+
+    {seq}가 있는 패턴은 폴더에 이미 있는 이름도 피해서 번호를 매기고,
+    {seq}가 없는 패턴은 이미 배정한 이름과 겹칠 때만 _2, _3...을 붙인다.
+    같은 폴더에 동시에 저장하는 작업끼리 공유하도록 acquire_name_allocator()로 받아 쓴다.
+    """
+
+    def __init__(self, target_dir: Path):
+        self.target_dir = Path(target_dir)
+        try:
+            self.existing = {os.path.normcase(name) for name in os.listdir(self.target_dir)}
+        except OSError:
+            self.existing = set()
+        self.reserved = set()
+        self.next_seq = 1
+        self.users = 0  # 이 배정기를 쓰는 작업 수 (acquire/release_name_allocator)
+        self._lock = threading.Lock()
+
+    def allocate(self, template: FilenameTemplate, file_path: Path, now: Optional[datetime] = None,
+                 stat: Optional[os.stat_result] = None) -> str:
+        """파일 하나의 대상 파일명 배정"""
+        # 내용 해시/JSON 제목 등 느린 값은 잠금 밖에서 계산하고 번호 배정만 잠금 안에서
+        values = template.values(file_path, now, stat)
+        if not template.uses_seq:
+            return self.reserve(template.expand(values))
+
+        with self._lock:
+            while True:
+                candidate = template.expand(values, self.next_seq)
+                self.next_seq += 1
+                key = os.path.normcase(candidate)
+                if key not in self.reserved and key not in self.existing:
+                    self.reserved.add(key)
+                    return candidate
+
+    def reserve(self, name: str) -> str:
+        """정해진 이름 배정 (패턴 없이 원본 파일명 그대로 저장할 때도) - 이미 배정한 이름과 겹칠 때만 _2, _3..."""
+        stem, ext = os.path.splitext(name)
+        with self._lock:
+            candidate = name
+            counter = 2
+            while os.path.normcase(candidate) in self.reserved:
+                candidate = f"{stem}_{counter}{ext}"
+                counter += 1
+            self.reserved.add(os.path.normcase(candidate))
+            return candidate
+
+
+_name_allocators: Dict[str, NameAllocator] = {}
+_name_allocators_lock = threading.Lock()
+
+
+def acquire_name_allocator(target_dir: Path) -> NameAllocator:
+    """대상 폴더의 공유 파일명 배정기 - 같은 폴더에 저장 중인 작업이 있으면 같은 배정기를 반환"""
+    key = os.path.normcase(os.path.abspath(target_dir))
+    with _name_allocators_lock:
+        allocator = _name_allocators.get(key)
+        if allocator is None:
+            allocator = _name_allocators[key] = NameAllocator(target_dir)
+        allocator.users += 1
+        return allocator
+
+
+def release_name_allocator(allocator: NameAllocator):
+    """작업 종료 - 마지막 작업이 끝나면 배정기 삭제 (다음 작업은 폴더를 다시 읽음)"""
+    key = os.path.normcase(os.path.abspath(allocator.target_dir))
+    with _name_allocators_lock:
+        allocator.users -= 1
+        if allocator.users <= 0 and _name_allocators.get(key) is allocator:
+            del _name_allocators[key]
+
+
+def get_move_rules(config: Dict) -> List[Dict]:
+    """설정의 이동 설정 목록 (move_rules 또는 예전 형식의 moveN_* 키)"""
+    rules = config.get("move_rules")
+    if not rules:
+        # 예전 형식: move1_source, move1_target, ... (번호 순)
+        numbers = sorted({int(m.group(1)) for key in config
+                          for m in [re.match(r"move(\d+)_source$", key)] if m})
+        rules = []
+        for number in numbers:
+            rule = {
+                "source": config.get(f"move{number}_source", ""),
+                "target": config.get(f"move{number}_target", ""),
+                "filename": config.get(f"move{number}_filename", ""),
+                "enabled": bool(config.get(f"move{number}_enabled", False)),
+            }
+            if rule["source"] or rule["target"] or rule["enabled"]:
+                rules.append(rule)
+
+    result = []
+    names = set()
+    for index, rule in enumerate(rules, 1):
+        # 이름이 겹치면 번호를 붙임 (실행 기록/동기화 기록이 이름으로 구분됨)
+        name = rule.get("name") or f"move{index}"
+        if name in names:
+            name = f"{name}_{index}"
+        names.add(name)
+        result.append({
+            "name": name,
+            "number": index,
+            "source": rule.get("source", ""),
+            "target": rule.get("target", ""),
+            "filename": rule.get("filename", ""),
+            "enabled": bool(rule.get("enabled", False)),
+        })
+    return result
+
+
+def run_move_rules(rules: List[Dict], execute: Callable[[Dict], None], max_workers: int = 4) -> List[Dict]:
+    """이동 설정들을 대상 드라이브별로 나누어 실행 - 드라이브가 다르면 병렬, 같으면 순서대로
+
+    execute(rule)은 작업 스레드에서 호출된다. 규칙별 소요 시간/오류를 원래 순서대로 반환.
+    앞 규칙의 대상 폴더를 소스로 쓰는 규칙은 그 규칙과 같은 줄에서 뒤에 실행한다.
+    """
+    # 같은 드라이브(같은 대상 폴더 포함)의 규칙은 한 줄(lane)에서 순서대로 실행
+    lanes: Dict = {}
+    producers: Dict[str, object] = {}  # 대상 폴더 → 그 폴더에 복사하는 규칙의 줄
+    for rule in rules:
+        target = Path(rule["target"])
+        key = producers.get(SourceIndex._key(rule["source"])) if rule["source"] else None
+        if key is None:
+            key = _device_of(target)
+        if key is None:
+            key = os.path.normcase(os.path.abspath(target))
+        lanes.setdefault(key, []).append(rule)
+        producers.setdefault(SourceIndex._key(rule["target"]), key)
+
+    position = {id(rule): index for index, rule in enumerate(rules)}
+
+    def run_lane(lane_rules: List[Dict]) -> List[Dict]:
+        lane_results = []
+        for rule in lane_rules:
+            start = time.perf_counter()
+            error = None
+            try:
+                execute(rule)
+            except Exception as e:
+                error = str(e)
+            lane_results.append((position[id(rule)], {"name": rule["name"], "number": rule["number"],
+                                                      "seconds": time.perf_counter() - start, "error": error}))
+        return lane_results
+
+    results = []
+    if len(lanes) <= 1 or max_workers <= 1:
+        for lane_rules in lanes.values():
+            results.extend(run_lane(lane_rules))
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(lanes), max_workers), thread_name_prefix="move") as pool:
+            for lane_results in pool.map(run_lane, lanes.values()):
+                results.extend(lane_results)
+
+    # 원래 순서대로 (이름은 겹칠 수 있으므로 목록 위치 기준)
+    results.sort(key=lambda x: x[0])
+    return [result for _, result in results]
+
+
+def _device_of(path: Path) -> Optional[int]:
+    """경로(또는 존재하는 가장 가까운 상위 폴더)의 장치 번호"""
+    for candidate in [path, *path.parents]:
+        try:
+            return candidate.stat().st_dev
+        except OSError:
+            continue
+    return None
+
+
+def scan_directory(path: Path) -> Optional[List[Dict]]:
+    """폴더를 한 번 스캔하여 파일 목록과 크기/수정시간/inode 반환 (폴더가 없으면 None)"""
+    try:
+        with os.scandir(path) as it:
+            entries = []
+            for entry in it:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append({"path": Path(entry.path), "name": entry.name,
+                                "size": stat.st_size, "mtime": stat.st_mtime, "inode": entry.inode()})
+            return entries
+    except OSError:
+        return None
+
+
+def compile_rule_pattern(pattern: str) -> Callable[[str], bool]:
+    """이동 설정 파일명을 매칭 함수로 변환 (빈 값: 모든 파일, 와일드카드: glob, 그 외: 정확히 일치)"""
+    if not pattern:
+        return lambda name: True
+    pattern = os.path.normcase(pattern)
+    if any(ch in pattern for ch in "*?["):
+        regex = re.compile(fnmatch.translate(pattern))
+        return lambda name: regex.match(os.path.normcase(name)) is not None
+    return lambda name: os.path.normcase(name) == pattern
+
+
+class SourceIndex:
+    """이동 설정의 소스 폴더 스캔 결과 - 폴더마다 한 번만 스캔하고 규칙별 최신 파일 선택
+
+    다른 규칙의 대상 폴더이기도 한 소스 폴더(chained)는 미리 스캔하지 않고, 쓸 때마다 새로 스캔하여
+    앞 규칙이 방금 복사한 파일을 본다.
+    """
+
+    def __init__(self, rules: List[Dict]):
+        self.listings: Dict[str, Optional[List[Dict]]] = {}
+        self.matches: Dict[int, Optional[Dict]] = {}
+        self.scan_seconds = 0.0
+
+        # 같은 소스 폴더를 쓰는 규칙끼리 묶기
+        groups: Dict[str, List[Dict]] = {}
+        for rule in rules:
+            if rule["source"]:
+                groups.setdefault(self._key(rule["source"]), []).append(rule)
+        targets = {self._key(rule["target"]) for rule in rules if rule["target"]}
+        self.chained = {key for key in groups if key in targets}
+
+        start = time.perf_counter()
+        for key, group in groups.items():
+            if key in self.chained:
+                continue
+            listing = scan_directory(Path(group[0]["source"]))
+            self.listings[key] = listing
+            for rule in group:
+                self.matches[rule["number"]] = self._newest(listing, rule["filename"])
+        self.scan_seconds = time.perf_counter() - start
+
+    @staticmethod
+    def _key(source: str) -> str:
+        return os.path.normcase(os.path.abspath(source))
+
+    @staticmethod
+    def _newest(listing: Optional[List[Dict]], pattern: str) -> Optional[Dict]:
+        if not listing:
+            return None
+        matcher = compile_rule_pattern(pattern)
+        candidates = [entry for entry in listing if matcher(entry["name"])]
+        return max(candidates, key=lambda x: x["mtime"]) if candidates else None
+
+    def listing(self, source: str) -> Optional[List[Dict]]:
+        """소스 폴더의 캐시된 파일 목록 (폴더가 없으면 None, chained 폴더는 새로 스캔)"""
+        key = self._key(source)
+        if key not in self.listings or key in self.chained:
+            self.listings[key] = scan_directory(Path(source))
+        return self.listings[key]
+
+    def match(self, rule: Dict, listing: Optional[List[Dict]] = None) -> Optional[Dict]:
+        """규칙에 맞는 가장 최신 파일 (없으면 None)
+
+        chained 폴더는 매번 새로 선택 (listing: 방금 listing()으로 받은 목록이 있으면 다시 스캔하지 않음)
+        """
+        if self._key(rule["source"]) in self.chained:
+            return self._newest(listing if listing is not None else self.listing(rule["source"]), rule["filename"])
+        if rule["number"] not in self.matches:
+            self.matches[rule["number"]] = self._newest(self.listing(rule["source"]), rule["filename"])
+        return self.matches[rule["number"]]
+
+    @property
+    def directory_count(self) -> int:
+        return len(self.listings)
+
+
+class LegacyBackend:
+    """기존 방식 - Path.glob 검색, 필요할 때마다 stat, shutil.copy2 복사"""
+
+    name = "legacy"
+
+    def scan(self, folder: Path, pattern: str) -> List[Path]:
+        return [f for f in folder.glob(pattern) if f.is_file()]
+
+    def mtime(self, path: Path) -> float:
+        return path.stat().st_mtime
+
+    def copy(self, source: Path, target: Path):
+        shutil.copy2(source, target)
+
+
+class FastBackend:
+    """빠른 방식 - os.scandir 검색 (검색 때 읽은 수정시간 재사용), 커널 안에서 복사 (copy_file_range)
+
+    하위 폴더가 들어간 패턴은 기존 방식으로 검색한다.
+    copy_file_range가 없거나 실패하면 shutil.copyfile (sendfile 등 OS 고속 복사)로 대신한다.
+    """
+
+    name = "fast"
+
+    def __init__(self):
+        self._mtimes: Dict[Path, Dict[str, float]] = {}  # 폴더 → 마지막 검색에서 읽은 파일명별 수정시간
+
+    def scan(self, folder: Path, pattern: str) -> List[Path]:
+        if "/" in pattern or os.sep in pattern:
+            return LegacyBackend().scan(folder, pattern)
+        matches = compile_rule_pattern(pattern)
+        files = []
+        mtimes: Dict[str, float] = {}
+        # 폴더를 다시 검색하면 이전 결과를 버림 (오래 실행되는 GUI에서도 캐시가 폴더 수만큼만 유지됨)
+        self._mtimes[folder] = mtimes
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file() and matches(entry.name):
+                        mtimes[entry.name] = entry.stat().st_mtime
+                        files.append(folder / entry.name)
+        except FileNotFoundError:
+            return []
+        return files
+
+    def mtime(self, path: Path) -> float:
+        mtime = self._mtimes.get(path.parent, {}).get(path.name)
+        return mtime if mtime is not None else path.stat().st_mtime
+
+    def copy(self, source: Path, target: Path):
+        if hasattr(os, "copy_file_range"):
+            copied = 0
+            try:
+                with open(source, "rb") as src, open(target, "wb") as dst:
+                    while True:
+                        sent = os.copy_file_range(src.fileno(), dst.fileno(), 64 * 1024 * 1024)
+                        if sent == 0:
+                            break
+                        copied += sent
+                shutil.copystat(source, target)
+                return
+            except OSError:
+                if copied:
+                    raise
+        shutil.copy2(source, target)
+
+
+BACKENDS = {"legacy": LegacyBackend, "fast": FastBackend}
+
+
+def get_backend(name: str):
+    """이름으로 검색/복사 백엔드 생성 (legacy / fast)"""
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"알 수 없는 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+
+
+class ProgressTracker:
+    """파일 수/바이트 기준 진행률과 남은 시간 - callback(info)은 interval초마다, 마지막에는 항상 호출
+
+    info: done, total, bytes, total_bytes, seconds, files_per_s, mb_per_s, eta_seconds (run_copy_pipeline과 같은 형식)
+    """
+
+    def __init__(self, total_files: int, total_bytes: int,
+                 callback: Optional[Callable[[Dict], None]] = None, interval: float = 0.5):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.callback = callback
+        self.interval = interval
+        self.done = 0
+        self.bytes = 0
+        self.start = time.perf_counter()
+        self._last_report = 0.0
+
+    def advance(self, files: int = 1, nbytes: int = 0):
+        self.done += files
+        self.bytes += nbytes
+        self.report(force=self.done >= self.total_files)
+
+    def snapshot(self) -> Dict:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        bytes_per_s = self.bytes / elapsed
+        files_per_s = self.done / elapsed
+        if self.total_bytes and bytes_per_s > 0:
+            eta = (self.total_bytes - self.bytes) / bytes_per_s
+        elif files_per_s > 0:
+            eta = (self.total_files - self.done) / files_per_s
+        else:
+            eta = None
+        return {
+            "done": self.done,
+            "total": self.total_files,
+            "bytes": self.bytes,
+            "total_bytes": self.total_bytes,
+            "seconds": elapsed,
+            "files_per_s": files_per_s,
+            "mb_per_s": bytes_per_s / (1024 * 1024),
+            "eta_seconds": eta,
+        }
+
+    def report(self, force: bool = False):
+        if self.callback is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        self.callback(self.snapshot())
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """남은 시간 표시 (예: 1:05:09, 3:07)"""
+    if seconds is None:
+        return "-"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+def format_progress(label: str, info: Dict) -> Tuple[str, Optional[float]]:
+    """진행 표시 문구와 진행률(%, 전체를 모르면 None)"""
+    total = info.get("total")
+    total_bytes = info.get("total_bytes")
+    text = f"{label}: {info['done']:,}" + (f"/{total:,}개" if total is not None else "개")
+    if total_bytes:
+        text += f" · {info['bytes'] / (1024 * 1024):.1f}/{total_bytes / (1024 * 1024):.1f}MB"
+        percent = info["bytes"] / total_bytes * 100
+    else:
+        percent = info["done"] / total * 100 if total else None
+    text += f" · {info['mb_per_s']:.1f}MB/초 · 남은 시간 {format_eta(info.get('eta_seconds'))}"
+    return text, percent
+
+
+def copy_via_temp(copy: Callable[[Path, Path], None], source: Path, target: Path):
+    """임시 파일(.tmp)에 복사한 뒤 교체 - 실패하거나 중지되면 임시 파일을 지워 대상에 잘린 파일이 남지 않게 함"""
+    temp_target = target.with_name(target.name + ".tmp")
+    try:
+        copy(source, temp_target)
+        os.replace(temp_target, target)
+    except BaseException:
+        try:
+            temp_target.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def run_copy_pipeline(items: Iterable[Tuple[Path, Path, int]],
+                      prepare: Optional[Callable[[Path], None]] = None,
+                      small_workers: int = 4, large_workers: int = 2,
+                      large_threshold: int = 8 * 1024 * 1024, queue_size: int = 256,
+                      progress_callback: Optional[Callable[[Dict], None]] = None,
+                      progress_interval: float = 1.0,
+                      on_copied: Optional[Callable[[Path, Path], None]] = None,
+                      copy: Callable[[Path, Path], None] = shutil.copy2,
+                      cancel_event: Optional[threading.Event] = None) -> Dict:
+    """(원본, 대상, 크기) 목록을 작업 스레드로 복사 - 큰 파일과 작은 파일은 별도 작업 줄에서 처리
+
+    items는 스캔하면서 바로 넘겨주는 iterable이어도 된다 (대기열 크기만큼만 앞서 읽음).
+    prepare(target)은 복사 직전에, on_copied(source, target)은 복사 직후에 작업 스레드에서 호출된다.
+    copy(source, target)로 복사 방식(백엔드)을 바꿀 수 있다.
+    각 파일은 임시 파일에 복사한 뒤 교체하므로 실패하거나 취소되어도 대상에 반쯤 복사된 파일이 남지 않는다.
+    cancel_event가 설정되면 진행 중인 파일까지만 복사하고 나머지는 건너뛴다 (결과의 cancelled).
+    progress_callback에는 처리 수, 파일/초, MB/초, 남은 시간(초, 스캔이 끝난 뒤부터)이 전달된다.
+    """
+    lanes = {
+        "small": (queue.Queue(maxsize=queue_size), max(1, small_workers)),
+        "large": (queue.Queue(maxsize=max(1, large_workers) * 2), max(1, large_workers)),
+    }
+    lock = threading.Lock()
+    stats = {"scanned": 0, "scanned_bytes": 0, "scan_done": False,
+             "copied": 0, "bytes": 0, "failed": [], "cancelled": 0}
+    start = time.perf_counter()
+    last_report = [start]
+
+    def snapshot() -> Dict:
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        bytes_per_s = stats["bytes"] / elapsed
+        eta = None
+        if stats["scan_done"]:
+            remaining = stats["scanned_bytes"] - stats["bytes"]
+            eta = remaining / bytes_per_s if bytes_per_s > 0 else 0.0
+        done = stats["copied"] + len(stats["failed"])
+        return {
+            "done": done,
+            "total": stats["scanned"] if stats["scan_done"] else None,
+            "total_bytes": stats["scanned_bytes"] if stats["scan_done"] else None,
+            "copied": stats["copied"],
+            "failed": len(stats["failed"]),
+            "bytes": stats["bytes"],
+            "seconds": elapsed,
+            "files_per_s": done / elapsed,
+            "mb_per_s": bytes_per_s / (1024 * 1024),
+            "eta_seconds": eta,
+        }
+
+    def report(force: bool = False):
+        if progress_callback is None:
+            return
+        with lock:
+            now = time.perf_counter()
+            if not force and now - last_report[0] < progress_interval:
+                return
+            last_report[0] = now
+            info = snapshot()
+        progress_callback(info)
+
+    def worker(jobs: queue.Queue):
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            source, target, size = job
+            if cancel_event is not None and cancel_event.is_set():
+                with lock:
+                    stats["cancelled"] += 1
+                continue
+            try:
+                if prepare is not None:
+                    prepare(target)
+                copy_via_temp(copy, source, target)
+                if on_copied is not None:
+                    on_copied(source, target)
+                with lock:
+                    stats["copied"] += 1
+                    stats["bytes"] += size
+            except Exception as e:
+                with lock:
+                    stats["failed"].append((str(source), str(e)))
+            report()
+
+    threads = []
+    for name, (jobs, count) in lanes.items():
+        for i in range(count):
+            thread = threading.Thread(target=worker, args=(jobs,), name=f"copy-{name}-{i}")
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+    try:
+        for source, target, size in items:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            with lock:
+                stats["scanned"] += 1
+                stats["scanned_bytes"] += size
+            lanes["large" if size >= large_threshold else "small"][0].put((source, target, size))
+    finally:
+        with lock:
+            stats["scan_done"] = True
+        for jobs, count in lanes.values():
+            for _ in range(count):
+                jobs.put(None)
+        for thread in threads:
+            thread.join()
+
+    report(force=True)
+    result = snapshot()
+    result["errors"] = stats["failed"]
+    result["cancelled"] = cancel_event is not None and cancel_event.is_set()
+    return result
+
+
+def file_fingerprint(path: Path) -> Optional[Dict]:
+    """파일의 크기/수정시간/inode (파일이 없으면 None)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime": stat.st_mtime, "inode": stat.st_ino}
+
+
+class SyncManifest:
+    """이동 설정 하나의 동기화 기록 - 원본/대상 파일의 크기, 수정시간, inode(선택: 내용 해시)를 저장해
+    새 파일이나 바뀐 파일만 복사하고, 원하면 원본에서 지워진 파일의 복사본도 지운다 (rsync 방식)"""
+
+    def __init__(self, path: Path, source: str, target: str, use_hash: bool = False):
+        self.path = Path(path)
+        self.source = source
+        self.target = target
+        self.use_hash = use_hash
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # 소스/대상 폴더가 바뀌었으면 예전 기록은 쓰지 않음
+            if data.get("source") == source and data.get("target") == target:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _same(recorded: Optional[Dict], current: Optional[Dict]) -> bool:
+        if not recorded or not current:
+            return False
+        return all(recorded.get(key) == current.get(key) for key in ("size", "mtime", "inode"))
+
+    def is_current(self, name: str, source_path: Path, source: Dict) -> bool:
+        """원본과 대상이 마지막 복사 이후 그대로인지 (True면 복사 생략)"""
+        entry = self.entries.get(name)
+        if entry is None:
+            return False
+
+        if not self._same(entry["src"], source):
+            # 크기는 같고 수정시간만 바뀐 경우 해시로 내용 비교
+            if not (self.use_hash and entry["src"].get("hash") and entry["src"]["size"] == source["size"]):
+                return False
+            if file_hash(source_path) != entry["src"]["hash"]:
+                return False
+            with self._lock:
+                entry["src"] = dict(source, hash=entry["src"]["hash"])
+                self.dirty = True
+
+        # 대상 파일이 지워졌거나 다른 프로그램이 바꿨으면 다시 복사
+        return self._same(entry["dst"], file_fingerprint(Path(entry["target"])))
+
+    def record(self, name: str, source_path: Path, source: Dict, target_path: Path):
+        """복사 완료 기록"""
+        src = {"size": source["size"], "mtime": source["mtime"], "inode": source["inode"]}
+        if self.use_hash:
+            src["hash"] = file_hash(source_path)
+        with self._lock:
+            self.entries[name] = {"target": str(target_path), "src": src, "dst": file_fingerprint(target_path)}
+            self.dirty = True
+
+    def mirror_deletions(self, present: Iterable[str]) -> List[Path]:
+        """원본에서 사라진 파일의 복사본 삭제 (복사 후 바뀐 대상 파일은 지우지 않음), 삭제한 경로 반환"""
+        present = set(present)
+        deleted = []
+        with self._lock:
+            for name in [name for name in self.entries if name not in present]:
+                entry = self.entries.pop(name)
+                self.dirty = True
+                target = Path(entry["target"])
+                if self._same(entry["dst"], file_fingerprint(target)):
+                    try:
+                        target.unlink()
+                        deleted.append(target)
+                    except OSError:
+                        pass
+        return deleted
+
+    def save(self):
+        """기록 저장 (바뀐 내용이 있을 때만, 임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            if not self.dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"source": self.source, "target": self.target, "entries": self.entries},
+                          f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self.dirty = False
+
+
+def manifest_for_rule(config: Dict, rule: Dict, kind: str = "move") -> Optional[SyncManifest]:
+    """이동 설정의 동기화 기록 (sync_enabled가 꺼져 있으면 None)"""
+    if not config.get("sync_enabled", True):
+        return None
+    name = slugify(f"{kind}_{rule.get('name') or rule['number']}") or kind
+    path = Path(config.get("manifest_dir", str(Path("logs") / "manifests"))) / f"{name}.json"
+    return SyncManifest(path, os.path.abspath(rule["source"]), os.path.abspath(rule["target"]),
+                        use_hash=bool(config.get("sync_hash", False)))
+
+
+def json_diff(old, new, path: Optional[List] = None) -> List[Dict]:
+    """두 JSON 값의 차이를 작업 목록으로 (set/del/splice, 배열은 앞뒤 공통 부분을 빼고 바뀐 구간만)"""
+    path = path or []
+    if isinstance(old, dict) and isinstance(new, dict):
+        # 새 키는 끝에 추가되므로, 키 순서가 그렇게 맞지 않으면 통째로 교체 (복원 시 키 순서 유지)
+        kept = [key for key in old if key in new]
+        if list(new) != kept + [key for key in new if key not in old]:
+            return [{"op": "set", "path": path, "value": new}]
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "del", "path": path + [key]})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "set", "path": path + [key], "value": value})
+            elif old[key] != value:
+                ops.extend(json_diff(old[key], value, path + [key]))
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] == new[-1 - end]:
+            end += 1
+        removed = old[start:len(old) - end]
+        inserted = new[start:len(new) - end]
+        # 한 항목만 바뀐 경우 항목 안쪽 차이만 기록
+        if len(removed) == 1 and len(inserted) == 1 and type(removed[0]) is type(inserted[0]) \
+                and isinstance(inserted[0], (dict, list)):
+            return json_diff(removed[0], inserted[0], path + [start])
+        if not removed and not inserted:
+            return []
+        return [{"op": "splice", "path": path, "start": start, "delete": len(removed), "insert": inserted}]
+    if old != new or type(old) is not type(new):
+        return [{"op": "set", "path": path, "value": new}]
+    return []
+
+
+def json_patch(doc, ops: List[Dict]):
+    """json_diff 결과를 적용한 새 값 반환 (doc은 변경될 수 있음)"""
+    for op in ops:
+        path = op["path"]
+        if op["op"] == "set" and not path:
+            doc = op["value"]
+            continue
+        parent = doc
+        for key in path[:-1] if op["op"] != "splice" else path:
+            parent = parent[key]
+        if op["op"] == "set":
+            parent[path[-1]] = op["value"]
+        elif op["op"] == "del":
+            del parent[path[-1]]
+        elif op["op"] == "splice":
+            parent[op["start"]:op["start"] + op["delete"]] = op["insert"]
+    return doc
+
+
+# 차이 버전을 다시 같은 바이트로 쓰기 위한 JSON 저장 형식 후보 (json.dumps 인수)
+JSON_FORMATS = [
+    {"indent": 2, "ensure_ascii": False},
+    {"indent": 2, "ensure_ascii": True},
+    {"indent": 4, "ensure_ascii": False},
+    {"ensure_ascii": False, "separators": [",", ":"]},
+    {"ensure_ascii": True},
+]
+
+
+def detect_json_format(doc, raw: bytes) -> Optional[Dict]:
+    """raw를 그대로 만들어 내는 저장 형식 (끝 줄바꿈 포함, 없으면 None)"""
+    for fmt in JSON_FORMATS:
+        encoded = json.dumps(doc, **fmt).encode("utf-8")
+        if raw == encoded:
+            return dict(fmt, newline=False)
+        if raw == encoded + b"\n":
+            return dict(fmt, newline=True)
+    return None
+
+
+def encode_json(doc, fmt: Dict) -> bytes:
+    """detect_json_format 형식으로 JSON 직렬화"""
+    options = {key: value for key, value in fmt.items() if key != "newline"}
+    return json.dumps(doc, **options).encode("utf-8") + (b"\n" if fmt.get("newline") else b"")
+
+
+class VersionStore:
+    """파일 하나의 버전 기록 - 주기적인 전체 스냅샷 + 이전 버전과의 JSON 차이
+
+    <폴더>/.versions/<파일명>/index.json 에 버전 목록을 두므로 목록 조회 시 버전 파일을 열지 않는다.
+    JSON이 아닌 파일은 매번 전체 사본으로 저장한다. 차이 버전은 복원한 내용을 원래 형식으로 다시 썼을 때
+    원본과 같은 바이트가 되는 경우에만 쓰고, 그 밖에는 스냅샷으로 저장하므로 복원 결과는 항상 sha1이 같다.
+    """
+
+    def __init__(self, target_file: Path, snapshot_every: int = 20, max_versions: int = 500):
+        self.target_file = Path(target_file)
+        self.directory = self.target_file.parent / ".versions" / self.target_file.name
+        self.index_file = self.directory / "index.json"
+        self.snapshot_every = max(1, snapshot_every)
+        self.max_versions = max(1, max_versions)
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {"versions": []}
+
+    def versions(self) -> List[Dict]:
+        """저장된 버전 목록 (오래된 것부터)"""
+        return list(self.index["versions"])
+
+    def add(self, source: Optional[Path] = None) -> Optional[Dict]:
+        """현재 파일(또는 source) 내용을 새 버전으로 저장, 마지막 버전과 같으면 None"""
+        source = Path(source or self.target_file)
+        raw = source.read_bytes()
+        digest = hashlib.sha1(raw).hexdigest()
+        versions = self.index["versions"]
+        if versions and versions[-1]["sha1"] == digest:
+            return None
+
+        try:
+            doc = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            doc = None
+
+        number = versions[-1]["version"] + 1 if versions else 1
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {"version": number, "created_at": datetime.now().isoformat(),
+                 "mtime": source.stat().st_mtime, "size": len(raw), "sha1": digest}
+
+        since_snapshot = 0
+        for previous in reversed(versions):
+            if previous["kind"] != "delta":
+                break
+            since_snapshot += 1
+        previous_doc = None
+        json_format = detect_json_format(doc, raw) if doc is not None else None
+        if json_format is not None and versions and versions[-1]["kind"] != "raw" \
+                and since_snapshot + 1 < self.snapshot_every:
+            previous_doc = self.load(versions[-1]["version"])
+        diff = json_diff(previous_doc, doc) if previous_doc is not None else None
+        if diff is not None and encode_json(json_patch(previous_doc, diff), json_format) != raw:
+            diff = None  # 차이로는 같은 바이트를 만들 수 없음 (예: 중첩된 키 순서만 바뀜) → 스냅샷
+
+        if doc is None:
+            entry.update(kind="raw", file=f"v{number:06d}{source.suffix}")
+            (self.directory / entry["file"]).write_bytes(raw)
+        elif diff is None:
+            entry.update(kind="snapshot", file=f"v{number:06d}.json")
+            (self.directory / entry["file"]).write_bytes(raw)
+        else:
+            entry.update(kind="delta", file=f"v{number:06d}.delta.json", format=json_format)
+            with open(self.directory / entry["file"], "w", encoding="utf-8") as f:
+                json.dump(diff, f, ensure_ascii=False, separators=(",", ":"))
+
+        versions.append(entry)
+        self._prune()
+        self._save_index()
+        return entry
+
+    def load(self, version: int):
+        """버전 내용 복원 (JSON은 파싱된 값, raw 버전은 bytes) - 가장 가까운 스냅샷에서 차이만 적용"""
+        versions = self.index["versions"]
+        position = next((i for i, v in enumerate(versions) if v["version"] == version), None)
+        if position is None:
+            raise KeyError(f"버전 없음: {version}")
+
+        base = position
+        while versions[base]["kind"] == "delta":
+            base -= 1
+        if versions[base]["kind"] == "raw":
+            return (self.directory / versions[base]["file"]).read_bytes()
+
+        with open(self.directory / versions[base]["file"], "r", encoding="utf-8") as f:
+            doc = json.load(f)
+        for entry in versions[base + 1:position + 1]:
+            with open(self.directory / entry["file"], "r", encoding="utf-8") as f:
+                doc = json_patch(doc, json.load(f))
+        return doc
+
+    def restore(self, version: int, output: Optional[Path] = None) -> Path:
+        """버전을 파일로 복원 (output이 없으면 원래 파일에 덮어씀) - 저장했던 바이트 그대로"""
+        output = Path(output or self.target_file)
+        entry = next((v for v in self.index["versions"] if v["version"] == version), None)
+        if entry is None:
+            raise KeyError(f"버전 없음: {version}")
+        if entry["kind"] != "delta":
+            # 스냅샷/raw 버전은 저장한 파일이 원본 그대로
+            content = (self.directory / entry["file"]).read_bytes()
+        else:
+            content = encode_json(self.load(version), entry.get("format", {"indent": 2, "ensure_ascii": False}))
+        temp_output = output.with_name(output.name + ".tmp")
+        temp_output.write_bytes(content)
+        os.replace(temp_output, output)
+        return output
+
+    def _prune(self):
+        # 가장 오래된 스냅샷 묶음(스냅샷 + 이어지는 차이)을 통째로 지워야 나머지를 복원할 수 있음
+        # (지운 뒤에도 max_versions개 이상 남을 때만 지우므로 최대 스냅샷 간격만큼 넘을 수 있음)
+        versions = self.index["versions"]
+        while len(versions) > self.max_versions:
+            chain = 1
+            while chain < len(versions) and versions[chain]["kind"] == "delta":
+                chain += 1
+            if chain >= len(versions) or len(versions) - chain < self.max_versions:
+                break
+            for entry in versions[:chain]:
+                try:
+                    (self.directory / entry["file"]).unlink()
+                except OSError:
+                    pass
+            del versions[:chain]
+
+    def _save_index(self):
+        temp_index = self.index_file.with_name("index.json.tmp")
+        with open(temp_index, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(temp_index, self.index_file)
+
+
+class JobScheduler:
+    """단조 시계 기준 작업 스케줄러 - 작업별 실행 간격, 이전 실행이 끝나지 않았으면 건너뛰거나 합침
+
+    tick()을 주기적으로 호출하면 실행 시각이 된 작업을 별도 스레드에서 실행한다.
+    overlap="skip": 실행 중이면 이번 차례를 건너뜀, "coalesce": 끝난 직후 한 번만 다시 실행.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.jobs: Dict[str, Dict] = {}
+        self.active = False
+        self._lock = threading.Lock()
+
+    def add_job(self, name: str, func: Callable[[], None], interval: float, overlap: str = "coalesce"):
+        """작업 등록 (interval이 0 이하면 자동 실행하지 않음)"""
+        self.jobs[name] = {
+            "func": func, "interval": float(interval), "overlap": overlap,
+            "next_run": None, "running": False, "pending": False,
+            "runs": 0, "skipped": 0, "last_duration": None, "last_error": None,
+        }
+
+    def set_interval(self, name: str, interval: float):
+        """작업 간격 변경 (다음 실행 시각은 지금부터 다시 계산)"""
+        with self._lock:
+            job = self.jobs[name]
+            job["interval"] = float(interval)
+            job["next_run"] = self.clock() + job["interval"] if self.active and job["interval"] > 0 else None
+
+    def start(self):
+        """자동 실행 시작 - 각 작업은 한 간격 뒤 첫 실행"""
+        with self._lock:
+            self.active = True
+            now = self.clock()
+            for job in self.jobs.values():
+                job["next_run"] = now + job["interval"] if job["interval"] > 0 else None
+
+    def stop(self):
+        """자동 실행 중지 (실행 중인 작업은 끝까지 진행)"""
+        with self._lock:
+            self.active = False
+            for job in self.jobs.values():
+                job["next_run"] = None
+                job["pending"] = False
+
+    def tick(self) -> List[str]:
+        """실행 시각이 된 작업 시작, 시작한 작업 이름 목록 반환"""
+        started = []
+        with self._lock:
+            if not self.active:
+                return started
+            now = self.clock()
+            for name, job in self.jobs.items():
+                if job["next_run"] is None or now < job["next_run"]:
+                    continue
+                # 늦어진 만큼 몰아서 실행하지 않고 다음 간격 시각으로 이동 (누적 오차 없음)
+                missed = int((now - job["next_run"]) // job["interval"]) + 1
+                job["next_run"] += missed * job["interval"]
+                if job["running"]:
+                    if job["overlap"] == "coalesce":
+                        job["pending"] = True
+                    else:
+                        job["skipped"] += 1
+                    continue
+                job["running"] = True
+                started.append(name)
+
+        for name in started:
+            thread = threading.Thread(target=self._run, args=(name,), name=f"job-{name}")
+            thread.daemon = True
+            thread.start()
+        return started
+
+    def run_now(self, name: str) -> bool:
+        """작업을 호출한 스레드에서 바로 실행 (이미 실행 중이면 실행하지 않고 False)"""
+        with self._lock:
+            job = self.jobs[name]
+            if job["running"]:
+                job["skipped"] += 1
+                return False
+            job["running"] = True
+        self._run(name)
+        return True
+
+    def _run(self, name: str):
+        job = self.jobs[name]
+        while True:
+            start = self.clock()
+            error = None
+            try:
+                job["func"]()
+            except Exception as e:
+                error = str(e)
+            with self._lock:
+                job["runs"] += 1
+                job["last_duration"] = self.clock() - start
+                job["last_error"] = error
+                # 실행 중에 밀린 차례가 있으면 한 번만 이어서 실행
+                if job["pending"] and self.active:
+                    job["pending"] = False
+                    continue
+                job["running"] = False
+                return
+
+    def status(self) -> List[Dict]:
+        """작업별 상태 (다음 실행까지 남은 초, 마지막 소요 시간 등)"""
+        with self._lock:
+            now = self.clock()
+            return [{
+                "name": name,
+                "interval": job["interval"],
+                "next_in": max(0.0, job["next_run"] - now) if job["next_run"] is not None else None,
+                "running": job["running"],
+                "pending": job["pending"],
+                "runs": job["runs"],
+                "skipped": job["skipped"],
+                "last_duration": job["last_duration"],
+                "last_error": job["last_error"],
+            } for name, job in self.jobs.items()]
+
+
+class PhaseProfiler:
+    """단계별 실행 시간 측정 (프로파일링 활성화 시 CPU 시간, cProfile 덤프, 최대 메모리 포함)
+
+    CPU 시간과 최대 메모리는 프로세스 전체 값이라, 다른 단계와 겹쳐 실행된 단계(병렬 이동 규칙 등)는
+    실행 시간만 기록하고 overlapped로 표시
+    """
+
+    def __init__(self, enabled: bool = False, cprofile: bool = False,
+                 trace_memory: bool = False, output_dir: str = "profiles"):
+        self.enabled = enabled
+        self.cprofile = enabled and cprofile
+        self.trace_memory = enabled and trace_memory
+        self.output_dir = Path(output_dir)
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.phases: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._active: List[Dict] = []  # 실행 중인 단계 (겹침 여부 표시)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "PhaseProfiler":
+        """설정값으로 프로파일러 생성"""
+        return cls(
+            enabled=bool(config.get("profile_enabled", False)),
+            cprofile=bool(config.get("profile_cprofile", True)),
+            trace_memory=bool(config.get("profile_memory", True)),
+            output_dir=config.get("profile_dir", "profiles"),
+        )
+
+    @contextmanager
+    def phase(self, name: str):
+        """with 블록 하나를 한 단계로 측정"""
+        profile = None
+        memory_start = 0
+        cpu_start = time.process_time()
+
+        running = {"overlapped": False}
+        with self._lock:
+            if self._active:
+                running["overlapped"] = True
+                for other in self._active:
+                    other["overlapped"] = True
+            self._active.append(running)
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            if not running["overlapped"]:
+                tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+
+        if self.cprofile:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # 다른 스레드에서 이미 프로파일러가 동작 중인 경우
+                profile = None
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = {"wall": time.perf_counter() - start}
+            with self._lock:
+                self._active.remove(running)
+            overlapped = running["overlapped"]
+
+            if self.enabled and overlapped:
+                stats["overlapped"] = True
+            elif self.enabled:
+                stats["cpu"] = time.process_time() - cpu_start
+
+            if profile is not None:
+                profile.disable()
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                prof_file = self.output_dir / f"{self.run_id}_{name}.prof"
+                profile.dump_stats(str(prof_file))
+                stats["prof_file"] = str(prof_file)
+
+            if self.trace_memory and not overlapped and tracemalloc.is_tracing():
+                stats["peak_kb"] = max(0, tracemalloc.get_traced_memory()[1] - memory_start) / 1024
+
+            with self._lock:
+                self.phases[name] = stats
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """단계별 실행 시간 (초)"""
+        with self._lock:
+            return {name: stats["wall"] for name, stats in self.phases.items()}
+
+    def finish(self) -> Dict[str, Dict]:
+        """측정 종료 - 직접 시작한 tracemalloc은 중지"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        with self._lock:
+            return {name: dict(stats) for name, stats in self.phases.items()}
+
+    def format_table(self) -> List[str]:
+        """단계별 측정 결과 표 (줄 목록)"""
+        lines = [f"{'phase':<12}{'wall(ms)':>10}{'cpu(ms)':>10}{'peak(KB)':>10}"]
+        total_wall = 0.0
+        phases = self.finish()
+        for name, stats in phases.items():
+            total_wall += stats["wall"]
+            cpu = f"{stats['cpu'] * 1000:.1f}" if "cpu" in stats else "-"
+            peak = f"{stats['peak_kb']:.0f}" if "peak_kb" in stats else "-"
+            lines.append(f"{name:<12}{stats['wall'] * 1000:>10.1f}{cpu:>10}{peak:>10}")
+        lines.append(f"{'total':<12}{total_wall * 1000:>10.1f}")
+        if any(stats.get("overlapped") for stats in phases.values()):
+            lines.append("(-: 다른 단계와 겹쳐 실행되어 CPU/메모리 제외)")
+        return lines
+
+
+class OperationJournal:
+    """정리 작업 의도 기록 - 계획한 복사/이동/삭제를 먼저 남기고 끝난 단계를 한 줄씩 추가
+
+    첫 줄은 전체 계획, 이후 줄은 {"step": 번호, "status": 상태}.
+    프로세스가 중간에 종료되면 다음 실행에서 기록되지 않은 단계만 다시 실행한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._file = None
+
+    def begin(self, steps: List[Dict]) -> str:
+        """새 계획 기록 시작 (실행 ID 반환)"""
+        run_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write({"run_id": run_id, "created_at": datetime.now().isoformat(), "steps": steps}, sync=True)
+        return run_id
+
+    def mark(self, index: int, status: str):
+        """단계 완료 기록"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._write({"step": index, "status": status})
+
+    def _write(self, entry: Dict, sync: bool = False):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def load(self) -> Optional[Dict]:
+        """남아 있는 기록 읽기 - 없거나 손상되었으면 None"""
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            state = json.loads(lines[0])
+            state["finished"] = {}
+            for line in lines[1:]:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # 기록 도중 종료된 마지막 줄
+                state["finished"][entry["step"]] = entry["status"]
+            return state
+        except (OSError, IndexError, KeyError, json.JSONDecodeError):
+            return None
+
+    def clear(self):
+        """모든 단계가 끝나면 기록 삭제"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class JsonRecordIndex:
+    """큰 JSON 파일의 레코드 위치(바이트 오프셋) 색인 - 파일 전체를 파싱하지 않고 필요한 레코드만 읽음
+
+    최상위 객체의 배열 값(images, prompts 등)이나 최상위 배열의 각 항목 위치를 기록한다.
+    build()는 별도 스레드에서 호출하고, 색인되는 동안에도 이미 찾은 레코드는 read()로 읽을 수 있다.
+    """
+
+    CHUNK_SIZE = 4 * 1024 * 1024
+    OUTSIDE = re.compile(rb'["{}\[\],]')  # 문자열 밖에서 구조를 바꾸는 문자
+    INSIDE = re.compile(rb'["\\]')  # 문자열 안에서 볼 문자 (끝 따옴표, 이스케이프)
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.size = self.path.stat().st_size
+        self.offsets: Dict[str, array] = {}  # 섹션 → [시작, 끝, 시작, 끝, ...]
+        self.scanned = 0
+        self.done = False
+        self.error: Optional[str] = None
+        self._reader = open(self.path, "rb")
+        self._read_lock = threading.Lock()
+
+    def sections(self) -> List[str]:
+        """색인된 섹션 이름 (레코드가 있는 배열)"""
+        return [name for name, offsets in list(self.offsets.items()) if offsets]
+
+    def count(self, section: str) -> int:
+        """섹션의 레코드 수 (색인 중이면 지금까지 찾은 수)"""
+        offsets = self.offsets.get(section)
+        return len(offsets) // 2 if offsets is not None else 0
+
+    def read(self, section: str, position: int):
+        """레코드 하나 읽기 (해당 바이트 구간만 읽어서 파싱)"""
+        offsets = self.offsets[section]
+        start, end = offsets[position * 2], offsets[position * 2 + 1]
+        with self._read_lock:
+            self._reader.seek(start)
+            raw = self._reader.read(end - start)
+        return json.loads(raw.decode("utf-8"))
+
+    def read_range(self, section: str, first: int, count: int) -> List:
+        """연속된 레코드 읽기"""
+        last = min(first + count, self.count(section))
+        return [self.read(section, i) for i in range(max(0, first), last)]
+
+    def close(self):
+        self._reader.close()
+
+    def build(self, stop_event: Optional[threading.Event] = None):
+        """파일을 처음부터 끝까지 한 번 훑어 레코드 위치 기록"""
+        try:
+            self._scan(stop_event)
+        except (OSError, ValueError) as e:
+            self.error = str(e)
+        finally:
+            self.done = True
+
+    def _read_key(self, start: int, end: int) -> str:
+        with self._read_lock:
+            self._reader.seek(start)
+            return self._reader.read(min(end - start, 256)).decode("utf-8", "replace")
+
+    def _scan(self, stop_event: Optional[threading.Event]):
+        depth = 0
+        in_string = False
+        skip_next = False
+        array_depth = None  # 색인 중인 배열의 깊이
+        section = None
+        element_start = 0
+        key_start = 0
+        last_key = ""
+
+        with open(self.path, "rb") as f:
+            base = 0
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    return
+                data = f.read(self.CHUNK_SIZE)
+                if not data:
+                    break
+                n = len(data)
+                pos = 1 if skip_next else 0
+                skip_next = False
+                while pos < n:
+                    if in_string:
+                        m = self.INSIDE.search(data, pos)
+                        if m is None:
+                            break
+                        p = m.start()
+                        if data[p] == 0x5C:  # 백슬래시: 다음 글자는 건너뜀
+                            if p + 1 >= n:
+                                skip_next = True
+                            pos = p + 2
+                            continue
+                        in_string = False
+                        if depth == 1 and array_depth is None:
+                            last_key = self._read_key(key_start, base + p)
+                        pos = p + 1
+                        continue
+
+                    m = self.OUTSIDE.search(data, pos)
+                    if m is None:
+                        break
+                    p = m.start()
+                    c = data[p]
+                    pos = p + 1
+                    if c == 0x22:  # "
+                        in_string = True
+                        key_start = base + p + 1
+                    elif c in (0x7B, 0x5B):  # { [
+                        depth += 1
+                        if c == 0x5B and array_depth is None and depth <= 2:
+                            # 최상위 객체의 배열 값 (또는 최상위 배열)
+                            array_depth = depth
+                            section = last_key if depth == 2 else "items"
+                            self.offsets.setdefault(section, array("q"))
+                            element_start = base + p + 1
+                    elif c in (0x7D, 0x5D):  # } ]
+                        if c == 0x5D and depth == array_depth:
+                            self._add(section, element_start, base + p, closing=True)
+                            array_depth = None
+                        depth -= 1
+                    elif c == 0x2C and depth == array_depth:  # ,
+                        self._add(section, element_start, base + p)
+                        element_start = base + p + 1
+                base += n
+                self.scanned = base
+
+    def _add(self, section: str, start: int, end: int, closing: bool = False):
+        # 빈 배열의 ']' 앞 공백은 레코드가 아님
+        if closing and end - start <= 64 and not self._read_key(start, end).strip():
+            return
+        offsets = self.offsets[section]
+        offsets.append(start)
+        offsets.append(end)
+
+
+MEDIA_EXTENSIONS = {".png", ".gif", ".jpg", ".jpeg", ".webp", ".bmp", ".mp4", ".webm", ".mov"}
+TK_IMAGE_EXTENSIONS = {".png", ".gif"}  # Pillow 없이 Tk가 직접 읽을 수 있는 형식
+
+
+class ThumbnailCache:
+    """썸네일 디스크 캐시 - 원본 내용 해시를 키로 PNG 저장, 전체 크기가 max_bytes를 넘으면 오래 안 쓴 것부터 삭제
+
+    원본 해시는 (경로, 크기, 수정시간)별로 기억해 두어 다시 볼 때는 원본을 읽지 않는다.
+    마지막 사용 시각은 썸네일 파일의 수정시간으로 관리한다.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 200 * 1024 * 1024, size: int = 160):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.size = size
+        self.memo_file = self.directory / "hashes.json"
+        self._lock = threading.Lock()
+        self._memo_dirty = False
+        try:
+            with open(self.memo_file, "r", encoding="utf-8") as f:
+                self.memo: Dict[str, str] = json.load(f)
+        except (OSError, ValueError):
+            self.memo = {}
+        self.total_bytes = sum(entry.stat().st_size for entry in os.scandir(self.directory)
+                               if entry.name.endswith(".png"))
+
+    def key_for(self, source: Path) -> str:
+        """원본 내용 해시 (바뀌지 않은 파일은 기억해 둔 값 사용)"""
+        stat = source.stat()
+        memo_key = f"{source}|{stat.st_size}|{stat.st_mtime_ns}"
+        key = self.memo.get(memo_key)
+        if key is None:
+            key = file_hash(source)
+            with self._lock:
+                self.memo[memo_key] = key
+                self._memo_dirty = True
+        return key
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}_{self.size}.png"
+
+    def get(self, source: Path) -> Optional[Path]:
+        """캐시된 썸네일 경로 (없으면 None) - 사용 시각 갱신"""
+        thumb = self.path_for(self.key_for(source))
+        try:
+            os.utime(thumb)
+        except OSError:
+            return None
+        return thumb
+
+    def build(self, source: Path) -> Optional[Path]:
+        """썸네일 생성 후 경로 반환 - 작업 스레드에서 호출 (Pillow가 없거나 지원하지 않는 형식이면 None)"""
+        cached = self.get(source)
+        if cached is not None:
+            return cached
+        if Image is None:
+            return None
+        temp_thumb = None
+        try:
+            with Image.open(source) as image:
+                image.thumbnail((self.size, self.size))
+                thumb = self.path_for(self.key_for(source))
+                temp_thumb = thumb.with_name(thumb.name + ".tmp")
+                image.convert("RGBA").save(temp_thumb, "PNG")
+            os.replace(temp_thumb, thumb)
+        except Exception as e:
+            # 쓰다 만 임시 파일 삭제 (지원하지 않는 형식이면 None, 그 밖의 오류는 호출한 쪽으로)
+            if temp_thumb is not None:
+                try:
+                    temp_thumb.unlink()
+                except OSError:
+                    pass
+            if isinstance(e, (OSError, ValueError)):
+                return None
+            raise
+        self.added(thumb)
+        return thumb
+
+    def added(self, thumb: Path):
+        """새 썸네일을 캐시 크기에 반영하고 필요하면 오래 안 쓴 것부터 삭제"""
+        with self._lock:
+            self.total_bytes += thumb.stat().st_size
+            if self.total_bytes <= self.max_bytes:
+                return
+            entries = sorted((entry for entry in os.scandir(self.directory) if entry.name.endswith(".png")),
+                             key=lambda entry: entry.stat().st_mtime)
+            for entry in entries:
+                if self.total_bytes <= self.max_bytes * 0.9:
+                    break
+                try:
+                    size = entry.stat().st_size
+                    os.unlink(entry.path)
+                    self.total_bytes -= size
+                except OSError:
+                    pass
+
+    def save_memo(self):
+        """원본 해시 기억 저장 (바뀐 내용이 있을 때만)"""
+        with self._lock:
+            if not self._memo_dirty:
+                return
+            temp_memo = self.memo_file.with_name("hashes.json.tmp")
+            with open(temp_memo, "w", encoding="utf-8") as f:
+                json.dump(self.memo, f, ensure_ascii=False)
+            os.replace(temp_memo, self.memo_file)
+            self._memo_dirty = False
+
+
+class RunHistory:
+    """실행 기록 DB (SQLite) - 정리/이동 실행마다 단계별 시간, 검색한 파일 수, 복사/생략한 바이트, 오류 저장"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    duration REAL NOT NULL,
+                    phases TEXT NOT NULL,
+                    files_scanned INTEGER NOT NULL DEFAULT 0,
+                    bytes_copied INTEGER NOT NULL DEFAULT 0,
+                    bytes_skipped INTEGER NOT NULL DEFAULT 0,
+                    errors TEXT NOT NULL,
+                    success INTEGER NOT NULL
+                )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_kind_started ON runs (kind, started_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스레드마다 따로 연결 (GUI 스레드와 작업 스레드가 함께 사용)
+        conn = sqlite3.connect(str(self.path), timeout=5)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record(self, kind: str, started_at: datetime, duration: float, phases: Dict[str, float],
+               files_scanned: int = 0, bytes_copied: int = 0, bytes_skipped: int = 0,
+               errors: Optional[List[str]] = None, success: bool = True) -> int:
+        """실행 하나 기록, 기록 id 반환"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (kind, started_at, duration, phases, files_scanned, bytes_copied,"
+                " bytes_skipped, errors, success) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, started_at.isoformat(timespec="seconds"), duration,
+                 json.dumps(phases, ensure_ascii=False), files_scanned, bytes_copied, bytes_skipped,
+                 json.dumps(errors or [], ensure_ascii=False), int(success)))
+            return cursor.lastrowid
+
+    def recent(self, limit: int = 50, kind: Optional[str] = None) -> List[Dict]:
+        """최근 실행 목록 (최신순)"""
+        query = "SELECT * FROM runs"
+        params: Tuple = ()
+        if kind:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        query += " ORDER BY id DESC LIMIT ?"
+        with self._connect() as conn:
+            rows = conn.execute(query, params + (limit,)).fetchall()
+        runs = []
+        for row in rows:
+            run = dict(row)
+            run["phases"] = json.loads(run["phases"])
+            run["errors"] = json.loads(run["errors"])
+            run["success"] = bool(run["success"])
+            runs.append(run)
+        return runs
+
+    def durations(self, kind: str, limit: int = 200) -> List[float]:
+        """최근 실행 소요 시간 (오래된 것부터)"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT duration FROM runs WHERE kind = ? ORDER BY id DESC LIMIT ?",
+                                (kind, limit)).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def summary(self, kind: str, limit: int = 200, recent_count: int = 10) -> Dict:
+        """소요 시간 백분위수와 추세 (최근 recent_count회 중앙값 / 그 이전 중앙값)"""
+        values = self.durations(kind, limit)
+        if not values:
+            return {"count": 0}
+        ordered = sorted(values)
+
+        def percentile(p: float) -> float:
+            # nearest-rank 방식
+            rank = max(1, math.ceil(p / 100 * len(ordered)))
+            return ordered[min(rank, len(ordered)) - 1]
+
+        def median(items: List[float]) -> Optional[float]:
+            if not items:
+                return None
+            items = sorted(items)
+            middle = len(items) // 2
+            return items[middle] if len(items) % 2 else (items[middle - 1] + items[middle]) / 2
+
+        recent = median(values[-recent_count:])
+        baseline = median(values[:-recent_count])
+        return {
+            "count": len(values),
+            "p50": percentile(50),
+            "p90": percentile(90),
+            "p99": percentile(99),
+            "max": ordered[-1],
+            "recent_median": recent,
+            "baseline_median": baseline,
+            "trend": recent / baseline if baseline else None,
+        }
+
 
 class FileOrganizer:
     def __init__(self, config_file: str = "file_organizer_config.json"):
         self.config_file = config_file
-        self.setup_logging()  # 먼저 로깅 설정
+        self.scan_timings: Dict[str, float] = {}
+        self.history: Optional[RunHistory] = None  # 실행 기록 DB (처음 기록할 때 연결)
+        self.setup_logging()  # 먼저 로깅 설정 (리스너 시작 전 로그는 큐에 보관됨)
         self.config = self.load_config()  # 그 다음 설정 로드
+        self._backend = None
+        self._backend_override: Optional[str] = None  # 이번 실행에만 쓰는 백엔드 (backend_verify 불일치 시)
+        self.log_file = start_log_listener(
+            max_bytes=int(self.config["log_max_bytes"]),
+            backup_count=int(self.config["log_backup_count"]),
+            json_lines=bool(self.config["log_json"]),
+        )
 
     def setup_logging(self):
         """로깅 설정"""
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-
-        log_file = log_dir / f"file_organizer_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+        # 인스턴스를 여러 번 만들어도 핸들러는 하나만 연결
+        if not any(isinstance(h, logging.handlers.QueueHandler) for h in self.logger.handlers):
+            self.logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
-        self.logger = logging.getLogger(__name__)
         self.logger.info("=== Sora Auto Save 파일 정리 프로그램 시작 ===")
 
     def load_config(self) -> Dict:
         """설정 파일 로드"""
         default_config = {
             "download_folder": str(Path.home() / "Downloads"),
+            "download_folders": [],  # 추가로 검색할 다운로드 폴더 목록
             "target_folder": str(Path.cwd() / "organized_files"),
             "file_pattern": "sora_auto_save_*.json",
             "output_filename": "sora_latest_data.json",
             "backup_old_files": True,
             "backup_folder": str(Path.cwd() / "backup"),
             "auto_run_interval": 300,  # 5분
-            "max_backup_files": 10
+            "max_backup_files": 10,
+            "max_scan_workers": 8,  # 폴더 동시 검색 스레드 수
+            "backend": "fast",  # 검색/복사 방식: fast(scandir, 커널 복사) / legacy(glob, copy2)
+            "backend_verify": False,  # 실행 전에 모든 백엔드로 검색/복사해 결과가 같은지 확인
+            "journal_file": str(Path("logs") / "organizer_journal.jsonl"),  # 작업 의도 기록
+            "max_move_workers": 4,  # 이동 설정 동시 실행 수 (대상 드라이브별)
+            "sync_enabled": True,  # 이동 설정: 바뀐 파일만 복사 (동기화 기록 사용)
+            "sync_hash": False,  # 수정시간만 바뀐 파일은 내용 해시로 비교
+            "sync_mirror_deletes": False,  # 원본에서 지워진 파일의 복사본도 삭제
+            "manifest_dir": str(Path("logs") / "manifests"),  # 이동 설정별 동기화 기록 폴더
+            "history_enabled": True,  # 실행 기록 DB 사용
+            "history_db": str(Path("logs") / "run_history.db"),  # 실행 기록 DB (SQLite)
+            "version_history": True,  # backup/rename 모드: 덮어쓰는 파일을 버전 기록(.versions)에 저장
+            "version_snapshot_every": 20,  # 버전 기록 - 이 수마다 전체 스냅샷, 나머지는 차이만 저장
+            "version_max_count": 500,  # 버전 기록 - 파일당 최대 버전 수
+            "plan_copy_mb_per_s": 100,  # 실행 계획 예상 시간 계산용 복사 속도
+            "plan_op_overhead_ms": 2,  # 실행 계획 예상 시간 계산용 작업당 고정 비용
+            "profile_enabled": False,  # 단계별 프로파일링
+            "profile_cprofile": True,  # 단계별 .prof 파일 저장
+            "profile_memory": True,  # tracemalloc 최대 메모리 측정
+            "profile_dir": "profiles",
+            "log_max_bytes": 5 * 1024 * 1024,  # 로그 파일 하나의 최대 크기
+            "log_backup_count": 5,  # 보관할 순환 로그 파일 수
+            "log_json": False  # JSON Lines 형식으로 기록
         }
 
         if os.path.exists(self.config_file):
@@ -79,15 +1831,66 @@ class FileOrganizer:
         except Exception as e:
             self.logger.error(f"설정 파일 저장 실패: {e}")
 
+    @property
+    def backend(self):
+        """설정의 검색/복사 백엔드 (설정이 바뀌면 새로 생성, 실행 중 대체 백엔드가 있으면 그것)"""
+        name = self._backend_override or self.config.get("backend", "fast")
+        if self._backend is None or self._backend.name != name:
+            self._backend = get_backend(name)
+        return self._backend
+
+    def get_source_folders(self) -> List[Path]:
+        """검색할 다운로드 폴더 목록 (중복 제거, 순서 유지)"""
+        folders = [self.config["download_folder"]]
+        extra = self.config.get("download_folders") or []
+        if isinstance(extra, str):
+            extra = [extra]
+        folders.extend(extra)
+
+        result = []
+        seen = set()
+        for folder in folders:
+            if not folder:
+                continue
+            path = Path(folder)
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                result.append(path)
+        return result
+
+    def _scan_folder(self, folder: Path, pattern: str) -> Tuple[List[Path], float]:
+        """폴더 하나 검색 (파일 목록, 소요 시간)"""
+        start = time.perf_counter()
+        try:
+            files = self.backend.scan(folder, pattern)
+        except OSError as e:
+            self.logger.error(f"폴더 검색 실패: {folder} - {e}")
+            files = []
+        return files, time.perf_counter() - start
+
     def find_files(self, pattern: str) -> List[Path]:
-        """패턴에 맞는 파일들 찾기"""
-        download_path = Path(self.config["download_folder"])
-        search_pattern = download_path / pattern
+        """패턴에 맞는 파일들 찾기 (여러 다운로드 폴더를 동시에 검색)"""
+        folders = self.get_source_folders()
+        self.scan_timings = {}
+
+        for folder in folders:
+            self.logger.info(f"파일 검색 패턴: {folder / pattern}")
 
-        self.logger.info(f"파일 검색 패턴: {search_pattern}")
+        if len(folders) == 1:
+            scans = [self._scan_folder(folders[0], pattern)]
+        else:
+            # 느린 폴더(네트워크 드라이브 등)가 다른 폴더 검색을 지연시키지 않도록 병렬 처리
+            workers = max(1, min(len(folders), int(self.config.get("max_scan_workers", 8))))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+                scans = list(pool.map(lambda folder: self._scan_folder(folder, pattern), folders))
 
-        files = list(Path(download_path).glob(pattern))
-        files = [f for f in files if f.is_file()]
+        files = []
+        for folder, (folder_files, seconds) in zip(folders, scans):
+            self.scan_timings[str(folder)] = seconds
+            files.extend(folder_files)
+            if len(folders) > 1:
+                self.logger.info(f"  {folder}: {len(folder_files)}개 ({seconds * 1000:.1f}ms)")
 
         self.logger.info(f"발견된 파일 수: {len(files)}")
         for file in files:
@@ -101,10 +1904,11 @@ class FileOrganizer:
             return None
 
         # 파일 수정 시간 기준으로 정렬
-        latest_file = max(files, key=lambda x: x.stat().st_mtime)
+        backend = self.backend
+        latest_file = max(files, key=backend.mtime)
 
         self.logger.info(f"최신 파일: {latest_file.name}")
-        self.logger.info(f"수정 시간: {datetime.fromtimestamp(latest_file.stat().st_mtime)}")
+        self.logger.info(f"수정 시간: {datetime.fromtimestamp(backend.mtime(latest_file))}")
 
         return latest_file
 
@@ -134,13 +1938,13 @@ class FileOrganizer:
             return False
 
     def copy_file(self, source: Path, target: Path) -> bool:
-        """파일 복사"""
+        """파일 복사 (임시 파일에 복사한 뒤 교체하여 대상이 중간 상태로 남지 않게 함)"""
         try:
             # 대상 폴더 생성
             target.parent.mkdir(parents=True, exist_ok=True)
 
             # 파일 복사
-            shutil.copy2(source, target)
+            copy_via_temp(self.backend.copy, source, target)
 
             self.logger.info(f"파일 복사 완료: {source.name} → {target}")
             return True
@@ -149,102 +1953,611 @@ class FileOrganizer:
             self.logger.error(f"파일 복사 실패: {source.name} → {target} - {e}")
             return False
 
-    def backup_old_files(self, files: List[Path]):
-        """기존 파일들을 백업 폴더로 이동"""
+    def plan_backup_moves(self, files: List[Path]) -> List[Tuple[Path, Path]]:
+        """백업 폴더로 옮길 (원본, 백업 경로) 목록 계산 - 이름이 겹치지 않게 미리 예약"""
+        backup_path = Path(self.config["backup_folder"])
+        reserved = set()
+        moves = []
+
+        for file in files:
+            backup_file = backup_path / file.name
+
+            # 백업 파일이 이미 존재하면 이름 변경 (기본 이름과 시작 번호는 한 번만 계산)
+            if backup_file.exists() or backup_file in reserved:
+                name_parts = file.stem.rsplit('_', 1)
+                if len(name_parts) > 1 and name_parts[1].isdigit():
+                    base_name = name_parts[0]
+                    counter = int(name_parts[1]) + 1
+                else:
+                    base_name = file.stem
+                    counter = 1
+
+                while backup_file.exists() or backup_file in reserved:
+                    backup_file = backup_path / f"{base_name}_{counter}{file.suffix}"
+                    counter += 1
+
+            reserved.add(backup_file)
+            moves.append((file, backup_file))
+
+        return moves
+
+    def plan_backup_cleanup(self, incoming: Optional[List[Tuple[Path, Path]]] = None) -> List[Path]:
+        """최대 백업 파일 수를 넘는 오래된 백업 파일 목록 (incoming: 곧 백업될 파일 포함)"""
+        backup_path = Path(self.config["backup_folder"])
+        if not backup_path.exists() and not incoming:
+            return []
+
+        # (수정 시간, 백업 후 경로) - 이동은 수정 시간을 유지하므로 원본 기준으로 계산
+        entries = []
+        if backup_path.exists():
+            for file in backup_path.glob("*.json"):
+                try:
+                    entries.append((file.stat().st_mtime, file))
+                except OSError:
+                    continue
+        for source, backup_file in incoming or []:
+            if backup_file.suffix == ".json":
+                try:
+                    entries.append((source.stat().st_mtime, backup_file))
+                except OSError:
+                    continue
+
+        entries.sort(key=lambda x: x[0], reverse=True)
+        max_files = self.config["max_backup_files"]
+        return [file for _, file in entries[max_files:]]
+
+    def backup_old_files(self, files: List[Path]) -> int:
+        """기존 파일들을 백업 폴더로 이동 (이동한 파일 수 반환)"""
         if not self.config["backup_old_files"]:
-            return
+            return 0
 
         backup_path = Path(self.config["backup_folder"])
         backup_path.mkdir(parents=True, exist_ok=True)
 
         self.logger.info(f"백업 폴더: {backup_path}")
 
-        for file in files:
+        moved = 0
+        for source, backup_file in self.plan_backup_moves(files):
+            if self.apply_step({"op": "move", "src": str(source), "dst": str(backup_file)}) == "done":
+                moved += 1
+        return moved
+
+    def cleanup_old_backups(self) -> int:
+        """오래된 백업 파일 정리 (삭제한 파일 수 반환)"""
+        deleted = 0
+        for file in self.plan_backup_cleanup():
+            if self.apply_step({"op": "delete", "src": str(file)}) == "done":
+                deleted += 1
+        return deleted
+
+    def apply_step(self, step: Dict) -> str:
+        """작업 단계 하나 실행 - 이미 끝난 단계는 다시 하지 않음 ("done" / "skipped" / "failed")"""
+        op = step["op"]
+        source = Path(step["src"])
+
+        if op == "copy":
+            target = Path(step["dst"])
+            if not source.exists():
+                self.logger.warning(f"복사할 원본이 없어 건너뜀: {source}")
+                return "skipped"
+            return "done" if self.copy_file(source, target) else "failed"
+
+        if op == "move":
+            backup_file = Path(step["dst"])
+            if not source.exists():
+                if backup_file.exists():
+                    return "done"  # 이전 실행에서 이미 이동됨
+                self.logger.warning(f"백업할 원본이 없어 건너뜀: {source}")
+                return "skipped"
             try:
-                backup_file = backup_path / file.name
-
-                # 백업 파일이 이미 존재하면 이름 변경
-                counter = 1
-                while backup_file.exists():
-                    name_parts = file.stem.rsplit('_', 1)
-                    if len(name_parts) > 1 and name_parts[1].isdigit():
-                        base_name = name_parts[0]
-                        counter = int(name_parts[1]) + 1
-                    else:
-                        base_name = file.stem
+                backup_file.parent.mkdir(parents=True, exist_ok=True)
+                if backup_file.exists():
+                    # 예약된 이름이므로 중단된 이동(드라이브 간 복사)이 남긴 파일
+                    backup_file.unlink()
+                shutil.move(str(source), str(backup_file))
+                self.logger.info(f"백업 완료: {source.name} → {backup_file.name}")
+                return "done"
+            except Exception as e:
+                self.logger.error(f"백업 실패: {source.name} - {e}")
+                return "failed"
 
-                    backup_file = backup_path / f"{base_name}_{counter}{file.suffix}"
-                    counter += 1
+        if op == "delete":
+            if not source.exists():
+                return "done"
+            try:
+                source.unlink()
+                self.logger.info(f"오래된 백업 파일 삭제: {source.name}")
+                return "done"
+            except Exception as e:
+                self.logger.error(f"백업 파일 삭제 실패: {source.name} - {e}")
+                return "failed"
+
+        if op == "version":
+            if not source.exists():
+                return "done"
+            try:
+                store = VersionStore(source, snapshot_every=int(self.config.get("version_snapshot_every", 20)),
+                                     max_versions=int(self.config.get("version_max_count", 500)))
+                entry = store.add()
+                if entry:
+                    self.logger.info(f"버전 기록 저장: {source.name} v{entry['version']} ({entry['kind']})")
+                return "done"
+            except Exception as e:
+                self.logger.error(f"버전 기록 실패: {source.name} - {e}")
+                return "failed"
+
+        self.logger.warning(f"알 수 없는 작업 단계: {op}")
+        return "skipped"
+
+    def resume_journal(self) -> int:
+        """이전 실행이 중단되었으면 남은 단계만 이어서 실행 (실행한 단계 수 반환)"""
+        journal = OperationJournal(self.config["journal_file"])
+        state = journal.load()
+        if state is None:
+            return 0
+
+        pending = [i for i in range(len(state["steps"])) if i not in state["finished"]]
+        if not pending:
+            journal.clear()
+            return 0
+
+        self.logger.warning(f"중단된 정리 작업 발견 ({state['run_id']}): 남은 단계 {len(pending)}개를 이어서 실행합니다.")
+        copy_failed = False
+        for index in pending:
+            step = state["steps"][index]
+            if copy_failed and step["op"] != "copy":
+                # 대상 파일 갱신에 실패했으면 원본을 백업하지 않고 되돌림
+                journal.mark(index, "cancelled")
+                continue
+            status = self.apply_step(step)
+            journal.mark(index, status)
+            if step["op"] == "copy" and status != "done":
+                copy_failed = True
+
+        journal.clear()
+        return len(pending)
+
+    def verify_backends(self) -> Dict:
+        """모든 백엔드로 같은 폴더를 검색하고 최신 파일을 임시 폴더에 복사하여 결과가 같은지 확인"""
+        pattern = self.config["file_pattern"]
+        folders = self.get_source_folders()
+        results = {}
+        with tempfile.TemporaryDirectory(prefix="sora_verify_") as temp_dir:
+            for name in BACKENDS:
+                backend = get_backend(name)
+                start = time.perf_counter()
+                files = sorted(f for folder in folders for f in backend.scan(folder, pattern))
+                latest = max(files, key=backend.mtime) if files else None
+                scan_seconds = time.perf_counter() - start
+
+                copy_hash, copy_mtime, copy_seconds = None, None, 0.0
+                if latest is not None:
+                    target = Path(temp_dir) / name / latest.name
+                    target.parent.mkdir()
+                    start = time.perf_counter()
+                    backend.copy(latest, target)
+                    copy_seconds = time.perf_counter() - start
+                    copy_hash = file_hash(target)
+                    copy_mtime = target.stat().st_mtime
+                results[name] = {
+                    "files": [str(f) for f in files],
+                    "latest": str(latest) if latest else None,
+                    "copy_hash": copy_hash,
+                    "copy_mtime": copy_mtime,
+                    "scan_seconds": scan_seconds,
+                    "copy_seconds": copy_seconds,
+                }
+
+        differences = []
+        names = list(results)
+        base = results[names[0]]
+        for name in names[1:]:
+            for key in ("files", "latest", "copy_hash", "copy_mtime"):
+                if results[name][key] != base[key]:
+                    differences.append(f"{key}: {names[0]}={base[key]!r:.200} / {name}={results[name][key]!r:.200}")
+
+        for name, info in results.items():
+            self.logger.info(f"백엔드 {name}: 파일 {len(info['files'])}개, 검색 {info['scan_seconds'] * 1000:.1f}ms, "
+                             f"복사 {info['copy_seconds'] * 1000:.1f}ms")
+        if differences:
+            for line in differences:
+                self.logger.warning(f"백엔드 결과 불일치 - {line}")
+        else:
+            self.logger.info("백엔드 결과 일치")
+        return {"match": not differences, "backends": results, "differences": differences}
+
+    def select_valid_file(self, files: List[Path]) -> Tuple[Optional[Path], List[Path]]:
+        """가장 최신의 유효한 파일과 백업 대상 파일 목록 반환
+
+        유효하지 않은 더 최신 파일은 아직 다운로드 중일 수 있으므로 백업 대상에서 제외한다.
+        """
+        candidates = sorted(files, key=self.backend.mtime, reverse=True)
+        skipped = []
+        for candidate in candidates:
+            if self.validate_json_file(candidate):
+                if skipped:
+                    self.logger.warning(f"유효하지 않은 최신 파일 {len(skipped)}개를 건너뜀")
+                return candidate, [f for f in files if f not in skipped]
+            skipped.append(candidate)
+        return None, files
+
+    def build_organize_steps(self, latest_file: Path, files: List[Path], cleanup: bool = True) -> List[Dict]:
+        """정리 작업 단계 목록 (복사 → 백업 이동 → 오래된 백업 삭제, cleanup=False이면 삭제 없음)"""
+        target_path = Path(self.config["target_folder"]) / self.config["output_filename"]
+        backup_enabled = self.config["backup_old_files"]
+        moves = self.plan_backup_moves(files) if backup_enabled else []
+        deletes = self.plan_backup_cleanup(moves) if backup_enabled and cleanup else []
+
+        steps = [{"op": "copy", "src": str(latest_file), "dst": str(target_path)}]
+        steps += [{"op": "move", "src": str(source), "dst": str(backup_file)} for source, backup_file in moves]
+        steps += [{"op": "delete", "src": str(file)} for file in deletes]
+        return steps
+
+    def plan_move_rule(self, rule: Dict, index: Optional[SourceIndex] = None) -> List[Dict]:
+        """이동 설정 하나의 작업 단계 (execute_file_move_sync와 같은 파일 선택)"""
+        if not rule["source"] or not rule["target"]:
+            return []
+        if index is None:
+            index = SourceIndex([rule])
+
+        # 파일명이 있으면 일치하는 파일, 없으면 소스 폴더의 가장 최신 파일
+        selected = index.match(rule)
+        if selected is None:
+            return []
+        return [{"op": "copy", "src": str(selected["path"]), "dst": str(Path(rule["target"]) / selected["name"])}]
+
+    def plan_save_to_organized(self, source_dir: str, target_dir: str, filename_pattern: str,
+                               cleanup_mode: str) -> List[Dict]:
+        """소스 폴더 전체를 대상 폴더로 저장하는 작업 단계 (save_files_to_organized_folder와 동일)"""
+        source_path = Path(source_dir)
+        target_path = Path(target_dir)
+        if not source_path.exists():
+            return []
+
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        template = compile_template(filename_pattern) if filename_pattern else None
+        allocator = acquire_name_allocator(target_path)
+        steps = []
+        try:
+            for file_path in source_path.iterdir():
+                if not file_path.is_file():
+                    continue
+                if template:
+                    target_file = target_path / allocator.allocate(template, file_path, now)
+                else:
+                    target_file = target_path / allocator.reserve(file_path.name)
+
+                # 기존 파일 처리 (정리 모드, 버전 기록을 쓰면 덮어쓰기 전에 버전으로 저장)
+                if target_file.exists():
+                    if cleanup_mode in ("backup", "rename") and self.config.get("version_history", True):
+                        steps.append({"op": "version", "src": str(target_file)})
+                    elif cleanup_mode == "backup":
+                        steps.append({"op": "move", "src": str(target_file),
+                                      "dst": str(target_file.with_suffix(f'.backup_{timestamp}'))})
+                    elif cleanup_mode == "delete":
+                        steps.append({"op": "delete", "src": str(target_file)})
+                    elif cleanup_mode == "rename":
+                        steps.append({"op": "move", "src": str(target_file),
+                                      "dst": str(target_file.with_suffix(f'.old_{timestamp}'))})
+
+                steps.append({"op": "copy", "src": str(file_path), "dst": str(target_file)})
+        finally:
+            release_name_allocator(allocator)
+        return steps
+
+    def estimate_step(self, step: Dict) -> Dict:
+        """작업 단계에 바이트 수와 예상 시간 추가"""
+        source = Path(step["src"])
+        try:
+            size = source.stat().st_size
+        except OSError:
+            size = 0
+
+        overhead = float(self.config.get("plan_op_overhead_ms", 2)) / 1000
+        throughput = max(1.0, float(self.config.get("plan_copy_mb_per_s", 100))) * 1024 * 1024
+
+        if step["op"] == "copy":
+            data_bytes = size
+        elif step["op"] == "move":
+            # 같은 드라이브 안에서의 이동은 이름 변경이므로 데이터 복사가 없다
+            same_device = _device_of(source) == _device_of(Path(step["dst"]).parent)
+            data_bytes = 0 if same_device else size
+        else:
+            data_bytes = 0
+
+        estimated = dict(step)
+        estimated["bytes"] = data_bytes
+        estimated["estimated_seconds"] = round(overhead + data_bytes / throughput, 6)
+        return estimated
+
+    def create_plan(self, include_moves: bool = True, include_save: bool = False) -> Dict:
+        """실제로 실행하지 않고 전체 작업 계획 계산 (JSON으로 저장 후 나중에 그대로 실행 가능)"""
+        operations = []
+
+        # 파일 정리 (organize_files)
+        files = self.find_files(self.config["file_pattern"])
+        if files:
+            latest_file, files = self.select_valid_file(files)
+            if latest_file:
+                for step in self.build_organize_steps(latest_file, files):
+                    operations.append(dict(step, group="organize"))
+
+        rules = [rule for rule in get_move_rules(self.config) if rule["enabled"]]
+
+        # 활성화된 이동 설정 (execute_enabled_moves)
+        if include_moves:
+            index = SourceIndex(rules)
+            for rule in rules:
+                for step in self.plan_move_rule(rule, index):
+                    operations.append(dict(step, group=rule["name"]))
+
+        # 파일 정리 옵션으로 저장 (save_files_to_organized_folder)
+        if include_save:
+            cleanup_mode = self.config.get("cleanup_mode", "delete")
+            for rule in rules:
+                steps = self.plan_save_to_organized(rule["source"], self.config["target_folder"],
+                                                    rule["filename"], cleanup_mode)
+                for step in steps:
+                    operations.append(dict(step, group=f"save:{rule['name']}"))
+
+        operations = [self.estimate_step(step) for step in operations]
+        return {
+            "version": 1,
+            "created_at": datetime.now().isoformat(),
+            "config_file": self.config_file,
+            "operations": operations,
+            "summary": {
+                "operations": len(operations),
+                "copy": sum(1 for op in operations if op["op"] == "copy"),
+                "move": sum(1 for op in operations if op["op"] == "move"),
+                "delete": sum(1 for op in operations if op["op"] == "delete"),
+                "version": sum(1 for op in operations if op["op"] == "version"),
+                "bytes": sum(op["bytes"] for op in operations),
+                "estimated_seconds": round(sum(op["estimated_seconds"] for op in operations), 3),
+            },
+        }
+
+    def execute_plan(self, plan: Dict, progress_callback: Optional[Callable[[str, str], None]] = None,
+                     progress_stats: Optional[Callable[[Dict], None]] = None,
+                     cancel_event: Optional[threading.Event] = None) -> Dict:
+        """저장된 작업 계획을 다시 검색하지 않고 그대로 실행 (중단 시 이어서 실행 가능하도록 기록)
+
+        cancel_event가 설정되면 작업 사이에서 멈추고 남은 작업은 실행하지 않는다.
+        """
+        operations = plan.get("operations", [])
+        result = {"success": True, "done": 0, "skipped": 0, "failed": 0, "bytes": 0, "total_time": 0.0,
+                  "cancelled": False}
+        tracker = ProgressTracker(len(operations), sum(op.get("bytes", 0) for op in operations), progress_stats)
+        start = time.perf_counter()
+
+        # 이전에 중단된 작업이 있으면 먼저 마무리
+        self.resume_journal()
 
-                shutil.move(str(file), str(backup_file))
-                self.logger.info(f"백업 완료: {file.name} → {backup_file.name}")
+        journal = OperationJournal(self.config["journal_file"])
+        journal.begin([{key: op[key] for key in ("op", "src", "dst") if key in op} for op in operations])
+        for index, op in enumerate(operations):
+            if cancel_event is not None and cancel_event.is_set():
+                result["cancelled"] = True
+                self.logger.warning(f"작업 계획 실행 취소: {len(operations) - index}개 작업 남음")
+                self._report(progress_callback, "cancel", f"취소됨 - 남은 작업 {len(operations) - index}개는 실행하지 않음")
+                break
+            status = self.apply_step(op)
+            journal.mark(index, status)
+            result[status] = result.get(status, 0) + 1
+            if status == "done":
+                result["bytes"] += op.get("bytes", 0)
+            tracker.advance(1, op.get("bytes", 0))
+            self._report(progress_callback, op.get("group", op["op"]),
+                         f"[{index + 1}/{len(operations)}] {op['op']} {Path(op['src']).name}: {status}")
+        journal.clear()
 
+        result["success"] = result["failed"] == 0 and not result["cancelled"]
+        result["total_time"] = time.perf_counter() - start
+        return result
+
+    def get_history(self) -> Optional[RunHistory]:
+        """실행 기록 DB (history_enabled가 꺼져 있으면 None)"""
+        if not self.config.get("history_enabled", True):
+            return None
+        path = self.config.get("history_db", str(Path("logs") / "run_history.db"))
+        if self.history is None or str(self.history.path) != str(Path(path)):
+            self.history = RunHistory(path)
+        return self.history
+
+    def record_run(self, kind: str, started_at: datetime, duration: float, phases: Dict[str, float], **fields):
+        """실행 기록 저장 (기록 실패는 실행 결과에 영향 없음)"""
+        try:
+            history = self.get_history()
+            if history is not None:
+                history.record(kind, started_at, duration, phases, **fields)
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"실행 기록 저장 실패: {e}")
+
+    def _report(self, progress_callback: Optional[Callable[[str, str], None]], phase: str, message: str):
+        """진행 상황 콜백 호출"""
+        if progress_callback:
+            try:
+                progress_callback(phase, message)
             except Exception as e:
-                self.logger.error(f"백업 실패: {file.name} - {e}")
+                self.logger.warning(f"진행 콜백 오류: {e}")
 
-    def cleanup_old_backups(self):
-        """오래된 백업 파일 정리"""
-        backup_path = Path(self.config["backup_folder"])
-        if not backup_path.exists():
-            return
+    def run(self, progress_callback: Optional[Callable[[str, str], None]] = None,
+            profiler: Optional[PhaseProfiler] = None,
+            progress_stats: Optional[Callable[[Dict], None]] = None,
+            cancel_event: Optional[threading.Event] = None, cleanup: bool = True) -> Dict:
+        """파일 정리 실행 (엔진 API) - 구조화된 결과 반환
 
-        # 백업 파일들을 수정 시간 순으로 정렬
-        backup_files = list(backup_path.glob("*.json"))
-        backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        progress_callback(phase, message)는 각 단계가 끝날 때마다 호출된다.
+        profiler를 넘기지 않으면 설정(profile_enabled 등)으로 새로 만든다.
+        progress_stats(info)에는 복사/백업/삭제 작업의 처리 수, 바이트, 남은 시간이 전달된다 (ProgressTracker).
+        cancel_event가 설정되면 파일 사이에서 멈춘다. 끝난 작업은 그대로 두고 남은 작업은 다음 실행에서
+        이어서 하지 않는다 (복사는 임시 파일을 거치므로 반쯤 복사된 파일은 남지 않음).
+        cleanup=False이면 max_backup_files를 넘는 오래된 백업을 지우지 않는다 (복사와 백업만).
+        """
+        if profiler is None:
+            profiler = PhaseProfiler.from_config(self.config)
 
-        # 최대 백업 파일 수를 초과하는 파일들 삭제
-        max_files = self.config["max_backup_files"]
-        if len(backup_files) > max_files:
-            files_to_delete = backup_files[max_files:]
+        result = {
+            "success": False,
+            "message": "",
+            "files_found": [],
+            "latest_file": None,
+            "target_path": None,
+            "bytes_copied": 0,
+            "backed_up": 0,
+            "deleted_backups": 0,
+            "resumed_steps": 0,
+            "cancelled": False,
+            "backend": self.backend.name,
+            "backend_verify": None,
+            "timings": {},
+            "folder_timings": {},
+            "profile": {},
+            "total_time": 0.0,
+        }
+        run_start = time.perf_counter()
+        started_at = datetime.now()
 
-            for file in files_to_delete:
-                try:
-                    file.unlink()
-                    self.logger.info(f"오래된 백업 파일 삭제: {file.name}")
-                except Exception as e:
-                    self.logger.error(f"백업 파일 삭제 실패: {file.name} - {e}")
+        def finish(success: bool, message: str) -> Dict:
+            self._backend_override = None
+            result["success"] = success
+            result["message"] = message
+            result["total_time"] = time.perf_counter() - run_start
+            result["timings"] = profiler.timings
+            if profiler.enabled:
+                result["profile"] = profiler.finish()
+            self.record_run("organize", started_at, result["total_time"], result["timings"],
+                            files_scanned=len(result["files_found"]), bytes_copied=result["bytes_copied"],
+                            errors=[] if success else [message], success=success)
+            self._report(progress_callback, "done", message)
+            return result
+
+        def cancelled(journal: Optional[OperationJournal] = None) -> bool:
+            if cancel_event is None or not cancel_event.is_set():
+                return False
+            if journal is not None:
+                journal.clear()
+            result["cancelled"] = True
+            self.logger.warning("파일 정리가 취소되었습니다.")
+            return True
 
-    def organize_files(self) -> bool:
-        """파일 정리 메인 함수"""
         try:
             self.logger.info("=== 파일 정리 시작 ===")
 
+            # 0. 이전 실행이 중단되었으면 남은 단계 마무리
+            result["resumed_steps"] = self.resume_journal()
+            if result["resumed_steps"]:
+                self._report(progress_callback, "resume", f"중단된 작업 {result['resumed_steps']}단계를 이어서 완료")
+
+            # 백엔드 검증 (설정 시) - 결과가 다르면 기존 방식으로 실행
+            if self.config.get("backend_verify"):
+                result["backend_verify"] = self.verify_backends()
+                if not result["backend_verify"]["match"] and self.backend.name != "legacy":
+                    self._backend_override = "legacy"  # 설정은 바꾸지 않음 (다음 실행에서 다시 검증)
+                    result["backend"] = "legacy"
+                    self._report(progress_callback, "verify", "백엔드 결과가 달라 기존 방식(legacy)으로 실행합니다.")
+
             # 1. 파일 찾기
-            files = self.find_files(self.config["file_pattern"])
+            with profiler.phase("find"):
+                files = self.find_files(self.config["file_pattern"])
+            result["files_found"] = [str(f) for f in files]
+            result["folder_timings"] = dict(self.scan_timings)
+            self._report(progress_callback, "find", f"발견된 파일 수: {len(files)}")
 
             if not files:
                 self.logger.warning("정리할 파일이 없습니다.")
-                return False
+                return finish(False, "정리할 파일이 없습니다.")
+            if cancelled():
+                return finish(False, "사용자가 파일 정리를 취소했습니다.")
 
             # 2. 최신 파일 찾기
-            latest_file = self.get_latest_file(files)
+            with profiler.phase("latest"):
+                latest_file = self.get_latest_file(files)
             if not latest_file:
                 self.logger.error("최신 파일을 찾을 수 없습니다.")
-                return False
+                return finish(False, "최신 파일을 찾을 수 없습니다.")
+            self._report(progress_callback, "latest", f"최신 파일: {latest_file.name}")
 
-            # 3. JSON 파일 유효성 검사
-            if not self.validate_json_file(latest_file):
+            # 3. JSON 파일 유효성 검사 (최신 파일이 유효하지 않으면 그 다음 최신 파일)
+            with profiler.phase("validate"):
+                latest_file, files = self.select_valid_file(files)
+            if not latest_file:
                 self.logger.error("최신 파일이 유효하지 않습니다.")
-                return False
+                return finish(False, "최신 파일이 유효하지 않습니다.")
+            result["latest_file"] = str(latest_file)
+            self._report(progress_callback, "validate", f"JSON 파일 유효성 검사 통과: {latest_file.name}")
 
-            # 4. 대상 폴더에 복사
+            # 4. 작업 계획 기록 (중단되면 다음 실행에서 남은 단계만 이어서 실행)
             target_path = Path(self.config["target_folder"]) / self.config["output_filename"]
+            result["target_path"] = str(target_path)
 
-            if self.copy_file(latest_file, target_path):
-                self.logger.info(f"파일 정리 완료: {target_path}")
+            backup_enabled = self.config["backup_old_files"]
+            steps = self.build_organize_steps(latest_file, files, cleanup)
+            move_count = sum(1 for step in steps if step["op"] == "move")
 
-                # 5. 백업 처리
-                if self.config["backup_old_files"]:
-                    self.backup_old_files(files)
-                    self.cleanup_old_backups()
+            journal = OperationJournal(self.config["journal_file"])
+            journal.begin(steps)
+            if cancelled(journal):
+                return finish(False, "사용자가 파일 정리를 취소했습니다.")
 
-                return True
-            else:
-                return False
+            def step_size(step: Dict) -> int:
+                try:
+                    return os.path.getsize(step["src"]) if step["op"] != "delete" else 0
+                except OSError:
+                    return 0
+
+            sizes = [step_size(step) for step in steps]
+            tracker = ProgressTracker(len(steps), sum(sizes), progress_stats)
+
+            # 5. 대상 폴더에 복사
+            with profiler.phase("copy"):
+                status = self.apply_step(steps[0])
+                journal.mark(0, status)
+                tracker.advance(1, sizes[0])
+            if status != "done":
+                journal.clear()
+                return finish(False, f"파일 복사 실패: {latest_file.name}")
+            result["bytes_copied"] = target_path.stat().st_size
+            self.logger.info(f"파일 정리 완료: {target_path}")
+            self._report(progress_callback, "copy", f"파일 복사 완료: {latest_file.name} → {target_path}")
+
+            # 6. 백업 처리
+            if backup_enabled:
+                self.logger.info(f"백업 폴더: {self.config['backup_folder']}")
+                with profiler.phase("backup"):
+                    for index in range(1, 1 + move_count):
+                        if cancelled(journal):
+                            return finish(False, f"사용자가 파일 정리를 취소했습니다 (백업 {result['backed_up']}개 완료).")
+                        status = self.apply_step(steps[index])
+                        journal.mark(index, status)
+                        tracker.advance(1, sizes[index])
+                        if status == "done":
+                            result["backed_up"] += 1
+                self._report(progress_callback, "backup", f"백업 완료: {result['backed_up']}개 파일")
+
+                with profiler.phase("cleanup"):
+                    for index in range(1 + move_count, len(steps)):
+                        if cancelled(journal):
+                            return finish(False, f"사용자가 파일 정리를 취소했습니다 (백업 {result['backed_up']}개 완료).")
+                        status = self.apply_step(steps[index])
+                        journal.mark(index, status)
+                        tracker.advance(1, sizes[index])
+                        if status == "done":
+                            result["deleted_backups"] += 1
+                if cleanup:
+                    self._report(progress_callback, "cleanup", f"오래된 백업 파일 정리 완료: {result['deleted_backups']}개 삭제")
+
+            journal.clear()
+            return finish(True, f"파일 정리 완료: {target_path}")
 
         except Exception as e:
             self.logger.error(f"파일 정리 중 오류 발생: {e}")
-            return False
+            return finish(False, f"파일 정리 중 오류 발생: {e}")
+
+    def organize_files(self) -> bool:
+        """파일 정리 메인 함수"""
+        return self.run()["success"]
 
     def update_config(self, **kwargs):
         """설정 업데이트"""
@@ -257,19 +2570,41 @@ class FileOrganizer:
 
         self.save_config()
 
+    def get_status(self) -> Dict:
+        """현재 설정과 다운로드 폴더 파일 목록을 구조화된 형태로 반환"""
+        files = []
+        for file in self.find_files(self.config["file_pattern"]):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            files.append({
+                "name": file.name,
+                "path": str(file),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+            })
+        files.sort(key=lambda x: x["mtime"], reverse=True)
+
+        return {
+            "config": dict(self.config),
+            "files": files,
+        }
+
     def show_status(self):
         """현재 상태 표시"""
+        status = self.get_status()
+
         self.logger.info("=== 현재 설정 ===")
-        for key, value in self.config.items():
+        for key, value in status["config"].items():
             self.logger.info(f"  {key}: {value}")
 
         # 다운로드 폴더 파일 목록
-        files = self.find_files(self.config["file_pattern"])
-        if files:
+        if status["files"]:
             self.logger.info(f"다운로드 폴더의 {self.config['file_pattern']} 파일들:")
-            for file in sorted(files, key=lambda x: x.stat().st_mtime, reverse=True):
-                mtime = datetime.fromtimestamp(file.stat().st_mtime)
-                self.logger.info(f"  - {file.name} (수정: {mtime})")
+            for file in status["files"]:
+                mtime = datetime.fromtimestamp(file["mtime"])
+                self.logger.info(f"  - {file['name']} (수정: {mtime})")
         else:
             self.logger.info("다운로드 폴더에 해당 파일이 없습니다.")
 
@@ -277,14 +2612,39 @@ def main():
     parser = argparse.ArgumentParser(description="Sora Auto Save 파일 정리 프로그램")
     parser.add_argument("--config", default="file_organizer_config.json", help="설정 파일 경로")
     parser.add_argument("--download-folder", help="다운로드 폴더 경로")
+    parser.add_argument("--extra-download-folder", action="append", help="추가 다운로드 폴더 경로 (여러 번 지정 가능)")
     parser.add_argument("--target-folder", help="대상 폴더 경로")
     parser.add_argument("--file-pattern", help="파일 패턴 (예: sora_auto_save_*.json)")
     parser.add_argument("--output-filename", help="출력 파일명")
     parser.add_argument("--status", action="store_true", help="현재 상태 표시")
     parser.add_argument("--no-backup", action="store_true", help="백업 비활성화")
+    parser.add_argument("--plan", nargs="?", const="-", metavar="FILE",
+                        help="실행하지 않고 작업 계획(JSON)만 출력 (FILE 지정 시 파일로 저장)")
+    parser.add_argument("--plan-include-save", action="store_true",
+                        help="계획에 '파일 정리 옵션으로 저장' 작업 포함")
+    parser.add_argument("--execute-plan", metavar="FILE", help="저장된 작업 계획 실행")
+    parser.add_argument("--profile", action="store_true", help="단계별 실행 시간/CPU/메모리 측정 및 .prof 파일 저장")
+    parser.add_argument("--profile-dir", help="프로파일 결과(.prof) 저장 폴더")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), help="검색/복사 방식 (설정 파일에는 저장하지 않음)")
+    parser.add_argument("--verify-backends", action="store_true",
+                        help="모든 백엔드로 검색/복사하여 결과가 같은지 확인만 하고 종료")
+    parser.add_argument("--versions", metavar="FILE", help="파일의 버전 기록 목록 표시")
+    parser.add_argument("--restore-version", nargs=2, metavar=("FILE", "VERSION"), help="파일을 특정 버전으로 복원")
+    parser.add_argument("--restore-output", metavar="FILE", help="--restore-version 결과를 저장할 파일 (기본: 원래 파일)")
 
     args = parser.parse_args()
 
+    # 버전 기록 (파일 정리 설정과 무관)
+    if args.versions:
+        for entry in VersionStore(Path(args.versions)).versions():
+            print(f"v{entry['version']:<5} {entry['created_at'][:19]}  {entry['kind']:<8} {entry['size']:>12,} bytes")
+        return
+    if args.restore_version:
+        store = VersionStore(Path(args.restore_version[0]))
+        output = store.restore(int(args.restore_version[1]), args.restore_output)
+        print(f"버전 {args.restore_version[1]} 복원: {output}")
+        return
+
     # 파일 정리기 초기화
     organizer = FileOrganizer(args.config)
 
@@ -292,6 +2652,8 @@ def main():
     config_updates = {}
     if args.download_folder:
         config_updates["download_folder"] = args.download_folder
+    if args.extra_download_folder:
+        config_updates["download_folders"] = args.extra_download_folder
     if args.target_folder:
         config_updates["target_folder"] = args.target_folder
     if args.file_pattern:
@@ -303,21 +2665,75 @@ def main():
 
     if config_updates:
         organizer.update_config(**config_updates)
+    if args.backend:
+        organizer.config["backend"] = args.backend
+
+    if args.verify_backends:
+        report = organizer.verify_backends()
+        for name, info in report["backends"].items():
+            print(f"{name:<8} 파일 {len(info['files']):>6}개  검색 {info['scan_seconds'] * 1000:8.1f}ms  "
+                  f"복사 {info['copy_seconds'] * 1000:8.1f}ms  최신: {info['latest']}")
+        if report["match"]:
+            print("✅ 모든 백엔드의 결과가 같습니다.")
+        else:
+            print("❌ 백엔드 결과가 다릅니다:")
+            for line in report["differences"]:
+                print(f"  - {line}")
+            sys.exit(1)
+        return
 
     # 상태 표시
     if args.status:
         organizer.show_status()
         return
 
+    # 작업 계획 (드라이런)
+    if args.plan:
+        plan = organizer.create_plan(include_save=args.plan_include_save)
+        plan_json = json.dumps(plan, indent=2, ensure_ascii=False)
+        if args.plan == "-":
+            print(plan_json)
+        else:
+            with open(args.plan, 'w', encoding='utf-8') as f:
+                f.write(plan_json)
+            summary = plan["summary"]
+            print(f"작업 계획 저장: {args.plan} ({summary['operations']}개 작업, "
+                  f"{summary['bytes']:,} bytes, 예상 {summary['estimated_seconds']:.2f}초)")
+        return
+
+    if args.execute_plan:
+        with open(args.execute_plan, 'r', encoding='utf-8') as f:
+            plan = json.load(f)
+        result = organizer.execute_plan(plan)
+        print(f"작업 계획 실행 {'완료' if result['success'] else '실패'}: 완료 {result['done']}, "
+              f"건너뜀 {result['skipped']}, 실패 {result['failed']} ({result['total_time']:.2f}초)")
+        return
+
+    # 프로파일링 설정 (설정 파일에는 저장하지 않음)
+    if args.profile:
+        organizer.config["profile_enabled"] = True
+    if args.profile_dir:
+        organizer.config["profile_dir"] = args.profile_dir
+
     # 파일 정리 실행
-    success = organizer.organize_files()
+    profiler = PhaseProfiler.from_config(organizer.config)
+    success = organizer.run(profiler=profiler)["success"]
+
+    if profiler.enabled:
+        print()
+        for line in profiler.format_table():
+            print(line)
+        prof_files = [stats["prof_file"] for stats in profiler.finish().values() if "prof_file" in stats]
+        if prof_files:
+            print(f"프로파일 저장: {Path(prof_files[0]).parent} ({len(prof_files)}개 .prof 파일)")
+        print()
 
     if success:
         print("파일 정리가 완료되었습니다!")
     else:
         print("파일 정리에 실패했습니다. 로그를 확인해주세요.")
 
-    print(f"로그 파일: logs/file_organizer_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+    print(f"로그 파일: {organizer.log_file}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
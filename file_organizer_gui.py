@@ -8,17 +8,182 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import json
 import os
+import re
 import threading
 import subprocess
-import sys
 from datetime import datetime
 from pathlib import Path
 import queue
 import time
-import shutil
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from file_organizer import (MEDIA_EXTENSIONS, TK_IMAGE_EXTENSIONS, FileOrganizer, JobScheduler, JsonRecordIndex,
+                            PhaseProfiler, ProgressTracker, SourceIndex, ThumbnailCache, VersionStore,
+                            acquire_name_allocator, compile_template, copy_via_temp, format_filename, format_progress,
+                            get_backend, get_move_rules, manifest_for_rule, release_name_allocator, run_copy_pipeline,
+                            run_move_rules, scan_directory)
+
+# 로그 창 설정 - 위젯에는 최근 로그만 유지하고 전체 로그는 logs/gui_log_*.txt에 기록
+LOG_UPDATE_INTERVAL_MS = 200  # 로그 창 갱신 주기
+LOG_MAX_BATCH = 1000  # 한 번에 반영할 최대 로그 수 (나머지는 다음 갱신에)
+LOG_MAX_LINES = 2000  # 로그 창에 유지할 최대 줄 수
+LOG_SEARCH_MAX_RESULTS = 1000  # 로그 검색 결과 최대 표시 수
+
+# UI 지연 측정 - after() 콜백이 예정보다 늦게 실행된 정도로 이벤트 루프 멈춤을 감지
+UI_LAG_INTERVAL_MS = 100  # 측정 주기
+UI_STALL_MS = 200  # 이 이상 늦으면 멈춤으로 기록하고 그동안 실행된 핸들러에 원인을 돌림
+UI_STALL_LOG_MS = 1000  # 이 이상 멈추면 실행 로그에도 남김
+
+# 데이터 보기 - 화면에 보이는 행만 파일에서 읽어서 표시
+VIEWER_VISIBLE_ROWS = 30  # 한 번에 표시할 레코드 수
+VIEWER_POLL_MS = 200  # 색인 진행 표시 갱신 주기
+
+# 갤러리 설정 - 보이는 타일의 썸네일만 요청하고, 만든 썸네일은 디스크 캐시에 보관
+GALLERY_THUMB_SIZE = 160  # 썸네일 최대 가로/세로 (px)
+GALLERY_TILE_WIDTH = 180  # 타일 가로 (썸네일 + 여백)
+GALLERY_TILE_HEIGHT = 200  # 타일 세로 (썸네일 + 이름)
+GALLERY_POLL_MS = 100  # 썸네일 결과 반영 주기
+GALLERY_PHOTO_CACHE = 400  # 메모리에 유지할 썸네일 이미지 수
+
+# 시작 시 바로 보여줄 마지막 상태 (백그라운드 확인이 끝나면 갱신)
+STATUS_CACHE_FILE = Path("logs") / "last_status.json"
+
+# 스케줄러 작업 표시 이름
+JOB_LABELS = {
+    "organize": "파일 정리",
+    "moves": "파일 이동",
+    "log_cleanup": "로그 정리",
+}
+
+
+def handler_name(func):
+    """Tk 콜백의 표시 이름 (람다는 정의된 줄 번호 포함)"""
+    # after()는 콜백을 tkinter 내부 함수 callit으로 감싸므로 클로저에서 원래 함수를 꺼냄
+    code = getattr(func, "__code__", None)
+    if code is not None and code.co_name == "callit" and "func" in code.co_freevars:
+        try:
+            func = func.__closure__[code.co_freevars.index("func")].cell_contents
+        except ValueError:
+            pass
+    name = getattr(func, "__name__", type(func).__name__)
+    if name == "<lambda>":
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            name = f"<lambda>:{code.co_firstlineno}"
+    return name
+
+
+class TimedCallWrapper(tk.CallWrapper):
+    """측정 중인 창의 Tk 콜백(command, bind, after) 실행 시간을 UILagMonitor에 전달
+    
+    UILagMonitor.install()이 tkinter.CallWrapper를 바꿔 끼우고 stop()이 원래대로 돌려놓는다.
+    그 사이 다른 Tk 창에서 등록된 콜백은 측정하지 않는다."""
+    monitor = None
+    
+    def __call__(self, *args):
+        monitor = TimedCallWrapper.monitor
+        if monitor is None or self.widget is None or self.widget._root() is not monitor.root:
+            return super().__call__(*args)
+        start = time.perf_counter()
+        try:
+            return super().__call__(*args)
+        finally:
+            monitor.record(handler_name(self.func), time.perf_counter() - start)
+
+
+class UILagMonitor:
+    """Tk 이벤트 루프 지연 측정 - after() 콜백의 지각 시간을 재고, 멈춤이 생기면 그 사이 실행된 핸들러 중
+    가장 오래 걸린 것을 원인으로 기록"""
+    
+    def __init__(self, root, interval_ms=UI_LAG_INTERVAL_MS, stall_ms=UI_STALL_MS, on_stall=None):
+        self.root = root
+        self.interval = interval_ms / 1000
+        self.stall = stall_ms / 1000
+        self.on_stall = on_stall
+        self.samples = deque(maxlen=int(60 / self.interval))  # 최근 1분의 (시각, 지연초)
+        self.handlers = {}  # 핸들러 이름 → count, total, max, stalls
+        self.window = []  # 지난 측정 이후 실행된 (핸들러 이름, 초)
+        self.stall_count = 0
+        self.expected = None
+        self.original_wrapper = None
+        self.heartbeat_id = None
+        
+    def install(self):
+        """콜백 계측 설치 후 측정 시작"""
+        TimedCallWrapper.monitor = self
+        if tk.CallWrapper is not TimedCallWrapper:
+            self.original_wrapper = tk.CallWrapper
+            tk.CallWrapper = TimedCallWrapper  # 이후 등록되는 콜백부터 적용
+        self.expected = time.monotonic() + self.interval
+        self.heartbeat_id = self.root.after(int(self.interval * 1000), self.heartbeat)
+        
+    def stop(self):
+        """측정 중지 - tkinter.CallWrapper를 원래대로 돌려놓음 (이미 등록된 콜백은 측정 없이 실행)"""
+        if TimedCallWrapper.monitor is self:
+            TimedCallWrapper.monitor = None
+            if self.original_wrapper is not None and tk.CallWrapper is TimedCallWrapper:
+                tk.CallWrapper = self.original_wrapper
+        self.original_wrapper = None
+        if self.heartbeat_id is not None:
+            try:
+                self.root.after_cancel(self.heartbeat_id)
+            except tk.TclError:
+                pass
+            self.heartbeat_id = None
+        
+    def record(self, name, seconds):
+        """핸들러 실행 시간 기록 (Tk 스레드에서만 호출됨)"""
+        if name == "heartbeat":
+            return
+        stats = self.handlers.get(name)
+        if stats is None:
+            stats = self.handlers[name] = {"count": 0, "total": 0.0, "max": 0.0, "stalls": 0}
+        stats["count"] += 1
+        stats["total"] += seconds
+        if seconds > stats["max"]:
+            stats["max"] = seconds
+        self.window.append((name, seconds))
+        
+    def heartbeat(self):
+        """예정 시각 대비 지연 측정"""
+        now = time.monotonic()
+        lag = max(0.0, now - self.expected)
+        self.samples.append((now, lag))
+        if lag >= self.stall:
+            self.stall_count += 1
+            culprit, seconds = max(self.window, key=lambda x: x[1]) if self.window else ("(알 수 없음)", 0.0)
+            if culprit in self.handlers:
+                self.handlers[culprit]["stalls"] += 1
+            if self.on_stall:
+                self.on_stall(lag, culprit, seconds)
+        self.window = []
+        self.expected = now + self.interval
+        self.heartbeat_id = self.root.after(int(self.interval * 1000), self.heartbeat)
+        
+    def current_lag(self, seconds=2.0):
+        """최근 seconds초 동안의 최대 지연 (초)"""
+        if not self.samples:
+            return 0.0
+        since = self.samples[-1][0] - seconds
+        return max(lag for at, lag in self.samples if at >= since)
+        
+    def top_offenders(self, limit=15):
+        """멈춤 횟수, 최대 실행 시간 순 핸들러 목록"""
+        rows = [dict(stats, name=name) for name, stats in self.handlers.items()]
+        rows.sort(key=lambda x: (x["stalls"], x["max"]), reverse=True)
+        return rows[:limit]
+
 
 class FileOrganizerGUI:
-    def __init__(self, root):
+    def __init__(self, root, startup_start=None):
+        # 시작 시간 측정 (main()에서 Tk 생성 전 시각을 넘기면 Tk 초기화도 포함)
+        init_start = time.perf_counter()
+        self.startup_start = startup_start or init_start
+        self.startup_started_at = datetime.now()
+        self.startup_profiler = PhaseProfiler()
+        self.startup_tk_seconds = init_start - self.startup_start
+        
         self.root = root
         self.root.title("Sora Auto Save 파일 정리 프로그램")
         self.root.geometry("1400x800")
@@ -29,49 +194,97 @@ class FileOrganizerGUI:
         
         # 설정 파일 경로
         self.config_file = "file_organizer_config.json"
-        self.config = self.load_config()
+        with self.startup_profiler.phase("config"):
+            self.config = self.load_config()
         
         # 로그 메시지 큐
         self.log_queue = queue.Queue()
+        # 작업 스레드가 요청한 화면 갱신 (Tk 호출은 update_log가 Tk 스레드에서 실행)
+        self.ui_queue = queue.Queue()
+        self.log_file = None  # 전체 로그 기록 파일 (첫 로그 때 생성)
+        self.log_file_path = Path("logs") / f"gui_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         
-        # 자동 실행 관련 변수
+        # 파일 정리 엔진 (첫 실행 시 생성, 시작 상태 확인과 사용자 실행이 동시에 만들지 않도록 잠금)
+        self.organizer = None
+        self.organizer_lock = threading.Lock()
+        self.last_plan = None  # 마지막으로 미리보기한 작업 계획
+        
+        # 자동 실행 관련 변수 (정리/이동/로그 정리는 각자 간격으로 실행, 이전 실행이 끝나기 전에는 겹치지 않음)
         self.auto_timer = None
         self.is_auto_running = False
-        self.countdown_seconds = 0
-        
-        # UI 초기화
-        self.setup_ui()
-        self.load_config_to_ui()
+        overlap = self.config.get("job_overlap", "coalesce")
+        self.scheduler = JobScheduler()
+        self.scheduler.add_job("organize", self.organize_job, self.config["auto_run_interval"], overlap)
+        self.scheduler.add_job("moves", self.execute_enabled_moves_sync, self.config["move_run_interval"], overlap)
+        self.scheduler.add_job("log_cleanup", self.cleanup_logs_job, self.config["log_cleanup_interval"], "skip")
+        
+        # 실행 중인 작업의 취소 신호 (중지 버튼은 모두 설정, 작업은 파일 사이에서 확인)
+        self.run_cancel_events = set()
+        self.cancel_requested_at = 0.0
+        
+        # UI 지연 측정 (위젯 생성 전에 설치해야 모든 콜백이 계측됨)
+        self.ui_lag_monitor = None
+        if self.config.get("ui_lag_monitor", True):
+            self.ui_lag_monitor = UILagMonitor(self.root, on_stall=self.on_ui_stall)
+            self.ui_lag_monitor.install()
+        
+        # UI 초기화 (보조 탭은 처음 볼 때 구성)
+        with self.startup_profiler.phase("ui"):
+            self.setup_ui()
+            self.load_config_to_ui()
         
         # 로그 업데이트 타이머
         self.update_log()
         
         # 자동 실행 상태 복원
-        self.restore_auto_state()
+        with self.startup_profiler.phase("restore"):
+            self.restore_auto_state()
+        
+        # 마지막으로 확인한 상태를 바로 표시하고, 첫 화면이 그려진 뒤 백그라운드에서 다시 확인
+        with self.startup_profiler.phase("cached_status"):
+            self.show_status_summary(self.load_status_cache(), cached=True)
+        self.startup_init_done = time.perf_counter()
+        self.root.after(0, lambda: self.root.after_idle(self.on_first_frame))
         
     def load_config(self):
         """설정 파일 로드"""
         default_config = {
             "download_folder": str(Path.home() / "Downloads"),
+            "download_folders": [],  # 추가 다운로드 폴더 목록
             "target_folder": str(Path.cwd() / "organized_files"),
             "file_pattern": "sora_auto_save_*.json",
             "output_filename": "sora_latest_data.json",
             "backup_old_files": True,
             "backup_folder": str(Path.cwd() / "backup"),
             "auto_run_interval": 300,  # 5분
+            "move_run_interval": 300,  # 파일 이동 간격 (초, 0이면 자동 실행 안 함)
+            "log_cleanup_interval": 3600,  # 로그 정리 간격 (초, 0이면 자동 실행 안 함)
+            "job_overlap": "coalesce",  # 이전 실행 중일 때: coalesce(끝나고 한 번 더) / skip(건너뜀)
             "max_backup_files": 10,
             "auto_run_enabled": False,  # 자동 실행 기본값
             "cleanup_mode": "delete",  # 파일 정리 모드 (메인 폴더용)
             "max_cleanup_backup_files": 5,  # 최대 정리 백업 파일 수
             "max_log_files": 10,  # 최대 로그 파일 수
-            "move1_source": "",
-            "move1_target": "",
-            "move1_enabled": False,
-            "move1_filename": "",
-            "move2_source": "",
-            "move2_target": "",
-            "move2_enabled": False,
-            "move2_filename": ""
+            "profile_enabled": False,  # 단계별 프로파일링
+            "backend": "fast",  # 검색/복사 방식: fast(scandir, 커널 복사) / legacy(glob, copy2) - 정리/이동/저장 공통
+            "max_move_workers": 4,  # 이동 설정 동시 실행 수 (대상 드라이브별)
+            "sync_enabled": True,  # 이동 설정: 바뀐 파일만 복사 (동기화 기록 사용)
+            "sync_hash": False,  # 수정시간만 바뀐 파일은 내용 해시로 비교
+            "sync_mirror_deletes": False,  # 원본에서 지워진 파일의 복사본도 삭제
+            "history_enabled": True,  # 실행 기록 DB 사용
+            "history_db": str(Path("logs") / "run_history.db"),  # 실행 기록 DB (SQLite)
+            "ui_lag_monitor": True,  # UI 지연 측정 및 원인 핸들러 기록
+            "version_history": True,  # backup/rename 모드: 덮어쓰는 파일을 버전 기록(.versions)에 저장
+            "version_snapshot_every": 20,  # 버전 기록 - 이 수마다 전체 스냅샷, 나머지는 차이만 저장
+            "version_max_count": 500,  # 버전 기록 - 파일당 최대 버전 수
+            "copy_small_workers": 4,  # 파일 정리 옵션 저장 - 작은 파일 복사 스레드 수
+            "copy_large_workers": 2,  # 파일 정리 옵션 저장 - 큰 파일 복사 스레드 수
+            "copy_large_file_mb": 8,  # 이 크기(MB) 이상은 큰 파일 작업 줄에서 복사
+            "media_folder": str(Path.home() / "Downloads"),  # 갤러리 - 수집한 미디어 파일 폴더
+            "thumbnail_cache_dir": str(Path("logs") / "thumbnails"),  # 갤러리 - 썸네일 캐시 폴더
+            "thumbnail_cache_mb": 200,  # 갤러리 - 썸네일 캐시 최대 크기 (MB, 넘으면 오래 안 본 것부터 삭제)
+            "thumbnail_workers": 2,  # 갤러리 - 썸네일 생성 스레드 수
+            "move_rules": []  # 파일 이동 설정 목록 (source, target, filename, enabled)
         }
         
         if os.path.exists(self.config_file):
@@ -90,37 +303,41 @@ class FileOrganizerGUI:
             return default_config
             
     def save_config(self):
-        """설정 파일 저장"""
+        """설정 파일 저장 (Tk 스레드에서 호출 - 새 설정 dict를 채운 뒤 한 번에 교체하여 작업 스레드는 완성된 설정만 봄)"""
         try:
             # UI에서 설정값 가져오기
-            self.config["download_folder"] = self.download_folder_var.get()
-            self.config["target_folder"] = self.target_folder_var.get()
-            self.config["file_pattern"] = self.file_pattern_var.get()
-            self.config["output_filename"] = self.output_filename_var.get()
-            self.config["backup_old_files"] = self.backup_enabled_var.get()
-            self.config["backup_folder"] = self.backup_folder_var.get()
-            self.config["auto_run_interval"] = int(self.interval_var.get())
-            self.config["max_backup_files"] = int(self.max_backup_var.get())
-            self.config["auto_run_enabled"] = self.auto_run_enabled_var.get()
+            config = dict(self.config)
+            config["download_folder"] = self.download_folder_var.get()
+            config["download_folders"] = [f.strip() for f in self.extra_download_folders_var.get().split(";") if f.strip()]
+            config["target_folder"] = self.target_folder_var.get()
+            config["file_pattern"] = self.file_pattern_var.get()
+            config["output_filename"] = self.output_filename_var.get()
+            config["backup_old_files"] = self.backup_enabled_var.get()
+            config["backup_folder"] = self.backup_folder_var.get()
+            config["auto_run_interval"] = int(self.interval_var.get())
+            config["move_run_interval"] = int(self.move_interval_var.get())
+            config["log_cleanup_interval"] = int(self.log_cleanup_interval_var.get())
+            config["max_backup_files"] = int(self.max_backup_var.get())
+            config["auto_run_enabled"] = self.auto_run_enabled_var.get()
+            config["profile_enabled"] = self.profile_enabled_var.get()
             
             # 파일 정리 옵션 저장
-            self.config["cleanup_mode"] = self.cleanup_mode_var.get()
-            self.config["max_cleanup_backup_files"] = int(self.max_cleanup_backup_var.get())
-            self.config["max_log_files"] = int(self.max_log_files_var.get())
-            
-            # 파일 이동 설정 저장
-            self.config["move1_source"] = self.move1_source_var.get()
-            self.config["move1_target"] = self.move1_target_var.get()
-            self.config["move1_enabled"] = self.move1_enabled_var.get()
-            self.config["move1_filename"] = self.move1_filename_var.get()
+            config["cleanup_mode"] = self.cleanup_mode_var.get()
+            config["max_cleanup_backup_files"] = int(self.max_cleanup_backup_var.get())
+            config["max_log_files"] = int(self.max_log_files_var.get())
             
-            self.config["move2_source"] = self.move2_source_var.get()
-            self.config["move2_target"] = self.move2_target_var.get()
-            self.config["move2_enabled"] = self.move2_enabled_var.get()
-            self.config["move2_filename"] = self.move2_filename_var.get()
+            # 파일 이동 설정 저장 (예전 형식의 moveN_* 키는 move_rules로 대체)
+            config["move_rules"] = self.get_ui_move_rules()
+            for key in [key for key in config if re.match(r"move\d+_(source|target|enabled|filename)$", key)]:
+                del config[key]
+            self.config = config
             
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+                json.dump(config, f, indent=2, ensure_ascii=False)
+            
+            # 바뀐 실행 간격은 다음 실행부터 적용
+            if self.is_auto_running:
+                self.apply_job_intervals()
                 
             self.log_message("✅ 설정이 저장되었습니다.")
             
@@ -162,10 +379,25 @@ class FileOrganizerGUI:
         interval_entry = ttk.Entry(auto_frame, textvariable=self.interval_var, width=10)
         interval_entry.grid(row=0, column=2, sticky=tk.W, pady=2)
         
-        # 카운트다운 표시
+        # 프로파일링 토글 (단계별 시간/CPU/메모리 측정 및 .prof 저장)
+        self.profile_enabled_var = tk.BooleanVar()
+        profile_check = ttk.Checkbutton(auto_frame, text="프로파일링", variable=self.profile_enabled_var)
+        profile_check.grid(row=0, column=3, sticky=tk.W, padx=(20, 0), pady=2)
+        
+        # 작업별 실행 간격 (파일 이동, 로그 정리)
+        ttk.Label(auto_frame, text="이동 간격 (초):").grid(row=1, column=1, sticky=tk.W, padx=(20, 5), pady=2)
+        self.move_interval_var = tk.StringVar()
+        ttk.Entry(auto_frame, textvariable=self.move_interval_var, width=10).grid(row=1, column=2, sticky=tk.W, pady=2)
+        ttk.Label(auto_frame, text="로그 정리 간격 (초):").grid(row=2, column=1, sticky=tk.W, padx=(20, 5), pady=2)
+        self.log_cleanup_interval_var = tk.StringVar()
+        ttk.Entry(auto_frame, textvariable=self.log_cleanup_interval_var, width=10).grid(row=2, column=2, sticky=tk.W, pady=2)
+        
+        # 카운트다운 표시 (작업별 다음 실행 / 마지막 소요 시간)
         self.countdown_label = ttk.Label(auto_frame, text="다음 실행까지: --:--", 
                                         font=("Arial", 12, "bold"), foreground="blue")
-        self.countdown_label.grid(row=1, column=0, columnspan=3, pady=(10, 0))
+        self.countdown_label.grid(row=3, column=0, columnspan=3, pady=(10, 0))
+        self.job_status_label = ttk.Label(auto_frame, text="", foreground="gray", justify=tk.LEFT)
+        self.job_status_label.grid(row=4, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
         
         # 설정 프레임
         settings_frame = ttk.LabelFrame(main_frame, text="메인 설정", padding="10")
@@ -215,6 +447,13 @@ class FileOrganizerGUI:
         max_backup_entry = ttk.Entry(settings_frame, textvariable=self.max_backup_var, width=10)
         max_backup_entry.grid(row=5, column=1, sticky=tk.W, padx=(5, 5), pady=2)
         
+        # 추가 다운로드 폴더 (여러 드라이브/프로필 동시 검색)
+        ttk.Label(settings_frame, text="추가 다운로드 폴더:").grid(row=6, column=0, sticky=tk.W, pady=2)
+        self.extra_download_folders_var = tk.StringVar()
+        extra_download_entry = ttk.Entry(settings_frame, textvariable=self.extra_download_folders_var)
+        extra_download_entry.grid(row=6, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
+        ttk.Label(settings_frame, text="';'로 구분").grid(row=6, column=2, pady=2)
+        
         # 파일 정리 옵션 프레임
         cleanup_frame = ttk.LabelFrame(main_frame, text="파일 정리 옵션", padding="10")
         cleanup_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -249,63 +488,11 @@ class FileOrganizerGUI:
         move_frame.columnconfigure(0, weight=1)
         move_frame.columnconfigure(1, weight=1)
         
-        # 이동 설정 1 (왼쪽)
-        move1_frame = ttk.LabelFrame(move_frame, text="이동 설정 1", padding="5")
-        move1_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5), pady=(0, 10))
-        move1_frame.columnconfigure(1, weight=1)
-        
-        ttk.Label(move1_frame, text="소스 폴더:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.move1_source_var = tk.StringVar()
-        move1_source_entry = ttk.Entry(move1_frame, textvariable=self.move1_source_var)
-        move1_source_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
-        ttk.Button(move1_frame, text="찾아보기", command=self.browse_move1_source).grid(row=0, column=2, pady=2)
-        
-        ttk.Label(move1_frame, text="대상 폴더:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.move1_target_var = tk.StringVar()
-        move1_target_entry = ttk.Entry(move1_frame, textvariable=self.move1_target_var)
-        move1_target_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
-        ttk.Button(move1_frame, text="찾아보기", command=self.browse_move1_target).grid(row=1, column=2, pady=2)
-        
-        ttk.Label(move1_frame, text="파일명 패턴:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.move1_filename_var = tk.StringVar()
-        move1_filename_entry = ttk.Entry(move1_frame, textvariable=self.move1_filename_var)
-        move1_filename_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
-        
-        self.move1_enabled_var = tk.BooleanVar()
-        move1_check = ttk.Checkbutton(move1_frame, text="활성화", variable=self.move1_enabled_var)
-        move1_check.grid(row=3, column=0, sticky=tk.W, pady=2)
-        
-        ttk.Button(move1_frame, text="즉시 실행", command=self.execute_move1).grid(row=3, column=1, sticky=tk.W, padx=(5, 5), pady=2)
-        ttk.Button(move1_frame, text="파일 정리 옵션으로 저장", command=self.execute_move1_to_organized).grid(row=3, column=2, sticky=tk.W, pady=2)
-        
-        # 이동 설정 2 (오른쪽)
-        move2_frame = ttk.LabelFrame(move_frame, text="이동 설정 2", padding="5")
-        move2_frame.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=(0, 10))
-        move2_frame.columnconfigure(1, weight=1)
-        
-        ttk.Label(move2_frame, text="소스 폴더:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.move2_source_var = tk.StringVar()
-        move2_source_entry = ttk.Entry(move2_frame, textvariable=self.move2_source_var)
-        move2_source_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
-        ttk.Button(move2_frame, text="찾아보기", command=self.browse_move2_source).grid(row=0, column=2, pady=2)
-        
-        ttk.Label(move2_frame, text="대상 폴더:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.move2_target_var = tk.StringVar()
-        move2_target_entry = ttk.Entry(move2_frame, textvariable=self.move2_target_var)
-        move2_target_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
-        ttk.Button(move2_frame, text="찾아보기", command=self.browse_move2_target).grid(row=1, column=2, pady=2)
-        
-        ttk.Label(move2_frame, text="파일명 패턴:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.move2_filename_var = tk.StringVar()
-        move2_filename_entry = ttk.Entry(move2_frame, textvariable=self.move2_filename_var)
-        move2_filename_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
-        
-        self.move2_enabled_var = tk.BooleanVar()
-        move2_check = ttk.Checkbutton(move2_frame, text="활성화", variable=self.move2_enabled_var)
-        move2_check.grid(row=3, column=0, sticky=tk.W, pady=2)
-        
-        ttk.Button(move2_frame, text="즉시 실행", command=self.execute_move2).grid(row=3, column=1, sticky=tk.W, padx=(5, 5), pady=2)
-        ttk.Button(move2_frame, text="파일 정리 옵션으로 저장", command=self.execute_move2_to_organized).grid(row=3, column=2, sticky=tk.W, pady=2)
+        # 이동 설정 목록 (2열 배치, 개수 제한 없음)
+        self.move_frame = move_frame
+        self.move_rule_widgets = []
+        self.add_move_rule_button = ttk.Button(move_frame, text="+ 이동 설정 추가", command=self.add_move_rule)
+        self.add_move_rule_button.grid(row=0, column=0, sticky=tk.W)
         
         # 버튼 프레임 (좌측 정렬, 반응형)
         button_frame = ttk.Frame(main_frame)
@@ -314,12 +501,31 @@ class FileOrganizerGUI:
         ttk.Button(button_frame, text="설정 저장", command=self.save_config).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="수동 실행", command=self.run_organizer).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="상태 확인", command=self.check_status).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(button_frame, text="미리보기", command=self.preview_plan).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(button_frame, text="계획 실행", command=self.execute_last_plan).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="로그 폴더 열기", command=self.open_log_folder).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="대상 폴더 열기", command=self.open_target_folder).pack(side=tk.LEFT)
         
-        # 로그 프레임 (오른쪽 열)
-        log_frame = ttk.LabelFrame(self.root, text="실행 로그", padding="10")
-        log_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(10, 10))
+        # 진행 상황 (처리한 파일/바이트 기준) 및 중지 버튼
+        progress_frame = ttk.Frame(main_frame)
+        progress_frame.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
+        progress_frame.columnconfigure(0, weight=1)
+        self.progress_bar = ttk.Progressbar(progress_frame, mode="determinate", maximum=100)
+        self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.cancel_button = ttk.Button(progress_frame, text="⏹ 중지", command=self.cancel_runs, state=tk.DISABLED)
+        self.cancel_button.grid(row=0, column=1, padx=(5, 0))
+        self.progress_label = ttk.Label(progress_frame, text="대기 중", foreground="gray")
+        self.progress_label.grid(row=1, column=0, columnspan=2, sticky=tk.W)
+        self.status_summary_label = ttk.Label(progress_frame, text="", foreground="gray")
+        self.status_summary_label.grid(row=2, column=0, columnspan=2, sticky=tk.W)
+        
+        # 오른쪽 열: 실행 로그 / 대시보드 탭
+        self.right_notebook = ttk.Notebook(self.root)
+        self.right_notebook.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(10, 10))
+        
+        # 로그 프레임
+        log_frame = ttk.LabelFrame(self.right_notebook, text="실행 로그", padding="10")
+        self.right_notebook.add(log_frame, text="실행 로그")
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
         
@@ -327,21 +533,126 @@ class FileOrganizerGUI:
         self.log_text = scrolledtext.ScrolledText(log_frame, height=15)
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # 로그 검색 (창에서 잘려 나간 예전 로그까지 파일에서 검색)
+        search_frame = ttk.Frame(log_frame)
+        search_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+        search_frame.columnconfigure(0, weight=1)
+        self.log_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.log_search_var)
+        search_entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
+        search_entry.bind('<Return>', lambda event: self.search_log())
+        ttk.Button(search_frame, text="로그 검색", command=self.search_log).grid(row=0, column=1)
+        
+        # UI 지연 표시 (클릭하면 원인 핸들러 목록)
+        self.ui_lag_label = ttk.Label(search_frame, text="UI 지연: -", foreground="gray", cursor="hand2")
+        self.ui_lag_label.grid(row=0, column=2, padx=(10, 0))
+        self.ui_lag_label.bind('<Button-1>', lambda event: self.show_ui_lag_report())
+        if self.ui_lag_monitor:
+            self.update_ui_lag_indicator()
+        
+        # 보조 탭 - 빈 프레임만 추가하고 내용은 처음 선택할 때 구성 (탭 위젯 경로 → 구성 함수)
+        self.viewer_index = None
+        self.lazy_tabs = {}
+        for text, setup in [("대시보드", self.setup_dashboard),  # 실행 기록 DB
+                            ("데이터 보기", self.setup_viewer),  # 큰 JSON을 색인만 하고 보이는 레코드만 읽음
+                            ("갤러리", self.setup_gallery)]:  # 보이는 타일만 썸네일 요청
+            frame = ttk.Frame(self.right_notebook, padding="10")
+            self.right_notebook.add(frame, text=text)
+            self.lazy_tabs[str(frame)] = (frame, setup)
+        self.right_notebook.bind('<<NotebookTabChanged>>', lambda event: self.on_tab_changed())
+        
         # 초기 로그 메시지
         self.log_message("🚀 자동 실행 타이머 GUI가 시작되었습니다.")
         self.log_message("자동 실행을 활성화하면 설정된 간격으로 자동으로 파일 정리가 실행됩니다.")
         
+    def on_tab_changed(self):
+        """탭 선택 - 처음 보는 보조 탭이면 구성"""
+        lazy = self.lazy_tabs.pop(self.right_notebook.select(), None)
+        if lazy is not None:
+            frame, setup = lazy
+            start = time.perf_counter()
+            setup(frame)
+            self.log_message(f"🧩 {self.right_notebook.tab(frame, 'text')} 탭 구성 ({(time.perf_counter() - start) * 1000:.0f}ms)")
+        self.refresh_dashboard()
+        
+    def on_first_frame(self):
+        """첫 화면이 그려진 뒤 호출 - 시작 시간 기록, 상태 확인은 백그라운드에서"""
+        now = time.perf_counter()
+        phases = {"tk_init": self.startup_tk_seconds}
+        phases.update(self.startup_profiler.timings)
+        phases["first_frame"] = now - self.startup_init_done
+        total = now - self.startup_start
+        details = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in phases.items())
+        self.log_message(f"⚡ 첫 화면까지 {total:.2f}초 ({details})")
+        
+        def startup_in_thread():
+            try:
+                organizer = self.get_organizer()
+                organizer.record_run("startup", self.startup_started_at, total, phases, success=True)
+                self.refresh_status_summary(organizer.get_status())
+            except Exception as e:
+                self.log_message(f"⚠️ 시작 상태 확인 실패: {e}")
+        
+        thread = threading.Thread(target=startup_in_thread)
+        thread.daemon = True
+        thread.start()
+        
+    def load_status_cache(self):
+        """마지막으로 확인한 상태 요약 (없으면 None)"""
+        try:
+            with open(STATUS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+    def refresh_status_summary(self, status):
+        """상태 확인 결과를 요약해 저장하고 표시 (작업 스레드에서 호출됨)"""
+        files = status["files"]
+        summary = {
+            "checked_at": datetime.now().isoformat(timespec="seconds"),
+            "file_count": len(files),
+            "total_bytes": sum(file["size"] for file in files),
+            "latest_name": files[0]["name"] if files else None,
+            "latest_mtime": files[0]["mtime"] if files else None,
+        }
+        try:
+            STATUS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = STATUS_CACHE_FILE.with_name(STATUS_CACHE_FILE.name + ".tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False)
+            os.replace(temp_file, STATUS_CACHE_FILE)
+        except OSError:
+            pass
+        self.call_in_ui(self.show_status_summary, summary, False)
+        
+    def show_status_summary(self, summary, cached):
+        """다운로드 폴더 상태 요약 표시 (cached: 이전 실행에서 저장한 값)"""
+        if not summary:
+            self.status_summary_label.config(text="📁 다운로드 폴더 상태 확인 중...", foreground="gray")
+            return
+        checked_at = summary["checked_at"].replace("T", " ")
+        text = f"📁 {self.config['file_pattern']}: {summary['file_count']:,}개 ({summary['total_bytes'] / (1024 * 1024):.1f}MB)"
+        if summary["latest_name"]:
+            text += f" · 최신 {summary['latest_name']} ({datetime.fromtimestamp(summary['latest_mtime']).strftime('%m-%d %H:%M')})"
+        text += f" · {'마지막 확인' if cached else '확인'} {checked_at}"
+        self.status_summary_label.config(text=text + (" (다시 확인 중...)" if cached else ""),
+                                         foreground="gray" if cached else "black")
+        
     def load_config_to_ui(self):
         """설정값을 UI에 로드"""
         self.download_folder_var.set(self.config["download_folder"])
+        self.extra_download_folders_var.set(";".join(self.config.get("download_folders", [])))
         self.target_folder_var.set(self.config["target_folder"])
         self.file_pattern_var.set(self.config["file_pattern"])
         self.output_filename_var.set(self.config["output_filename"])
         self.backup_enabled_var.set(self.config["backup_old_files"])
         self.backup_folder_var.set(self.config["backup_folder"])
         self.interval_var.set(str(self.config["auto_run_interval"]))
+        self.move_interval_var.set(str(self.config["move_run_interval"]))
+        self.log_cleanup_interval_var.set(str(self.config["log_cleanup_interval"]))
         self.max_backup_var.set(str(self.config["max_backup_files"]))
         self.auto_run_enabled_var.set(self.config["auto_run_enabled"])
+        self.profile_enabled_var.set(self.config.get("profile_enabled", False))
         
         # 파일 정리 옵션 로드
         self.cleanup_mode_var.set(self.config.get("cleanup_mode", "delete"))
@@ -349,15 +660,11 @@ class FileOrganizerGUI:
         self.max_log_files_var.set(str(self.config.get("max_log_files", 10)))
         
         # 파일 이동 설정 로드
-        self.move1_source_var.set(self.config.get("move1_source", ""))
-        self.move1_target_var.set(self.config.get("move1_target", ""))
-        self.move1_enabled_var.set(self.config.get("move1_enabled", False))
-        self.move1_filename_var.set(self.config.get("move1_filename", ""))
-        
-        self.move2_source_var.set(self.config.get("move2_source", ""))
-        self.move2_target_var.set(self.config.get("move2_target", ""))
-        self.move2_enabled_var.set(self.config.get("move2_enabled", False))
-        self.move2_filename_var.set(self.config.get("move2_filename", ""))
+        for widgets in self.move_rule_widgets:
+            widgets["frame"].destroy()
+        self.move_rule_widgets = []
+        for rule in get_move_rules(self.config):
+            self.add_move_rule(rule)
         
     def restore_auto_state(self):
         """자동 실행 상태 복원"""
@@ -383,41 +690,74 @@ class FileOrganizerGUI:
             return
             
         self.is_auto_running = True
-        self.countdown_seconds = int(self.interval_var.get())
+        self.apply_job_intervals()
+        self.scheduler.start()
         self.update_countdown()
-        self.log_message(f"⏰ 자동 실행 타이머 시작 (간격: {self.countdown_seconds}초)")
+        self.log_message(f"⏰ 자동 실행 타이머 시작 (정리 {self.interval_var.get()}초, "
+                         f"이동 {self.move_interval_var.get()}초, 로그 정리 {self.log_cleanup_interval_var.get()}초)")
         
     def stop_auto_timer(self):
         """자동 실행 타이머 중지"""
         self.is_auto_running = False
-        self.countdown_seconds = 0
+        self.scheduler.stop()
         self.countdown_label.config(text="다음 실행까지: --:--")
         if self.auto_timer:
             self.root.after_cancel(self.auto_timer)
             self.auto_timer = None
+        self.update_job_status()
+            
+    def apply_job_intervals(self):
+        """UI의 실행 간격을 스케줄러에 반영"""
+        intervals = {
+            "organize": self.interval_var.get(),
+            "moves": self.move_interval_var.get(),
+            "log_cleanup": self.log_cleanup_interval_var.get(),
+        }
+        current = {job["name"]: job["interval"] for job in self.scheduler.status()}
+        for name, value in intervals.items():
+            try:
+                if int(value) != current[name]:
+                    self.scheduler.set_interval(name, int(value))
+            except ValueError:
+                self.log_message(f"⚠️ 실행 간격이 숫자가 아닙니다: {value}")
             
     def update_countdown(self):
-        """카운트다운 업데이트"""
+        """카운트다운 업데이트 (실행 시각은 단조 시계 기준이라 표시 주기가 밀려도 누적되지 않음)"""
         if not self.is_auto_running:
             return
             
-        if self.countdown_seconds <= 0:
-            # 타이머 완료 - 파일 정리 실행
-            self.log_message("⏰ 자동 실행 타이머 완료 - 파일 정리 시작")
-            self.run_organizer()
-            
-            # 새로운 타이머 시작
-            self.countdown_seconds = int(self.interval_var.get())
-            self.update_countdown()
+        for name in self.scheduler.tick():
+            self.log_message(f"⏰ 자동 실행: {JOB_LABELS[name]} 시작")
+        
+        # 가장 먼저 실행될 작업까지 남은 시간 표시
+        waits = [job["next_in"] for job in self.scheduler.status() if job["next_in"] is not None]
+        if waits:
+            remaining = int(min(waits) + 0.999)
+            self.countdown_label.config(text=f"다음 실행까지: {remaining // 60:02d}:{remaining % 60:02d}")
         else:
-            # 카운트다운 표시
-            minutes = self.countdown_seconds // 60
-            seconds = self.countdown_seconds % 60
-            self.countdown_label.config(text=f"다음 실행까지: {minutes:02d}:{seconds:02d}")
-            
-            # 1초 후 다시 업데이트
-            self.countdown_seconds -= 1
-            self.auto_timer = self.root.after(1000, self.update_countdown)
+            self.countdown_label.config(text="다음 실행까지: --:--")
+        self.update_job_status()
+        
+        self.auto_timer = self.root.after(1000, self.update_countdown)
+        
+    def update_job_status(self):
+        """작업별 다음 실행 / 마지막 소요 시간 표시"""
+        lines = []
+        for job in self.scheduler.status():
+            if job["running"]:
+                next_text = "실행 중" + (" (대기 1회)" if job["pending"] else "")
+            elif job["next_in"] is not None:
+                next_text = f"{int(job['next_in'] + 0.999) // 60:02d}:{int(job['next_in'] + 0.999) % 60:02d} 후"
+            else:
+                next_text = "--:--"
+            duration = f"{job['last_duration']:.2f}초" if job["last_duration"] is not None else "-"
+            line = f"{JOB_LABELS[job['name']]}: {next_text} | 마지막 {duration}"
+            if job["skipped"]:
+                line += f" | 건너뜀 {job['skipped']}회"
+            if job["last_error"]:
+                line += " | ❌ 오류"
+            lines.append(line)
+        self.job_status_label.config(text="\n".join(lines))
         
     def browse_download_folder(self):
         """다운로드 폴더 선택"""
@@ -438,175 +778,129 @@ class FileOrganizerGUI:
             self.backup_folder_var.set(folder)
             
     # 파일 이동 관련 메서드들
-    def browse_move1_source(self):
-        """이동 설정 1 소스 폴더 선택"""
-        folder = filedialog.askdirectory(title="이동 설정 1 - 소스 폴더 선택")
-        if folder:
-            self.move1_source_var.set(folder)
-            
-    def browse_move1_target(self):
-        """이동 설정 1 대상 폴더 선택"""
-        folder = filedialog.askdirectory(title="이동 설정 1 - 대상 폴더 선택")
-        if folder:
-            self.move1_target_var.set(folder)
-            
-    def browse_move2_source(self):
-        """이동 설정 2 소스 폴더 선택"""
-        folder = filedialog.askdirectory(title="이동 설정 2 - 소스 폴더 선택")
-        if folder:
-            self.move2_source_var.set(folder)
-            
-    def browse_move2_target(self):
-        """이동 설정 2 대상 폴더 선택"""
-        folder = filedialog.askdirectory(title="이동 설정 2 - 대상 폴더 선택")
+    def add_move_rule(self, rule=None):
+        """이동 설정 프레임 추가"""
+        widgets = {
+            "source": tk.StringVar(value=(rule or {}).get("source", "")),
+            "target": tk.StringVar(value=(rule or {}).get("target", "")),
+            "filename": tk.StringVar(value=(rule or {}).get("filename", "")),
+            "enabled": tk.BooleanVar(value=(rule or {}).get("enabled", False)),
+        }
+        
+        frame = ttk.LabelFrame(self.move_frame, padding="5")
+        frame.columnconfigure(1, weight=1)
+        widgets["frame"] = frame
+        
+        ttk.Label(frame, text="소스 폴더:").grid(row=0, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(frame, textvariable=widgets["source"]).grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
+        ttk.Button(frame, text="찾아보기", command=lambda: self.browse_move_folder(widgets, "source")).grid(row=0, column=2, pady=2)
+        
+        ttk.Label(frame, text="대상 폴더:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(frame, textvariable=widgets["target"]).grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
+        ttk.Button(frame, text="찾아보기", command=lambda: self.browse_move_folder(widgets, "target")).grid(row=1, column=2, pady=2)
+        
+        ttk.Label(frame, text="파일명 패턴:").grid(row=2, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(frame, textvariable=widgets["filename"]).grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
+        ttk.Button(frame, text="삭제", command=lambda: self.remove_move_rule(widgets)).grid(row=2, column=2, pady=2)
+        
+        ttk.Checkbutton(frame, text="활성화", variable=widgets["enabled"]).grid(row=3, column=0, sticky=tk.W, pady=2)
+        ttk.Button(frame, text="즉시 실행", command=lambda: self.execute_move(widgets)).grid(row=3, column=1, sticky=tk.W, padx=(5, 5), pady=2)
+        ttk.Button(frame, text="파일 정리 옵션으로 저장", command=lambda: self.execute_move_to_organized(widgets)).grid(row=3, column=2, sticky=tk.W, pady=2)
+        
+        self.move_rule_widgets.append(widgets)
+        self.layout_move_rules()
+        
+    def remove_move_rule(self, widgets):
+        """이동 설정 프레임 삭제"""
+        widgets["frame"].destroy()
+        self.move_rule_widgets.remove(widgets)
+        self.layout_move_rules()
+        
+    def layout_move_rules(self):
+        """이동 설정 프레임 2열 배치 및 번호 갱신"""
+        for index, widgets in enumerate(self.move_rule_widgets):
+            widgets["frame"].configure(text=f"이동 설정 {index + 1}")
+            widgets["frame"].grid(row=index // 2, column=index % 2, sticky=(tk.W, tk.E),
+                                  padx=(0, 5) if index % 2 == 0 else (5, 0), pady=(0, 10))
+        rows = (len(self.move_rule_widgets) + 1) // 2
+        self.add_move_rule_button.grid(row=rows, column=0, sticky=tk.W)
+        
+    def get_ui_move_rules(self):
+        """UI의 이동 설정 목록"""
+        return [
+            {
+                "source": widgets["source"].get(),
+                "target": widgets["target"].get(),
+                "filename": widgets["filename"].get(),
+                "enabled": widgets["enabled"].get(),
+            }
+            for widgets in self.move_rule_widgets
+        ]
+        
+    def browse_move_folder(self, widgets, key):
+        """이동 설정 소스/대상 폴더 선택"""
+        number = self.move_rule_widgets.index(widgets) + 1
+        label = "소스" if key == "source" else "대상"
+        folder = filedialog.askdirectory(title=f"이동 설정 {number} - {label} 폴더 선택")
         if folder:
-            self.move2_target_var.set(folder)
+            widgets[key].set(folder)
             
-    def execute_move1(self):
-        """이동 설정 1 실행"""
-        self.execute_file_move(1, self.move1_source_var.get(), self.move1_target_var.get(), self.move1_filename_var.get())
-        
-    def execute_move2(self):
-        """이동 설정 2 실행"""
-        self.execute_file_move(2, self.move2_source_var.get(), self.move2_target_var.get(), self.move2_filename_var.get())
+    def execute_move(self, widgets):
+        """이동 설정 하나 즉시 실행"""
+        number = self.move_rule_widgets.index(widgets) + 1
+        self.execute_file_move(number, widgets["source"].get(), widgets["target"].get(), widgets["filename"].get())
     
-    def execute_move1_to_organized(self):
-        """이동 설정 1을 파일 정리 옵션으로 저장"""
-        source_path = self.move1_source_var.get()
+    def execute_move_to_organized(self, widgets):
+        """이동 설정을 파일 정리 옵션으로 저장"""
+        source_path = widgets["source"].get()
         target_path = self.target_folder_var.get()  # 메인 폴더의 대상 폴더 사용
-        filename_pattern = self.move1_filename_var.get()
+        filename_pattern = widgets["filename"].get()
         
         if not source_path:
             messagebox.showerror("오류", "소스 폴더를 설정해주세요.")
             return
             
-        def save_in_thread():
-            self.save_files_to_organized_folder(source_path, target_path, filename_pattern)
-            
-        thread = threading.Thread(target=save_in_thread)
-        thread.daemon = True
-        thread.start()
-    
-    def execute_move2_to_organized(self):
-        """이동 설정 2를 파일 정리 옵션으로 저장"""
-        source_path = self.move2_source_var.get()
-        target_path = self.target_folder_var.get()  # 메인 폴더의 대상 폴더 사용
-        filename_pattern = self.move2_filename_var.get()
-        
-        if not source_path:
-            messagebox.showerror("오류", "소스 폴더를 설정해주세요.")
-            return
+        number = self.move_rule_widgets.index(widgets) + 1
+        manifest = manifest_for_rule(self.config, {"name": f"move{number}", "number": number,
+                                                   "source": source_path, "target": target_path}, kind="save")
+        # 메인 폴더의 정리 모드는 Tk 스레드에서 읽어 넘김
+        cleanup_mode = self.cleanup_mode_var.get()
+        try:
+            max_backup_files = int(self.max_cleanup_backup_var.get())
+        except ValueError:
+            max_backup_files = None  # 저장된 설정 값 사용
             
         def save_in_thread():
-            self.save_files_to_organized_folder(source_path, target_path, filename_pattern)
+            self.save_files_to_organized_folder(source_path, target_path, filename_pattern, manifest,
+                                                cleanup_mode, max_backup_files)
             
         thread = threading.Thread(target=save_in_thread)
         thread.daemon = True
         thread.start()
         
     def execute_file_move(self, move_num, source_path, target_path, filename_pattern):
-        """파일 이동 실행"""
+        """파일 이동 실행 (즉시 실행 - 예약 실행과 같은 파일 매칭/동기화 기록 사용)"""
+        saved = next((rule for rule in get_move_rules(self.config) if rule["number"] == move_num), {})
+        manifest = None
+        if source_path and target_path:
+            manifest = manifest_for_rule(self.config, {"name": saved.get("name") or f"move{move_num}",
+                                                       "number": move_num,
+                                                       "source": source_path, "target": target_path})
+        
         def move_in_thread():
-            try:
-                if not source_path or not target_path:
-                    self.log_message(f"❌ 이동 설정 {move_num}: 소스 또는 대상 경로가 설정되지 않았습니다.")
-                    return
-                    
-                source_dir = Path(source_path)
-                target_dir = Path(target_path)
-                
-                if not source_dir.exists():
-                    self.log_message(f"❌ 이동 설정 {move_num}: 소스 폴더가 존재하지 않습니다: {source_path}")
-                    return
-                    
-                if not target_dir.exists():
-                    self.log_message(f"📁 이동 설정 {move_num}: 대상 폴더를 생성합니다: {target_path}")
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    
-                self.log_message(f"🔄 이동 설정 {move_num}: 파일 복사를 시작합니다... (이동 설정의 패턴 파일명 그대로 복사)")
-                self.log_message(f"  소스: {source_path}")
-                self.log_message(f"  대상: {target_path}")
-                if filename_pattern:
-                    self.log_message(f"  파일명 패턴: '{filename_pattern}' (이동 설정 {move_num}에서 설정된 패턴)")
-                else:
-                    self.log_message(f"  파일명: 원본 파일명 그대로 사용 (이동 설정 {move_num}에 패턴 미설정)")
-                
-                # 이동 설정용 덮어쓰기 모드 (백업 없음)
-                self.log_message(f"  이동 설정 정리 모드: 덮어쓰기 (백업 없음)")
-                
-                # 해당 이동 설정에 맞는 파일만 처리
-                moved_count = 0
-                
-                # 파일명 패턴이 있는 경우: 해당 패턴에 맞는 파일만 처리
-                if filename_pattern:
-                    # 패턴에서 확장자 추출
-                    if '.' in filename_pattern:
-                        pattern_ext = filename_pattern.split('.')[-1]
-                        if pattern_ext != filename_pattern:  # 확장자가 있는 경우
-                            pattern_ext = '.' + pattern_ext
-                        else:
-                            pattern_ext = ''
-                    else:
-                        pattern_ext = ''
-                    
-                    # 소스 폴더에서 해당 패턴에 맞는 파일 찾기
-                    matching_files = list(source_dir.glob(f"*{pattern_ext}"))
-                    
-                    if matching_files:
-                        # 가장 최신 파일 선택
-                        latest_file = max(matching_files, key=lambda x: x.stat().st_mtime)
-                        
-                        # 파일명 패턴 처리
-                        new_filename = self.generate_filename_from_pattern(latest_file, filename_pattern)
-                        target_file = target_dir / new_filename
-                        
-                        # 기존 파일 처리 (이동 설정용 덮어쓰기 모드 - 백업 없음)
-                        if target_file.exists():
-                            self.log_message(f"  ⚠️ 기존 파일 덮어쓰기: {target_file.name} (백업 없음)")
-                        
-                        try:
-                            # 이동 설정에서는 복사로 변경 (원본 파일 유지)
-                            shutil.copy2(str(latest_file), str(target_file))
-                            moved_count += 1
-                            self.log_message(f"  ✅ 복사 완료: {latest_file.name} → {target_file.name}")
-                        except Exception as e:
-                            self.log_message(f"  ❌ 복사 실패: {latest_file.name} - {e}")
-                    else:
-                        self.log_message(f"  ⚠️ 패턴에 맞는 파일을 찾을 수 없습니다: {filename_pattern}")
-                
-                # 파일명 패턴이 없는 경우: 가장 최신 파일만 처리
-                else:
-                    # 소스 폴더의 모든 파일 중 가장 최신 파일 선택
-                    all_files = [f for f in source_dir.iterdir() if f.is_file()]
-                    if all_files:
-                        latest_file = max(all_files, key=lambda x: x.stat().st_mtime)
-                        target_file = target_dir / latest_file.name
-                        
-                        # 기존 파일 처리 (이동 설정용 덮어쓰기 모드 - 백업 없음)
-                        if target_file.exists():
-                            self.log_message(f"  ⚠️ 기존 파일 덮어쓰기: {target_file.name} (백업 없음)")
-                        
-                        try:
-                            # 이동 설정에서는 복사로 변경 (원본 파일 유지)
-                            shutil.copy2(str(latest_file), str(target_file))
-                            moved_count += 1
-                            self.log_message(f"  ✅ 복사 완료: {latest_file.name}")
-                        except Exception as e:
-                            self.log_message(f"  ❌ 복사 실패: {latest_file.name} - {e}")
-                    else:
-                        self.log_message(f"  ⚠️ 소스 폴더에 파일이 없습니다: {source_path}")
-                            
-                self.log_message(f"✅ 이동 설정 {move_num} 완료: {moved_count}개 파일 복사됨 (이동 설정의 패턴 파일명 그대로 복사)")
-                
-            except Exception as e:
-                self.log_message(f"❌ 이동 설정 {move_num} 실행 중 오류: {e}")
+            self.execute_file_move_sync(move_num, source_path, target_path, filename_pattern, manifest=manifest)
                 
         thread = threading.Thread(target=move_in_thread)
         thread.daemon = True
         thread.start()
         
-    def execute_file_move_sync(self, move_num, source_path, target_path, filename_pattern):
-        """파일 이동 실행 (동기 버전 - 순차 실행용)"""
+    def execute_file_move_sync(self, move_num, source_path, target_path, filename_pattern, index=None, manifest=None):
+        """파일 이동 실행 (동기 버전 - 순차 실행용, index: 여러 규칙이 공유하는 소스 폴더 스캔 결과,
+        manifest: 동기화 기록 - 마지막 복사 이후 바뀌지 않았으면 복사 생략)
+        
+        반환: 실행 기록용 통계 (scanned, copied, bytes_copied, bytes_skipped, error)"""
+        rule = {"number": move_num, "source": source_path, "target": target_path, "filename": filename_pattern}
+        stats = {"scanned": 0, "copied": 0, "bytes_copied": 0, "bytes_skipped": 0, "error": None}
         try:
             self.log_message(f"🔍 이동 설정 {move_num} 검증 시작...")
             
@@ -614,7 +908,8 @@ class FileOrganizerGUI:
                 self.log_message(f"❌ 이동 설정 {move_num}: 소스 또는 대상 경로가 설정되지 않았습니다.")
                 self.log_message(f"   소스 경로: {source_path}")
                 self.log_message(f"   대상 경로: {target_path}")
-                return
+                stats["error"] = "소스 또는 대상 경로 미설정"
+                return stats
                 
             source_dir = Path(source_path)
             target_dir = Path(target_path)
@@ -622,7 +917,8 @@ class FileOrganizerGUI:
             self.log_message(f"📂 소스 폴더 확인: {source_path}")
             if not source_dir.exists():
                 self.log_message(f"❌ 이동 설정 {move_num}: 소스 폴더가 존재하지 않습니다: {source_path}")
-                return
+                stats["error"] = f"소스 폴더 없음: {source_path}"
+                return stats
             else:
                 self.log_message(f"✅ 소스 폴더 존재 확인: {source_path}")
                 
@@ -645,140 +941,78 @@ class FileOrganizerGUI:
             # 이동 설정용 덮어쓰기 모드 (백업 없음)
             self.log_message(f"   ⚙️ 정리 모드: 덮어쓰기 (백업 없음)")
             
-            # 해당 이동 설정에 맞는 파일만 처리
+            # 해당 이동 설정에 맞는 파일만 처리 (소스 폴더 스캔 결과 재사용)
             moved_count = 0
+            if index is None:
+                index = SourceIndex([rule])
+            listing = index.listing(source_path)
+            selected = index.match(rule, listing)
+            listing = listing or []
+            stats["scanned"] = len(listing)
+            
+            def format_mtime(entry):
+                return datetime.fromtimestamp(entry["mtime"]).strftime('%Y-%m-%d %H:%M:%S')
             
-            # 파일명 패턴이 있는 경우: 해당 패턴에 맞는 파일만 처리
             if filename_pattern:
-                self.log_message(f"🔍 정확한 파일명 매칭 검색 시작...")
-                self.log_message(f"   🔍 검색할 정확한 파일명: '{filename_pattern}'")
-                
-                # 소스 폴더에서 정확히 일치하는 파일 찾기
-                target_file_path = source_dir / filename_pattern
-                matching_files = []
-                
-                if target_file_path.exists() and target_file_path.is_file():
-                    matching_files = [target_file_path]
-                    self.log_message(f"   ✅ 정확한 파일명 발견: {filename_pattern}")
+                self.log_message(f"🔍 파일명 매칭 검색 시작...")
+                self.log_message(f"   🔍 검색할 파일명: '{filename_pattern}'")
+                if selected:
+                    self.log_message(f"   ✅ 일치하는 파일 발견: {selected['name']}")
                 else:
-                    self.log_message(f"   ❌ 정확한 파일명을 찾을 수 없습니다: {filename_pattern}")
+                    self.log_message(f"   ❌ 일치하는 파일을 찾을 수 없습니다: {filename_pattern}")
                     self.log_message(f"   🔍 소스 폴더 내용:")
-                    try:
-                        for file in source_dir.iterdir():
-                            if file.is_file():
-                                file_time = datetime.fromtimestamp(file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                                self.log_message(f"      📄 {file.name} (수정시간: {file_time})")
-                    except Exception as e:
-                        self.log_message(f"      ❌ 폴더 내용 읽기 실패: {e}")
-                
-                if matching_files:
-                    # 파일 목록 출력
-                    for i, file in enumerate(matching_files, 1):
-                        file_time = datetime.fromtimestamp(file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                        self.log_message(f"   📄 {i}. {file.name} (수정시간: {file_time})")
-                    
-                    # 정확히 일치하는 파일 선택 (하나만 있을 것)
-                    selected_file = matching_files[0]
-                    selected_time = datetime.fromtimestamp(selected_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    self.log_message(f"   🎯 선택된 파일: {selected_file.name} (수정시간: {selected_time})")
-                    
-                    # 파일명 패턴 처리 (원본 파일명 유지)
-                    target_file = target_dir / selected_file.name
-                    self.log_message(f"   📝 대상 파일명: {selected_file.name} (원본 파일명 유지)")
-                    
-                    # 기존 파일 처리 (이동 설정용 덮어쓰기 모드 - 백업 없음)
-                    if target_file.exists():
-                        existing_time = datetime.fromtimestamp(target_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                        self.log_message(f"   ⚠️ 기존 파일 발견: {target_file.name} (수정시간: {existing_time})")
-                        self.log_message(f"   ⚠️ 기존 파일 덮어쓰기: {target_file.name} (백업 없음)")
-                    else:
-                        self.log_message(f"   ✅ 새 파일로 저장: {target_file.name}")
-                    
-                    try:
-                        # 이동 설정에서는 복사로 변경 (원본 파일 유지)
-                        self.log_message(f"   📋 파일 복사 시작...")
-                        shutil.copy2(str(selected_file), str(target_file))
-                        moved_count += 1
-                        self.log_message(f"   ✅ 복사 완료: {selected_file.name} → {target_file.name}")
-                        
-                        # 복사된 파일 정보 확인
-                        copied_file = Path(target_file)
-                        if copied_file.exists():
-                            copied_size = copied_file.stat().st_size
-                            copied_time = datetime.fromtimestamp(copied_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                            self.log_message(f"   📊 복사된 파일 정보:")
-                            self.log_message(f"      📁 경로: {copied_file}")
-                            self.log_message(f"      📏 크기: {copied_size:,} bytes")
-                            self.log_message(f"      🕒 수정시간: {copied_time}")
-                        else:
-                            self.log_message(f"   ❌ 복사된 파일이 존재하지 않습니다!")
-                            
-                    except Exception as e:
-                        self.log_message(f"   ❌ 복사 실패: {selected_file.name}")
-                        self.log_message(f"   🔍 오류 상세: {e}")
-                else:
-                    self.log_message(f"   ⚠️ 정확한 파일명을 찾을 수 없습니다: {filename_pattern}")
-            
-            # 파일명 패턴이 없는 경우: 가장 최신 파일만 처리
+                    for entry in listing:
+                        self.log_message(f"      📄 {entry['name']} (수정시간: {format_mtime(entry)})")
             else:
                 self.log_message(f"🔍 전체 파일 검색 시작...")
-                # 소스 폴더의 모든 파일 중 가장 최신 파일 선택
-                all_files = [f for f in source_dir.iterdir() if f.is_file()]
-                self.log_message(f"   📊 소스 폴더 파일 수: {len(all_files)}개")
+                self.log_message(f"   📊 소스 폴더 파일 수: {len(listing)}개")
+                for i, entry in enumerate(listing, 1):
+                    self.log_message(f"   📄 {i}. {entry['name']} (수정시간: {format_mtime(entry)})")
+                if not selected:
+                    self.log_message(f"   ⚠️ 소스 폴더에 파일이 없습니다: {source_path}")
+            
+            if selected and manifest is not None and manifest.is_current(selected["name"], selected["path"], selected):
+                self.log_message(f"   ⏭️ 변경 없음 - 복사 생략: {selected['name']} (수정시간: {format_mtime(selected)})")
+                stats["bytes_skipped"] += selected["size"]
+            elif selected:
+                self.log_message(f"   🎯 선택된 파일: {selected['name']} (수정시간: {format_mtime(selected)})")
                 
-                if all_files:
-                    # 파일 목록 출력
-                    for i, file in enumerate(all_files, 1):
-                        file_time = datetime.fromtimestamp(file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                        self.log_message(f"   📄 {i}. {file.name} (수정시간: {file_time})")
-                    
-                    latest_file = max(all_files, key=lambda x: x.stat().st_mtime)
-                    latest_time = datetime.fromtimestamp(latest_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    self.log_message(f"   🎯 최신 파일 선택: {latest_file.name} (수정시간: {latest_time})")
-                    
-                    target_file = target_dir / latest_file.name
-                    
-                    # 기존 파일 처리 (이동 설정용 덮어쓰기 모드 - 백업 없음)
-                    if target_file.exists():
-                        existing_time = datetime.fromtimestamp(target_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                        self.log_message(f"   ⚠️ 기존 파일 발견: {target_file.name} (수정시간: {existing_time})")
-                        self.log_message(f"   ⚠️ 기존 파일 덮어쓰기: {target_file.name} (백업 없음)")
-                    else:
-                        self.log_message(f"   ✅ 새 파일로 저장: {target_file.name}")
-                    
-                    try:
-                        # 이동 설정에서는 복사로 변경 (원본 파일 유지)
-                        self.log_message(f"   📋 파일 복사 시작...")
-                        shutil.copy2(str(latest_file), str(target_file))
-                        moved_count += 1
-                        self.log_message(f"   ✅ 복사 완료: {latest_file.name}")
-                        
-                        # 복사된 파일 정보 확인
-                        copied_file = Path(target_file)
-                        if copied_file.exists():
-                            copied_size = copied_file.stat().st_size
-                            copied_time = datetime.fromtimestamp(copied_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                            self.log_message(f"   📊 복사된 파일 정보:")
-                            self.log_message(f"      📁 경로: {copied_file}")
-                            self.log_message(f"      📏 크기: {copied_size:,} bytes")
-                            self.log_message(f"      🕒 수정시간: {copied_time}")
-                        else:
-                            self.log_message(f"   ❌ 복사된 파일이 존재하지 않습니다!")
-                            
-                    except Exception as e:
-                        self.log_message(f"   ❌ 복사 실패: {latest_file.name}")
-                        self.log_message(f"   🔍 오류 상세: {e}")
+                # 원본 파일명 유지
+                target_file = target_dir / selected["name"]
+                
+                # 기존 파일 처리 (이동 설정용 덮어쓰기 모드 - 백업 없음)
+                if target_file.exists():
+                    existing_time = datetime.fromtimestamp(target_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+                    self.log_message(f"   ⚠️ 기존 파일 발견: {target_file.name} (수정시간: {existing_time})")
+                    self.log_message(f"   ⚠️ 기존 파일 덮어쓰기: {target_file.name} (백업 없음)")
                 else:
-                    self.log_message(f"   ⚠️ 소스 폴더에 파일이 없습니다: {source_path}")
-                    self.log_message(f"   🔍 소스 폴더 내용:")
-                    try:
-                        for item in source_dir.iterdir():
-                            if item.is_dir():
-                                self.log_message(f"      📁 [폴더] {item.name}")
-                            else:
-                                self.log_message(f"      📄 {item.name}")
-                    except Exception as e:
-                        self.log_message(f"      ❌ 폴더 내용 읽기 실패: {e}")
+                    self.log_message(f"   ✅ 새 파일로 저장: {target_file.name}")
+                
+                try:
+                    # 이동 설정에서는 복사로 변경 (원본 파일 유지)
+                    self.log_message(f"   📋 파일 복사 시작...")
+                    copy_via_temp(get_backend(self.config.get("backend", "fast")).copy, selected["path"], target_file)
+                    moved_count += 1
+                    stats["copied"] += 1
+                    stats["bytes_copied"] += selected["size"]
+                    if manifest is not None:
+                        manifest.record(selected["name"], selected["path"], selected, target_file)
+                    self.log_message(f"   ✅ 복사 완료: {selected['name']} → {target_file.name}")
+                    self.log_message(f"   📊 복사된 파일 정보:")
+                    self.log_message(f"      📁 경로: {target_file}")
+                    self.log_message(f"      📏 크기: {selected['size']:,} bytes")
+                    self.log_message(f"      🕒 수정시간: {format_mtime(selected)}")
+                except Exception as e:
+                    self.log_message(f"   ❌ 복사 실패: {selected['name']}")
+                    self.log_message(f"   🔍 오류 상세: {e}")
+                    stats["error"] = f"복사 실패: {selected['name']} - {e}"
+                        
+            # 원본에서 지워진 파일의 복사본 정리 (설정 시)
+            if manifest is not None:
+                if self.config.get("sync_mirror_deletes", False):
+                    for deleted in manifest.mirror_deletions(entry["name"] for entry in listing):
+                        self.log_message(f"   🗑️ 원본이 없어진 복사본 삭제: {deleted.name}")
+                manifest.save()
                         
             self.log_message(f"✅ 이동 설정 {move_num} 완료: {moved_count}개 파일 복사됨")
             self.log_message(f"   📊 처리 결과 요약:")
@@ -794,11 +1028,23 @@ class FileOrganizerGUI:
             for line in traceback.format_exc().split('\n'):
                 if line.strip():
                     self.log_message(f"   {line}")
+            stats["error"] = str(e)
+        return stats
     
     def handle_existing_file(self, target_file, cleanup_mode, max_backup_files):
         """기존 파일 처리 (정리 모드에 따라)"""
         try:
-            if cleanup_mode == "backup":
+            if cleanup_mode in ("backup", "rename") and self.config.get("version_history", True):
+                # 버전 기록 모드: 전체 사본 대신 이전 버전과의 차이만 저장 (주기적으로 전체 스냅샷)
+                store = VersionStore(target_file,
+                                     snapshot_every=int(self.config.get("version_snapshot_every", 20)),
+                                     max_versions=int(self.config.get("version_max_count", 500)))
+                entry = store.add()
+                if entry:
+                    self.log_message(f"  📚 버전 기록 저장: {target_file.name} v{entry['version']} "
+                                     f"({entry['kind']}, {(store.directory / entry['file']).stat().st_size:,} bytes)")
+                
+            elif cleanup_mode == "backup":
                 # 백업 모드: 타임스탬프로 백업
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 backup_path = target_file.with_suffix(f'.backup_{timestamp}')
@@ -872,47 +1118,21 @@ class FileOrganizerGUI:
         except Exception as e:
             self.log_message(f"  ⚠️ 로그 파일 정리 중 오류: {e}")
     
-    def generate_filename_from_pattern(self, file_path, pattern):
-        """파일명 패턴에서 실제 파일명 생성"""
+    def generate_filename_from_pattern(self, file_path, pattern, allocator=None, now=None):
+        """파일명 패턴에서 실제 파일명 생성 (allocator: 같은 작업 안에서 이름이 겹치지 않게 배정)"""
         try:
-            # 현재 날짜/시간 정보
-            now = datetime.now()
-            date_str = now.strftime("%Y%m%d")
-            time_str = now.strftime("%H%M%S")
-            datetime_str = now.strftime("%Y%m%d_%H%M%S")
-            
-            # 파일 정보
-            original_name = file_path.stem  # 확장자 제외
-            extension = file_path.suffix    # 확장자만
-            full_name = file_path.name      # 전체 파일명
-            
-            # 패턴 치환
-            new_filename = pattern
-            new_filename = new_filename.replace("{name}", original_name)
-            new_filename = new_filename.replace("{ext}", extension)
-            new_filename = new_filename.replace("{fullname}", full_name)
-            new_filename = new_filename.replace("{date}", date_str)
-            new_filename = new_filename.replace("{time}", time_str)
-            new_filename = new_filename.replace("{datetime}", datetime_str)
-            new_filename = new_filename.replace("{year}", str(now.year))
-            new_filename = new_filename.replace("{month}", f"{now.month:02d}")
-            new_filename = new_filename.replace("{day}", f"{now.day:02d}")
-            new_filename = new_filename.replace("{hour}", f"{now.hour:02d}")
-            new_filename = new_filename.replace("{minute}", f"{now.minute:02d}")
-            new_filename = new_filename.replace("{second}", f"{now.second:02d}")
-            
-            # 확장자가 패턴에 포함되지 않은 경우 추가
-            if not new_filename.endswith(extension) and not new_filename.endswith(extension.lower()):
-                new_filename += extension
-                
-            return new_filename
-            
+            if allocator is not None:
+                return allocator.allocate(compile_template(pattern), file_path, now)
+            return format_filename(file_path, pattern, now)
         except Exception as e:
             self.log_message(f"⚠️ 파일명 패턴 처리 중 오류: {e}")
             return file_path.name  # 오류 시 원본 파일명 사용
     
-    def save_files_to_organized_folder(self, source_dir, target_dir, filename_pattern):
-        """소스 폴더의 파일들을 대상 폴더에 파일명 패턴으로 저장"""
+    def save_files_to_organized_folder(self, source_dir, target_dir, filename_pattern, manifest=None,
+                                       cleanup_mode=None, max_backup_files=None):
+        """소스 폴더의 파일들을 대상 폴더에 파일명 패턴으로 저장 (manifest: 바뀐 파일만 복사)
+        
+        작업 스레드에서 호출된다. cleanup_mode/max_backup_files를 넘기지 않으면 저장된 설정 값을 사용."""
         try:
             source_path = Path(source_dir)
             target_path = Path(target_dir)
@@ -931,171 +1151,1089 @@ class FileOrganizerGUI:
             self.log_message(f"  파일명 패턴: {filename_pattern}")
             
             # 메인 폴더의 정리 모드 가져오기
-            cleanup_mode = self.cleanup_mode_var.get()
-            max_backup_files = int(self.max_cleanup_backup_var.get())
+            if cleanup_mode is None:
+                cleanup_mode = self.config.get("cleanup_mode", "delete")
+            if max_backup_files is None:
+                max_backup_files = int(self.config.get("max_cleanup_backup_files", 5))
             self.log_message(f"  정리 모드: {cleanup_mode}")
             
-            saved_count = 0
-            for file_path in source_path.iterdir():
-                if file_path.is_file():
-                    # 파일명 패턴 처리
-                    if filename_pattern:
-                        new_filename = self.generate_filename_from_pattern(file_path, filename_pattern)
-                        target_file = target_path / new_filename
-                    else:
-                        target_file = target_path / file_path.name
-                    
-                    # 기존 파일 처리 (메인 폴더 정리 모드 사용)
-                    if target_file.exists():
-                        self.handle_existing_file(target_file, cleanup_mode, max_backup_files)
-                    
-                    try:
-                        # 파일 복사
-                        shutil.copy2(str(file_path), str(target_file))
-                        saved_count += 1
-                        if filename_pattern:
-                            self.log_message(f"  ✅ 저장 완료: {file_path.name} → {target_file.name}")
+            now = datetime.now()  # 모든 파일에 같은 시각 사용
+            template = compile_template(filename_pattern) if filename_pattern else None
+            fingerprints = {}  # 원본 경로 → 스캔 때 읽은 크기/수정시간/inode
+            present = []
+            skipped = [0]
+            
+            def scan_files():
+                # 스캔하면서 바로 복사 작업으로 넘김 (크기는 스캔 때 읽은 값 사용)
+                with os.scandir(source_path) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+                        file_path = Path(entry.path)
+                        stat = entry.stat()
+                        present.append(entry.name)
+                        fingerprint = {"size": stat.st_size, "mtime": stat.st_mtime, "inode": entry.inode()}
+                        if manifest is not None and manifest.is_current(entry.name, file_path, fingerprint):
+                            skipped[0] += 1
+                            continue
+                        fingerprints[file_path] = fingerprint
+                        # 파일명 패턴 처리 (같은 초에 저장해도 이름이 겹치지 않음)
+                        if template:
+                            try:
+                                new_filename = allocator.allocate(template, file_path, now, stat)
+                            except Exception as e:
+                                self.log_message(f"⚠️ 파일명 패턴 처리 중 오류: {e}")
+                                new_filename = allocator.reserve(file_path.name)
+                            target_file = target_path / new_filename
                         else:
-                            self.log_message(f"  ✅ 저장 완료: {file_path.name}")
-                    except Exception as e:
-                        self.log_message(f"  ❌ 저장 실패: {file_path.name} - {e}")
+                            # 패턴이 없어도 배정기를 거쳐 동시에 저장하는 작업과 이름(.tmp 경로)이 겹치지 않게 함
+                            target_file = target_path / allocator.reserve(file_path.name)
+                        yield file_path, target_file, stat.st_size
+            
+            def prepare_target(target_file):
+                # 기존 파일 처리 (메인 폴더 정리 모드 사용)
+                if target_file.exists():
+                    self.handle_existing_file(target_file, cleanup_mode, max_backup_files)
             
-            self.log_message(f"✅ 파일 정리 옵션으로 저장 완료: {saved_count}개 파일 저장됨")
+            def on_progress(info):
+                total = f"/{info['total']}" if info["total"] is not None else ""
+                eta = f", 남은 시간 {info['eta_seconds']:.0f}초" if info["eta_seconds"] is not None else ""
+                self.log_message(f"  📊 진행: {info['done']}{total}개, {info['files_per_s']:.1f}개/초, "
+                                 f"{info['mb_per_s']:.1f}MB/초{eta}")
+                self.on_run_progress("정리 옵션 저장", info)
+            
+            # 같은 대상 폴더에 동시에 저장 중인 작업과 같은 배정기를 공유 (이름이 겹치지 않음)
+            allocator = acquire_name_allocator(target_path)
+            cancel_event = self.begin_run("정리 옵션 저장")
+            try:
+                result = run_copy_pipeline(
+                    scan_files(), prepare_target,
+                    small_workers=int(self.config.get("copy_small_workers", 4)),
+                    large_workers=int(self.config.get("copy_large_workers", 2)),
+                    large_threshold=int(self.config.get("copy_large_file_mb", 8)) * 1024 * 1024,
+                    progress_callback=on_progress,
+                    copy=get_backend(self.config.get("backend", "fast")).copy,
+                    on_copied=(lambda source, target: manifest.record(source.name, source, fingerprints[source], target))
+                    if manifest is not None else None,
+                    cancel_event=cancel_event)
+            finally:
+                release_name_allocator(allocator)
+                self.end_run(cancel_event, "정리 옵션 저장")
+            
+            for source, error in result["errors"]:
+                self.log_message(f"  ❌ 저장 실패: {Path(source).name} - {error}")
+            
+            if manifest is not None:
+                # 중지되었으면 스캔하지 못한 파일이 있으므로 원본 삭제는 반영하지 않음 (복사를 마친 파일은 기록)
+                if self.config.get("sync_mirror_deletes", False) and not result["cancelled"]:
+                    for deleted in manifest.mirror_deletions(present):
+                        self.log_message(f"  🗑️ 원본이 없어진 복사본 삭제: {deleted.name}")
+                manifest.save()
+                if skipped[0]:
+                    self.log_message(f"  ⏭️ 변경 없는 파일 {skipped[0]}개는 복사 생략")
+            
+            if result["cancelled"]:
+                self.log_message(f"⏹ 파일 정리 옵션으로 저장 중지: {result['copied']}개 파일 저장됨, 남은 파일은 저장하지 않음")
+                return False
+            self.log_message(f"✅ 파일 정리 옵션으로 저장 완료: {result['copied']}개 파일 저장됨 "
+                             f"({result['bytes'] / (1024 * 1024):.1f}MB, {result['seconds']:.2f}초, "
+                             f"{result['files_per_s']:.1f}개/초, {result['mb_per_s']:.1f}MB/초)")
             return True
             
         except Exception as e:
             self.log_message(f"❌ 파일 정리 옵션으로 저장 중 오류: {e}")
             return False
         
+    def begin_run(self, label):
+        """취소 가능한 작업 시작 - 작업이 확인할 취소 신호 반환"""
+        cancel_event = threading.Event()
+        self.run_cancel_events.add(cancel_event)
+        self.call_in_ui(self.show_run_state, f"{label} 시작...")
+        return cancel_event
+        
+    def end_run(self, cancel_event, label):
+        """취소 가능한 작업 종료"""
+        self.run_cancel_events.discard(cancel_event)
+        self.call_in_ui(self.show_run_state, f"{label} {'취소됨' if cancel_event.is_set() else '완료'}")
+        
+    def cancel_runs(self):
+        """실행 중인 모든 작업에 취소 요청 (진행 중인 파일까지 처리하고 멈춤)"""
+        if not self.run_cancel_events:
+            return
+        self.cancel_requested_at = time.monotonic()
+        for cancel_event in list(self.run_cancel_events):
+            cancel_event.set()
+        self.log_message("⏹ 중지 요청 - 처리 중인 파일까지 마치고 멈춥니다.")
+        self.cancel_button.config(state=tk.DISABLED)
+        
+    def show_run_state(self, text):
+        """진행 표시 시작/종료 문구와 중지 버튼 상태 갱신"""
+        running = any(not cancel_event.is_set() for cancel_event in list(self.run_cancel_events))
+        self.cancel_button.config(state=tk.NORMAL if running else tk.DISABLED)
+        self.progress_label.config(text=text)
+        if not self.run_cancel_events:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", value=0)
+        
+    def on_run_progress(self, label, info):
+        """작업 진행 콜백 (작업 스레드에서 호출됨) - UI 갱신은 update_log가 Tk 스레드에서"""
+        self.call_in_ui(self.show_progress, label, info)
+        
+    def show_progress(self, label, info):
+        """진행률 막대와 처리량/남은 시간 표시"""
+        text, percent = format_progress(label, info)
+        if percent is None:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.config(mode="indeterminate")
+                self.progress_bar.start(50)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", value=percent)
+        self.progress_label.config(text=text)
+        
+    def on_ui_stall(self, lag, culprit, seconds):
+        """UI 멈춤 감지 (긴 멈춤만 실행 로그에 기록)"""
+        if lag * 1000 >= UI_STALL_LOG_MS:
+            self.log_message(f"⚠️ UI 멈춤 {lag * 1000:.0f}ms - 원인 추정: {culprit} ({seconds * 1000:.0f}ms)")
+        
+    def update_ui_lag_indicator(self):
+        """UI 지연 표시 갱신 (1초마다)"""
+        lag_ms = self.ui_lag_monitor.current_lag() * 1000
+        if lag_ms < 50:
+            color = "green"
+        elif lag_ms < UI_STALL_MS:
+            color = "orange"
+        else:
+            color = "red"
+        self.ui_lag_label.config(text=f"UI 지연: {lag_ms:.0f}ms (멈춤 {self.ui_lag_monitor.stall_count}회)",
+                                 foreground=color)
+        self.root.after(1000, self.update_ui_lag_indicator)
+        
+    def show_ui_lag_report(self):
+        """UI 멈춤 원인 핸들러 목록 창"""
+        if not self.ui_lag_monitor:
+            messagebox.showinfo("UI 지연", "UI 지연 측정이 꺼져 있습니다 (ui_lag_monitor).")
+            return
+        window = tk.Toplevel(self.root)
+        window.title("UI 지연 - 원인 핸들러")
+        window.geometry("640x400")
+        columns = ("name", "stalls", "max", "avg", "count", "total")
+        tree = ttk.Treeview(window, columns=columns, show="headings")
+        for column, text, width in [("name", "핸들러", 220), ("stalls", "멈춤", 60), ("max", "최대(ms)", 80),
+                                    ("avg", "평균(ms)", 80), ("count", "호출 수", 70), ("total", "합계(ms)", 90)]:
+            tree.heading(column, text=text)
+            tree.column(column, width=width, anchor=tk.W)
+        tree.pack(fill=tk.BOTH, expand=True)
+        for row in self.ui_lag_monitor.top_offenders():
+            tree.insert("", tk.END, values=(row["name"], row["stalls"], f"{row['max'] * 1000:.1f}",
+                                            f"{row['total'] / row['count'] * 1000:.1f}", row["count"],
+                                            f"{row['total'] * 1000:.0f}"))
+        
     def log_message(self, message):
         """로그 메시지 추가"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
         self.log_queue.put(log_entry)
         
+    def call_in_ui(self, func, *args):
+        """Tk 스레드에서 실행할 화면 갱신 예약 (작업 스레드에서 호출, update_log가 실행)"""
+        self.ui_queue.put((func, args))
+        
+    def run_ui_calls(self):
+        """예약된 화면 갱신 실행 (Tk 스레드)"""
+        while True:
+            try:
+                func, args = self.ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(*args)
+            except Exception as e:
+                self.log_message(f"⚠️ 화면 갱신 오류 ({handler_name(func)}): {e}")
+        
     def update_log(self):
-        """로그 업데이트"""
+        """로그 업데이트 (모아서 한 번에 반영, 창에는 최근 LOG_MAX_LINES줄만 유지)"""
+        self.run_ui_calls()
+        
+        batch = []
         try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self.log_text.insert(tk.END, message)
-                self.log_text.see(tk.END)
+            while len(batch) < LOG_MAX_BATCH:
+                batch.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
         
-        # 100ms 후 다시 업데이트
-        self.root.after(100, self.update_log)
+        if batch:
+            text = "".join(batch)
+            self.write_log_file(text)
+            
+            # 사용자가 위로 스크롤해 둔 경우에는 자동 스크롤하지 않음
+            at_bottom = self.log_text.yview()[1] >= 0.999
+            self.log_text.insert(tk.END, text)
+            
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES + 1}.0')
+            
+            if at_bottom:
+                self.log_text.see(tk.END)
+        
+        self.root.after(LOG_UPDATE_INTERVAL_MS, self.update_log)
+        
+    def write_log_file(self, text):
+        """전체 로그를 파일에 추가"""
+        try:
+            if self.log_file is None:
+                self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
+                self.log_file = open(self.log_file_path, 'a', encoding='utf-8')
+            self.log_file.write(text)
+            self.log_file.flush()
+        except OSError:
+            pass  # 로그 파일 기록 실패는 화면 표시에 영향을 주지 않음
+        
+    def search_log(self):
+        """로그 파일에서 검색어가 포함된 줄 찾기 (별도 스레드)"""
+        keyword = self.log_search_var.get().strip()
+        if not keyword:
+            return
+        
+        def search_in_thread():
+            matches = []
+            total = 0
+            log_files = sorted(Path("logs").glob("gui_log_*.txt"))
+            for log_file in log_files:
+                try:
+                    with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                        for line in f:
+                            if keyword in line:
+                                total += 1
+                                if len(matches) < LOG_SEARCH_MAX_RESULTS:
+                                    matches.append(f"{log_file.name}: {line}")
+                except OSError:
+                    continue
+            self.call_in_ui(self.show_search_results, keyword, matches, total)
+            
+        thread = threading.Thread(target=search_in_thread)
+        thread.daemon = True
+        thread.start()
+        
+    def show_search_results(self, keyword, matches, total):
+        """로그 검색 결과 창"""
+        window = tk.Toplevel(self.root)
+        window.title(f"로그 검색: {keyword} ({total}건)")
+        window.geometry("900x500")
+        result_text = scrolledtext.ScrolledText(window)
+        result_text.pack(fill=tk.BOTH, expand=True)
+        
+        if total > len(matches):
+            result_text.insert(tk.END, f"※ {total}건 중 처음 {len(matches)}건만 표시\n\n")
+        result_text.insert(tk.END, "".join(matches) or "검색 결과가 없습니다.\n")
+        
+        # 검색어 강조
+        result_text.tag_configure("match", background="yellow")
+        start = "1.0"
+        while True:
+            start = result_text.search(keyword, start, stopindex=tk.END)
+            if not start:
+                break
+            end = f"{start}+{len(keyword)}c"
+            result_text.tag_add("match", start, end)
+            start = end
+        result_text.configure(state=tk.DISABLED)
         
     def run_organizer(self):
-        """파일 정리 실행"""
+        """파일 정리 실행 (정리 → 이동 → 로그 정리, 이미 실행 중인 작업은 건너뜀)"""
+        # 설정 저장 (Tk 변수를 읽으므로 작업 스레드를 시작하기 전에)
+        self.save_config()
+        
         def run_in_thread():
-            try:
-                self.log_message("�� 파일 정리를 시작합니다...")
-                self.log_message(f"   📅 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # 설정 저장
-                self.save_config()
-                self.log_message("✅ 설정이 저장되었습니다.")
-                
-                # 파일 정리 스크립트 실행
-                self.log_message("📋 파일 정리 스크립트를 실행합니다...")
-                self.log_message(f"   📁 현재 작업 디렉토리: {Path.cwd()}")
-                
-                result = subprocess.run([sys.executable, "file_organizer.py"], 
-                                      capture_output=True, text=True, 
-                                      encoding='cp949', errors='replace')  # Windows 한글 인코딩
-                
-                self.log_message(f"   📊 스크립트 실행 결과:")
-                self.log_message(f"      🔢 종료 코드: {result.returncode}")
-                self.log_message(f"      📏 출력 길이: {len(result.stdout)} 문자")
-                self.log_message(f"      📏 오류 길이: {len(result.stderr)} 문자")
-                
-                if result.returncode == 0:
-                    self.log_message("✅ 파일 정리가 완료되었습니다!")
-                    if result.stdout:
-                        self.log_message("   📄 스크립트 출력:")
-                        for line in result.stdout.strip().split('\n'):
-                            if line.strip():
-                                self.log_message(f"      {line.strip()}")
-                else:
-                    self.log_message("❌ 파일 정리에 실패했습니다.")
-                    if result.stderr:
-                        self.log_message("   ❌ 오류 출력:")
-                        for line in result.stderr.strip().split('\n'):
-                            if line.strip():
-                                self.log_message(f"      {line.strip()}")
-                
-                # 활성화된 파일 이동 작업 실행
-                self.log_message("🔄 파일 이동 작업을 시작합니다...")
-                self.execute_enabled_moves()
-                
-                # 로그 파일 정리
-                max_log_files = int(self.max_log_files_var.get())
-                self.log_message(f"🧹 로그 파일 정리를 시작합니다... (최대 {max_log_files}개 유지)")
-                self.cleanup_old_log_files(max_log_files)
-                
-                self.log_message("🎯 모든 작업이 완료되었습니다!")
-                                
-            except Exception as e:
-                self.log_message(f"❌ 실행 중 오류 발생: {e}")
-                self.log_message(f"🔍 오류 상세 정보:")
-                import traceback
-                for line in traceback.format_exc().split('\n'):
-                    if line.strip():
-                        self.log_message(f"   {line}")
+            started = time.monotonic()
+            for name in ("organize", "moves", "log_cleanup"):
+                if self.cancel_requested_at > started:
+                    self.log_message(f"⏹ 중지 요청으로 {JOB_LABELS[name]}을(를) 실행하지 않습니다.")
+                    continue
+                if not self.scheduler.run_now(name):
+                    self.log_message(f"⏭️ {JOB_LABELS[name]}이(가) 이미 실행 중이라 건너뜁니다.")
+            self.log_message("🎯 모든 작업이 완료되었습니다!")
+            self.call_in_ui(self.update_job_status)
                 
         thread = threading.Thread(target=run_in_thread)
         thread.daemon = True
         thread.start()
         
-    def execute_enabled_moves(self):
-        """활성화된 파일 이동 작업 순차 실행"""
-        def execute_moves_sequentially():
-            self.log_message("🔄 활성화된 파일 이동 작업을 순차적으로 실행합니다...")
-            self.log_message(f"   📅 실행 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            # 활성화된 이동 설정 확인
-            enabled_moves = []
-            if self.move1_enabled_var.get() and self.move1_source_var.get() and self.move1_target_var.get():
-                enabled_moves.append(1)
-            if self.move2_enabled_var.get() and self.move2_source_var.get() and self.move2_target_var.get():
-                enabled_moves.append(2)
+    def organize_job(self):
+        """파일 정리 작업 (스케줄러에서 호출)"""
+        try:
+            self.log_message("�� 파일 정리를 시작합니다...")
+            self.log_message(f"   📅 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             
-            self.log_message(f"   📊 활성화된 이동 설정: {enabled_moves}")
-            self.log_message(f"   📊 총 실행할 이동 설정 수: {len(enabled_moves)}개")
+            # 파일 정리 엔진 실행
+            self.log_message("📋 파일 정리 엔진을 실행합니다...")
+            organizer = self.get_organizer()
+            profiler = PhaseProfiler.from_config(organizer.config)
+            cancel_event = self.begin_run("파일 정리")
+            try:
+                result = organizer.run(progress_callback=self.on_organizer_progress, profiler=profiler,
+                                       progress_stats=lambda info: self.on_run_progress("파일 정리", info),
+                                       cancel_event=cancel_event)
+            finally:
+                self.end_run(cancel_event, "파일 정리")
             
-            if not enabled_moves:
-                self.log_message("   ⚠️ 활성화된 이동 설정이 없습니다.")
-                return
+            self.log_message(f"   📊 실행 결과:")
+            self.log_message(f"      📄 발견된 파일: {len(result['files_found'])}개")
+            if result["latest_file"]:
+                self.log_message(f"      🎯 선택된 파일: {Path(result['latest_file']).name}")
+            self.log_message(f"      📏 복사된 크기: {result['bytes_copied']:,} bytes")
+            timings = ", ".join(f"{phase} {seconds * 1000:.1f}ms" for phase, seconds in result["timings"].items())
+            self.log_message(f"      ⏱️ 단계별 소요시간: {timings or '-'} (총 {result['total_time']:.2f}초)")
+            for folder, seconds in result["folder_timings"].items():
+                self.log_message(f"      📂 폴더 검색: {folder} ({seconds * 1000:.1f}ms)")
+            if profiler.enabled:
+                self.log_profile(profiler)
             
-            # 이동 설정 1
-            if 1 in enabled_moves:
-                self.log_message("📁 이동 설정 1을 실행합니다...")
-                self.log_message(f"   📍 소스: {self.move1_source_var.get()}")
-                self.log_message(f"   📍 대상: {self.move1_target_var.get()}")
-                self.log_message(f"   📝 패턴: {self.move1_filename_var.get()}")
-                start_time = datetime.now()
-                self.execute_file_move_sync(1, self.move1_source_var.get(), self.move1_target_var.get(), self.move1_filename_var.get())
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                self.log_message(f"✅ 이동 설정 1 완료 (소요시간: {duration:.2f}초)")
+            if result["success"]:
+                self.log_message("✅ 파일 정리가 완료되었습니다!")
+            elif result["cancelled"]:
+                self.log_message(f"⏹ {result['message']}")
+            else:
+                self.log_message(f"❌ 파일 정리에 실패했습니다: {result['message']}")
+            self.call_in_ui(self.refresh_dashboard)
+                            
+        except Exception as e:
+            self.log_message(f"❌ 실행 중 오류 발생: {e}")
+            self.log_message(f"🔍 오류 상세 정보:")
+            import traceback
+            for line in traceback.format_exc().split('\n'):
+                if line.strip():
+                    self.log_message(f"   {line}")
+            raise
             
-            # 이동 설정 2
-            if 2 in enabled_moves:
-                self.log_message("📁 이동 설정 2를 실행합니다...")
-                self.log_message(f"   📍 소스: {self.move2_source_var.get()}")
-                self.log_message(f"   📍 대상: {self.move2_target_var.get()}")
-                self.log_message(f"   📝 패턴: {self.move2_filename_var.get()}")
-                start_time = datetime.now()
-                self.execute_file_move_sync(2, self.move2_source_var.get(), self.move2_target_var.get(), self.move2_filename_var.get())
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                self.log_message(f"✅ 이동 설정 2 완료 (소요시간: {duration:.2f}초)")
+    def cleanup_logs_job(self):
+        """로그 파일 정리 작업 (스케줄러에서 호출)"""
+        max_log_files = int(self.config.get("max_log_files", 10))
+        self.log_message(f"🧹 로그 파일 정리를 시작합니다... (최대 {max_log_files}개 유지)")
+        self.cleanup_old_log_files(max_log_files)
+        
+    def execute_enabled_moves(self):
+        """활성화된 파일 이동 작업 실행 (이미 실행 중이면 건너뜀)"""
+        def execute_moves():
+            if not self.scheduler.run_now("moves"):
+                self.log_message("⏭️ 파일 이동 작업이 이미 실행 중이라 건너뜁니다.")
+        
+        thread = threading.Thread(target=execute_moves)
+        thread.daemon = True
+        thread.start()
+        
+    def execute_enabled_moves_sync(self):
+        """활성화된 파일 이동 작업 실행 (대상 드라이브가 다르면 병렬, 같으면 순서대로)"""
+        self.log_message("🔄 활성화된 파일 이동 작업을 실행합니다...")
+        self.log_message(f"   📅 실행 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        # 활성화된 이동 설정 확인 (저장된 설정 기준)
+        enabled_rules = [rule for rule in get_move_rules(self.config)
+                         if rule["enabled"] and rule["source"] and rule["target"]]
+        
+        self.log_message(f"   📊 활성화된 이동 설정: {[rule['number'] for rule in enabled_rules]}")
+        self.log_message(f"   📊 총 실행할 이동 설정 수: {len(enabled_rules)}개")
+        
+        if not enabled_rules:
+            self.log_message("   ⚠️ 활성화된 이동 설정이 없습니다.")
+            return
+        
+        profiler = PhaseProfiler.from_config(self.config)
+        started_at = datetime.now()
+        rule_stats = {}  # 규칙 번호 → execute_file_move_sync 통계 (실행 기록용)
+        
+        # 소스 폴더마다 한 번만 스캔하고 모든 규칙이 결과를 공유 (다른 규칙의 대상 폴더인 소스는 실행 직전에 스캔)
+        with profiler.phase("scan_sources"):
+            index = SourceIndex(enabled_rules)
+        self.log_message(f"   📂 소스 폴더 {index.directory_count}개 스캔 완료 ({index.scan_seconds * 1000:.1f}ms)")
+        
+        cancel_event = self.begin_run("파일 이동")
+        tracker = ProgressTracker(len(enabled_rules), 0, lambda info: self.on_run_progress("파일 이동", info))
+        tracker_lock = threading.Lock()
+        
+        def execute_rule(rule):
+            if cancel_event.is_set():
+                self.log_message(f"⏹ 이동 설정 {rule['number']}: 중지 요청으로 건너뜀")
+                return
+            self.log_message(f"📁 이동 설정 {rule['number']}을 실행합니다...")
+            self.log_message(f"   📍 소스: {rule['source']}")
+            self.log_message(f"   📍 대상: {rule['target']}")
+            self.log_message(f"   📝 패턴: {rule['filename']}")
+            with profiler.phase(rule["name"]):
+                rule_stats[rule["number"]] = self.execute_file_move_sync(
+                    rule["number"], rule["source"], rule["target"], rule["filename"],
+                    index, manifest_for_rule(self.config, rule))
+            with tracker_lock:
+                tracker.advance(1, rule_stats[rule["number"]]["bytes_copied"])
+        
+        start_time = time.perf_counter()
+        try:
+            results = run_move_rules(enabled_rules, execute_rule,
+                                     max_workers=int(self.config.get("max_move_workers", 4)))
+        finally:
+            self.end_run(cancel_event, "파일 이동")
+        total = time.perf_counter() - start_time
+        
+        for result in results:
+            if result["error"]:
+                self.log_message(f"❌ 이동 설정 {result['number']} 실패: {result['error']} (소요시간: {result['seconds']:.2f}초)")
+            else:
+                self.log_message(f"✅ 이동 설정 {result['number']} 완료 (소요시간: {result['seconds']:.2f}초)")
+        
+        if profiler.enabled:
+            self.log_profile(profiler)
+        
+        # 실행 기록 DB에 저장 (단계 = 소스 스캔 + 규칙별 소요 시간)
+        phases = {"scan_sources": index.scan_seconds}
+        phases.update({result["name"]: result["seconds"] for result in results})
+        errors = [f"{result['name']}: {result['error']}" for result in results if result["error"]]
+        errors += [f"{rule['name']}: {rule_stats[rule['number']]['error']}" for rule in enabled_rules
+                   if rule["number"] in rule_stats and rule_stats[rule["number"]]["error"]]
+        if cancel_event.is_set():
+            errors.append("사용자가 중지함")
+        self.get_organizer().record_run(
+            "moves", started_at, total + index.scan_seconds, phases,
+            files_scanned=sum(len(listing or []) for listing in index.listings.values()),
+            bytes_copied=sum(stats["bytes_copied"] for stats in rule_stats.values()),
+            bytes_skipped=sum(stats["bytes_skipped"] for stats in rule_stats.values()),
+            errors=errors, success=not errors)
+        self.call_in_ui(self.refresh_dashboard)
+        
+        self.log_message(f"🎯 모든 이동 설정 실행 완료 (전체 {total:.2f}초, 규칙별 합계 {sum(r['seconds'] for r in results):.2f}초)")
+        self.log_message(f"   📅 실행 완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+    def setup_dashboard(self, frame):
+        """대시보드 탭 구성 (최근 실행, 백분위수, 추세)"""
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(2, weight=1)
+        
+        top_frame = ttk.Frame(frame)
+        top_frame.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        ttk.Label(top_frame, text="종류:").pack(side=tk.LEFT)
+        self.dashboard_kind_var = tk.StringVar(value="organize")
+        kind_combo = ttk.Combobox(top_frame, textvariable=self.dashboard_kind_var,
+                                  values=["organize", "moves", "startup"], state="readonly", width=10)
+        kind_combo.pack(side=tk.LEFT, padx=(5, 5))
+        kind_combo.bind('<<ComboboxSelected>>', lambda event: self.refresh_dashboard())
+        ttk.Button(top_frame, text="새로고침", command=self.refresh_dashboard).pack(side=tk.LEFT)
+        
+        # 백분위수 / 추세 요약
+        self.dashboard_summary_label = ttk.Label(frame, text="실행 기록 없음", justify=tk.LEFT)
+        self.dashboard_summary_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 5))
+        
+        # 최근 실행 목록
+        columns = ("started_at", "duration", "files", "copied", "skipped", "status")
+        self.dashboard_tree = ttk.Treeview(frame, columns=columns, show="headings", height=12)
+        for column, text, width in [("started_at", "시작 시간", 140), ("duration", "소요(초)", 70),
+                                    ("files", "파일 수", 60), ("copied", "복사", 80),
+                                    ("skipped", "생략", 80), ("status", "결과", 200)]:
+            self.dashboard_tree.heading(column, text=text)
+            self.dashboard_tree.column(column, width=width, anchor=tk.W)
+        self.dashboard_tree.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # 소요 시간 추세 (최근 실행, 왼쪽이 오래된 것)
+        ttk.Label(frame, text="소요 시간 추세 (최근 100회)").grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
+        self.dashboard_canvas = tk.Canvas(frame, height=120, background="white", highlightthickness=1)
+        self.dashboard_canvas.grid(row=4, column=0, sticky=(tk.W, tk.E))
+        # 크기 변경은 DB를 다시 읽지 않고 받아 둔 기록으로 그래프만 다시 그림 (연속된 변경은 한 번으로)
+        self.dashboard_canvas.bind('<Configure>', lambda event: self.schedule_dashboard_redraw())
+        self.dashboard_chart = None  # 마지막으로 받은 (소요 시간 목록, 요약)
+        self.dashboard_redraw_id = None
+        self.dashboard_loading = False
+        self.dashboard_reload = False
+        
+    def refresh_dashboard(self):
+        """대시보드 갱신 - 실행 기록 DB 조회는 작업 스레드에서 (조회 중이면 끝난 뒤 한 번 더)"""
+        if not hasattr(self, "dashboard_tree") or self.right_notebook.index("current") != 1:
+            return
+        if self.dashboard_loading:
+            self.dashboard_reload = True
+            return
+        self.dashboard_loading = True
+        kind = self.dashboard_kind_var.get()
+        
+        def load_in_thread():
+            try:
+                history = self.get_organizer().get_history()
+                if history is None:
+                    data = {"error": "실행 기록이 꺼져 있습니다 (history_enabled)"}
+                else:
+                    data = {"runs": history.recent(50, kind), "summary": history.summary(kind),
+                            "durations": history.durations(kind, 100)}
+            except Exception as e:
+                data = {"error": f"실행 기록 조회 실패: {e}"}
+            self.call_in_ui(self.show_dashboard, data)
             
-            self.log_message(f"🎯 모든 이동 설정 실행 완료")
-            self.log_message(f"   📅 실행 완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        thread = threading.Thread(target=load_in_thread)
+        thread.daemon = True
+        thread.start()
+        
+    def show_dashboard(self, data):
+        """조회한 실행 기록 표시 (Tk 스레드)"""
+        self.dashboard_loading = False
+        if self.dashboard_reload:
+            self.dashboard_reload = False
+            self.refresh_dashboard()
+            return
         
-        thread = threading.Thread(target=execute_moves_sequentially)
+        if "error" in data:
+            self.dashboard_summary_label.config(text=data["error"])
+            return
+        summary = data["summary"]
+        if summary["count"]:
+            text = (f"최근 {summary['count']}회  p50 {summary['p50']:.2f}초 | p90 {summary['p90']:.2f}초 | "
+                    f"p99 {summary['p99']:.2f}초 | 최대 {summary['max']:.2f}초")
+            if summary["trend"]:
+                change = (summary["trend"] - 1) * 100
+                mark = "🔺" if change > 25 else ("🔻" if change < -25 else "➖")
+                text += f"\n추세 {mark} 최근 10회 중앙값 {summary['recent_median']:.2f}초 (이전 대비 {change:+.0f}%)"
+        else:
+            text = "실행 기록 없음"
+        self.dashboard_summary_label.config(text=text)
+        
+        self.dashboard_tree.delete(*self.dashboard_tree.get_children())
+        for run in data["runs"]:
+            status = "✅" if run["success"] else f"❌ {'; '.join(run['errors'])[:80]}"
+            self.dashboard_tree.insert("", tk.END, values=(
+                run["started_at"].replace("T", " "), f"{run['duration']:.2f}", run["files_scanned"],
+                f"{run['bytes_copied'] / 1024:,.0f}KB", f"{run['bytes_skipped'] / 1024:,.0f}KB", status))
+        
+        self.dashboard_chart = (data["durations"], summary)
+        self.draw_dashboard_chart()
+        
+    def schedule_dashboard_redraw(self):
+        """그래프 다시 그리기 예약 (크기 변경이 이어지면 마지막 한 번만)"""
+        if self.dashboard_redraw_id is not None:
+            self.root.after_cancel(self.dashboard_redraw_id)
+        self.dashboard_redraw_id = self.root.after(100, self.draw_dashboard_chart)
+        
+    def draw_dashboard_chart(self):
+        """추세 그래프 (막대) - 마지막으로 받은 기록으로 그림"""
+        self.dashboard_redraw_id = None
+        canvas = self.dashboard_canvas
+        canvas.delete("all")
+        if not self.dashboard_chart or not self.dashboard_chart[0]:
+            return
+        durations, summary = self.dashboard_chart
+        width = max(canvas.winfo_width(), 100)
+        height = max(canvas.winfo_height(), 60)
+        peak = max(durations) or 1
+        bar_width = width / len(durations)
+        for i, seconds in enumerate(durations):
+            bar_height = (height - 10) * seconds / peak
+            color = "#d9534f" if summary.get("p90") and seconds > summary["p90"] else "#5b9bd5"
+            canvas.create_rectangle(i * bar_width + 1, height - bar_height, (i + 1) * bar_width - 1, height,
+                                    fill=color, outline="")
+        canvas.create_text(4, 4, anchor=tk.NW, text=f"{peak:.2f}초", fill="gray")
+        
+    def setup_viewer(self, frame):
+        """데이터 보기 탭 구성"""
+        self.viewer_index = None
+        self.viewer_stop = None
+        self.viewer_first = 0
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(1, weight=1)
+        
+        top_frame = ttk.Frame(frame)
+        top_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        ttk.Button(top_frame, text="파일 열기", command=self.open_viewer_file).pack(side=tk.LEFT)
+        self.viewer_section_var = tk.StringVar()
+        self.viewer_section_combo = ttk.Combobox(top_frame, textvariable=self.viewer_section_var,
+                                                 state="readonly", width=12)
+        self.viewer_section_combo.pack(side=tk.LEFT, padx=(5, 5))
+        self.viewer_section_combo.bind('<<ComboboxSelected>>', lambda event: self.show_viewer_page(0))
+        self.viewer_status_label = ttk.Label(top_frame, text="파일을 열어주세요", foreground="gray")
+        self.viewer_status_label.pack(side=tk.LEFT, padx=(5, 0))
+        
+        # 트리뷰에는 보이는 행만 넣고, 스크롤바는 전체 레코드 수 기준으로 직접 관리
+        columns = ("no", "id", "kind", "text")
+        self.viewer_tree = ttk.Treeview(frame, columns=columns, show="headings", height=VIEWER_VISIBLE_ROWS)
+        for column, text, width in [("no", "#", 60), ("id", "ID", 180), ("kind", "종류", 60), ("text", "내용", 400)]:
+            self.viewer_tree.heading(column, text=text)
+            self.viewer_tree.column(column, width=width, anchor=tk.W, stretch=(column == "text"))
+        self.viewer_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.viewer_scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.on_viewer_scroll)
+        self.viewer_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.viewer_tree.bind('<MouseWheel>', lambda event: self.show_viewer_page(
+            self.viewer_first - (3 if event.delta > 0 else -3)))
+        self.viewer_tree.bind('<Button-4>', lambda event: self.show_viewer_page(self.viewer_first - 3))
+        self.viewer_tree.bind('<Button-5>', lambda event: self.show_viewer_page(self.viewer_first + 3))
+        self.viewer_tree.bind('<Double-1>', lambda event: self.show_viewer_record())
+        
+    def open_viewer_file(self):
+        """JSON 파일을 열고 백그라운드에서 레코드 위치 색인"""
+        path = filedialog.askopenfilename(
+            title="JSON 파일 선택", initialdir=self.target_folder_var.get() or None,
+            filetypes=[("JSON 파일", "*.json"), ("모든 파일", "*.*")])
+        if not path:
+            return
+        
+        # 이전 파일 색인 중지
+        if self.viewer_stop:
+            self.viewer_stop.set()
+        if self.viewer_index:
+            self.viewer_index.close()
+        
+        try:
+            index = JsonRecordIndex(Path(path))
+        except OSError as e:
+            messagebox.showerror("오류", f"파일 열기 실패: {e}")
+            return
+        self.viewer_index = index
+        self.viewer_stop = threading.Event()
+        self.viewer_first = 0
+        self.viewer_section_var.set("")
+        self.viewer_tree.delete(*self.viewer_tree.get_children())
+        
+        thread = threading.Thread(target=index.build, args=(self.viewer_stop,))
+        thread.daemon = True
+        thread.start()
+        self.log_message(f"📖 데이터 보기: {Path(path).name} ({index.size / (1024 * 1024):.1f}MB) 색인 시작")
+        self.poll_viewer_index(index)
+        
+    def poll_viewer_index(self, index):
+        """색인 진행 표시 (색인 중에도 찾은 레코드는 바로 표시)"""
+        if index is not self.viewer_index:
+            return
+        sections = index.sections()
+        self.viewer_section_combo.config(values=sections)
+        if not self.viewer_section_var.get() and sections:
+            self.viewer_section_var.set(sections[0])
+        section = self.viewer_section_var.get()
+        
+        if index.error:
+            self.viewer_status_label.config(text=f"색인 실패: {index.error}")
+        elif index.done:
+            self.viewer_status_label.config(text=f"{section}: {index.count(section):,}개")
+        else:
+            percent = index.scanned / index.size * 100 if index.size else 100
+            self.viewer_status_label.config(text=f"{section}: {index.count(section):,}개 (색인 중 {percent:.0f}%)")
+        
+        # 화면이 아직 다 채워지지 않았으면 다시 그리고, 아니면 늘어난 전체 수만 스크롤바에 반영
+        total = index.count(section) if section else 0
+        if section and len(self.viewer_tree.get_children()) < VIEWER_VISIBLE_ROWS:
+            self.show_viewer_page(self.viewer_first)
+        elif total:
+            self.viewer_scrollbar.set(self.viewer_first / total,
+                                      min(1.0, (self.viewer_first + VIEWER_VISIBLE_ROWS) / total))
+        if not index.done:
+            self.root.after(VIEWER_POLL_MS, lambda: self.poll_viewer_index(index))
+        
+    def show_viewer_page(self, first):
+        """first번째 레코드부터 보이는 행만 읽어서 표시"""
+        index = self.viewer_index
+        section = self.viewer_section_var.get()
+        if index is None or not section:
+            return
+        total = index.count(section)
+        first = max(0, min(int(first), max(0, total - VIEWER_VISIBLE_ROWS)))
+        self.viewer_first = first
+        
+        try:
+            records = index.read_range(section, first, VIEWER_VISIBLE_ROWS)
+        except (OSError, ValueError) as e:
+            self.viewer_status_label.config(text=f"레코드 읽기 실패: {e}")
+            return
+        
+        self.viewer_tree.delete(*self.viewer_tree.get_children())
+        for offset, record in enumerate(records):
+            if isinstance(record, dict):
+                record_id = record.get("id", "")
+                kind = record.get("mediaType") or record.get("source", "")
+                text = record.get("title") or record.get("prompt") or record.get("text") or record.get("url") \
+                    or json.dumps(record, ensure_ascii=False)
+            else:
+                record_id, kind, text = "", type(record).__name__, json.dumps(record, ensure_ascii=False)
+            text = str(text).replace("\n", " ")[:300]
+            self.viewer_tree.insert("", tk.END, iid=str(first + offset),
+                                    values=(first + offset + 1, record_id, kind, text))
+        
+        if total:
+            self.viewer_scrollbar.set(first / total, min(1.0, (first + VIEWER_VISIBLE_ROWS) / total))
+        else:
+            self.viewer_scrollbar.set(0, 1)
+        
+    def on_viewer_scroll(self, *args):
+        """스크롤바 이동 (moveto 비율 / scroll 단위·페이지)"""
+        section = self.viewer_section_var.get()
+        if self.viewer_index is None or not section:
+            return
+        total = self.viewer_index.count(section)
+        if args[0] == "moveto":
+            self.show_viewer_page(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = VIEWER_VISIBLE_ROWS if args[2] == "pages" else 1
+            self.show_viewer_page(self.viewer_first + int(args[1]) * step)
+        
+    def show_viewer_record(self):
+        """선택한 레코드 전체 내용 표시"""
+        selection = self.viewer_tree.selection()
+        if not selection or self.viewer_index is None:
+            return
+        position = int(selection[0])
+        record = self.viewer_index.read(self.viewer_section_var.get(), position)
+        window = tk.Toplevel(self.root)
+        window.title(f"{self.viewer_section_var.get()} #{position + 1}")
+        window.geometry("700x500")
+        text = scrolledtext.ScrolledText(window, wrap=tk.WORD)
+        text.pack(fill=tk.BOTH, expand=True)
+        text.insert(tk.END, json.dumps(record, ensure_ascii=False, indent=2))
+        text.config(state=tk.DISABLED)
+        
+    def setup_gallery(self, frame):
+        """갤러리 탭 구성"""
+        self.gallery_items = []  # (미디어 파일 경로 또는 None, 이름, 종류, 크기 표시)
+        self.gallery_tiles = {}  # 항목 번호 -> 캔버스 아이템 ID 목록
+        self.gallery_pending = {}  # 항목 번호 -> 썸네일 작업
+        self.gallery_photos = OrderedDict()  # 썸네일 경로 -> PhotoImage (최근 사용 순)
+        self.gallery_results = queue.Queue()
+        self.gallery_tk_decodes = deque()  # Pillow 없이 Tk로 줄일 원본 (poll마다 하나씩)
+        self.gallery_failed = set()  # 썸네일을 만들지 못한 원본 (다시 요청하지 않음)
+        self.gallery_generation = 0  # 폴더를 다시 열면 이전 결과는 버림
+        self.gallery_columns = 1
+        self.gallery_cache = None
+        self.gallery_pool = None
+        self.gallery_polling = False
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(1, weight=1)
+        
+        top_frame = ttk.Frame(frame)
+        top_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        ttk.Button(top_frame, text="폴더 열기", command=self.open_gallery_folder).pack(side=tk.LEFT)
+        ttk.Button(top_frame, text="데이터와 연결", command=self.load_gallery_records).pack(side=tk.LEFT, padx=(5, 0))
+        self.gallery_status_label = ttk.Label(top_frame, text="미디어 폴더를 열어주세요", foreground="gray")
+        self.gallery_status_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # 캔버스에는 보이는 타일만 그리고, 스크롤 영역은 전체 항목 수 기준
+        self.gallery_canvas = tk.Canvas(frame, background="white", highlightthickness=0)
+        self.gallery_canvas.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.on_gallery_scroll)
+        scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.gallery_canvas.config(yscrollcommand=scrollbar.set)
+        self.gallery_canvas.bind('<Configure>', lambda event: self.layout_gallery())
+        self.gallery_canvas.bind('<MouseWheel>', lambda event: self.on_gallery_scroll(
+            "scroll", -1 if event.delta > 0 else 1, "units"))
+        self.gallery_canvas.bind('<Button-4>', lambda event: self.on_gallery_scroll("scroll", -1, "units"))
+        self.gallery_canvas.bind('<Button-5>', lambda event: self.on_gallery_scroll("scroll", 1, "units"))
+        
+    def get_gallery_cache(self):
+        """썸네일 캐시와 생성 스레드 풀 반환 (처음 사용할 때 생성)"""
+        if self.gallery_cache is None:
+            self.gallery_cache = ThumbnailCache(Path(self.config["thumbnail_cache_dir"]),
+                                                max_bytes=int(self.config["thumbnail_cache_mb"]) * 1024 * 1024,
+                                                size=GALLERY_THUMB_SIZE)
+            self.gallery_pool = ThreadPoolExecutor(max_workers=max(1, int(self.config["thumbnail_workers"])),
+                                                   thread_name_prefix="thumbnail")
+        return self.gallery_cache
+        
+    def open_gallery_folder(self):
+        """미디어 폴더를 골라 폴더의 미디어 파일을 갤러리에 표시"""
+        folder = filedialog.askdirectory(title="미디어 폴더 선택", initialdir=self.config.get("media_folder") or None)
+        if not folder:
+            return
+        self.config["media_folder"] = folder
+        entries = scan_directory(folder) or []
+        items = []
+        for entry in sorted(entries, key=lambda entry: entry["mtime"], reverse=True):
+            path = Path(entry["path"])
+            if path.suffix.lower() in MEDIA_EXTENSIONS:
+                kind = "video" if path.suffix.lower() in (".mp4", ".webm", ".mov") else "image"
+                items.append((path, path.name, kind, f"{entry['size'] / 1024:.0f}KB"))
+        self.set_gallery_items(items, f"{Path(folder).name}: 미디어 {len(items):,}개")
+        
+    def load_gallery_records(self):
+        """데이터 보기에서 연 JSON의 images 레코드를 미디어 폴더의 파일과 (URL 파일명으로) 연결해 표시"""
+        index = self.viewer_index
+        if index is None or "images" not in index.sections():
+            messagebox.showinfo("갤러리", "데이터 보기 탭에서 images가 있는 JSON 파일을 먼저 열어주세요.")
+            return
+        generation = self.gallery_generation
+        media_folder = self.config.get("media_folder", "")
+        self.gallery_status_label.config(text=f"레코드 {index.count('images'):,}개 불러오는 중...")
+        
+        def load_in_thread():
+            # 큰 파일은 레코드가 많으므로 읽기와 파일 연결은 작업 스레드에서 하고 결과만 UI로 전달
+            try:
+                local_files = {}
+                for entry in scan_directory(media_folder) or []:
+                    local_files[entry["name"].lower()] = Path(entry["path"])
+                
+                items = []
+                found = 0
+                total = index.count("images")
+                for first in range(0, total, 500):
+                    for record in index.read_range("images", first, 500):
+                        if not isinstance(record, dict):
+                            continue
+                        url = str(record.get("url", ""))
+                        path = local_files.get(url.split("?")[0].rstrip("/").rsplit("/", 1)[-1].lower())
+                        found += path is not None
+                        size_text = f"{record.get('width', '?')}x{record.get('height', '?')}"
+                        items.append((path, record.get("title") or record.get("id", ""),
+                                      record.get("mediaType", "image"), size_text))
+            except (OSError, ValueError) as e:
+                self.log_message(f"❌ 갤러리 레코드 읽기 실패: {e}")
+                return
+            self.call_in_ui(self.finish_gallery_records, generation, items,
+                            f"레코드 {len(items):,}개 (로컬 파일 {found:,}개)")
+        
+        thread = threading.Thread(target=load_in_thread)
+        thread.daemon = True
+        thread.start()
+        
+    def finish_gallery_records(self, generation, items, status):
+        """불러온 레코드 표시 (그 사이 다른 항목을 열었으면 무시)"""
+        if generation == self.gallery_generation:
+            self.set_gallery_items(items, status)
+        
+    def set_gallery_items(self, items, status):
+        """갤러리 항목 교체 (진행 중인 썸네일 요청은 취소)"""
+        self.gallery_generation += 1
+        for future in self.gallery_pending.values():
+            future.cancel()
+        self.gallery_pending.clear()
+        self.gallery_failed.clear()
+        self.gallery_tiles.clear()
+        self.gallery_canvas.delete("all")
+        self.gallery_items = items
+        self.gallery_status_label.config(text=status)
+        self.gallery_canvas.yview_moveto(0)
+        self.layout_gallery()
+        
+    def layout_gallery(self):
+        """창 너비에 맞춰 열 수와 스크롤 영역을 다시 계산"""
+        width = max(self.gallery_canvas.winfo_width(), GALLERY_TILE_WIDTH)
+        columns = max(1, width // GALLERY_TILE_WIDTH)
+        if columns != self.gallery_columns:
+            self.gallery_columns = columns
+            self.gallery_tiles.clear()
+            self.gallery_canvas.delete("all")
+        rows = (len(self.gallery_items) + columns - 1) // columns
+        self.gallery_canvas.config(scrollregion=(0, 0, columns * GALLERY_TILE_WIDTH, rows * GALLERY_TILE_HEIGHT),
+                                   yscrollincrement=GALLERY_TILE_HEIGHT // 4)
+        self.render_gallery_tiles()
+        
+    def on_gallery_scroll(self, *args):
+        """스크롤 후 보이는 타일만 다시 그림"""
+        self.gallery_canvas.yview(*args)
+        self.render_gallery_tiles()
+        
+    def render_gallery_tiles(self):
+        """보이는 행(+ 위아래 한 행)의 타일만 그리고 나머지 타일과 썸네일 요청은 정리"""
+        if not self.gallery_items:
+            return
+        columns = self.gallery_columns
+        top = self.gallery_canvas.canvasy(0)
+        bottom = top + self.gallery_canvas.winfo_height()
+        first_row = max(0, int(top // GALLERY_TILE_HEIGHT) - 1)
+        last_row = int(bottom // GALLERY_TILE_HEIGHT) + 1
+        visible = range(first_row * columns, min(len(self.gallery_items), (last_row + 1) * columns))
+        
+        for number in [number for number in self.gallery_tiles if number not in visible]:
+            for item in self.gallery_tiles.pop(number):
+                self.gallery_canvas.delete(item)
+        for number in [number for number in self.gallery_pending if number not in visible]:
+            self.gallery_pending.pop(number).cancel()
+        
+        for number in visible:
+            if number not in self.gallery_tiles:
+                self.draw_gallery_tile(number)
+        
+    def draw_gallery_tile(self, number):
+        """타일 하나 그리기 - 썸네일이 메모리에 없으면 자리만 그리고 생성 요청"""
+        path, title, kind, size_text = self.gallery_items[number]
+        x = (number % self.gallery_columns) * GALLERY_TILE_WIDTH + GALLERY_TILE_WIDTH // 2
+        y = (number // self.gallery_columns) * GALLERY_TILE_HEIGHT
+        half = GALLERY_THUMB_SIZE // 2
+        canvas = self.gallery_canvas
+        items = [
+            canvas.create_rectangle(x - half, y + 5, x + half, y + 5 + GALLERY_THUMB_SIZE,
+                                    outline="#ccc", fill="#f4f4f4"),
+            canvas.create_text(x, y + 5 + half, text=f"{'🎬' if kind == 'video' else '🖼'} {size_text}",
+                               fill="gray"),
+            canvas.create_text(x, y + GALLERY_THUMB_SIZE + 15, text=str(title)[:24], width=GALLERY_TILE_WIDTH - 10),
+        ]
+        self.gallery_tiles[number] = items
+        if path is None or kind == "video":
+            return
+        if path in self.gallery_failed:
+            canvas.itemconfig(items[1], text="⚠️ 썸네일 없음")
+            return
+        
+        photo = self.gallery_photo_for(path)
+        if photo is not None:
+            items.append(canvas.create_image(x, y + 5 + half, image=photo))
+        elif number not in self.gallery_pending:
+            cache = self.get_gallery_cache()
+            self.gallery_pending[number] = self.gallery_pool.submit(
+                self.build_gallery_thumbnail, cache, self.gallery_generation, number, path)
+            if not self.gallery_polling:
+                self.gallery_polling = True
+                self.root.after(GALLERY_POLL_MS, self.poll_gallery_results)
+        
+    def gallery_photo_for(self, path):
+        """메모리에 올려 둔 썸네일 이미지 (없으면 None)"""
+        photo = self.gallery_photos.get(path)
+        if photo is not None:
+            self.gallery_photos.move_to_end(path)
+        return photo
+        
+    def build_gallery_thumbnail(self, cache, generation, number, path):
+        """썸네일 생성 (작업 스레드) - 결과는 큐로 UI에 전달 (어떤 오류든 결과를 보내 대기 중 항목이 남지 않게 함)"""
+        thumb, key, error = None, None, None
+        try:
+            thumb = cache.build(path)
+            key = cache.key_for(path) if thumb is None else None
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        self.gallery_results.put((generation, number, path, thumb, key, error))
+        
+    def poll_gallery_results(self):
+        """완료된 썸네일을 보이는 타일에 반영"""
+        cache = self.gallery_cache
+        while True:
+            try:
+                generation, number, path, thumb, key, error = self.gallery_results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self.gallery_generation:
+                continue
+            self.gallery_pending.pop(number, None)
+            if error is not None:
+                self.mark_gallery_failed(number, path, error)
+            elif thumb is not None:
+                self.show_gallery_thumbnail(number, path, thumb)
+            elif key and path.suffix.lower() in TK_IMAGE_EXTENSIONS:
+                self.gallery_tk_decodes.append((generation, number, path, key))
+        
+        # Pillow가 없으면 Tk가 읽을 수 있는 PNG/GIF를 Tk 스레드에서 줄여야 하므로 한 번에 하나만
+        # (큰 PNG 여러 개를 한 콜백에서 읽으면 창이 멈춤, 그 사이 화면에서 벗어난 타일은 건너뜀)
+        while self.gallery_tk_decodes:
+            generation, number, path, key = self.gallery_tk_decodes.popleft()
+            if generation != self.gallery_generation or number not in self.gallery_tiles:
+                continue
+            try:
+                image = tk.PhotoImage(file=str(path))
+                factor = max(1, -(-max(image.width(), image.height()) // GALLERY_THUMB_SIZE))
+                thumb = cache.path_for(key)
+                image.subsample(factor).write(str(thumb), format="png")
+                cache.added(thumb)
+                self.show_gallery_thumbnail(number, path, thumb)
+            except (tk.TclError, OSError) as e:
+                self.mark_gallery_failed(number, path, e)
+            break
+        
+        if self.gallery_pending or self.gallery_tk_decodes:
+            self.root.after(GALLERY_POLL_MS, self.poll_gallery_results)
+        else:
+            self.gallery_polling = False
+            if cache is not None:
+                cache.save_memo()
+        
+    def mark_gallery_failed(self, number, path, error):
+        """썸네일을 만들지 못한 타일 표시 (같은 원본은 다시 요청하지 않음)"""
+        self.gallery_failed.add(path)
+        self.log_message(f"⚠️ 썸네일 생성 실패: {path.name} - {error}")
+        if number in self.gallery_tiles:
+            self.gallery_canvas.itemconfig(self.gallery_tiles[number][1], text="⚠️ 썸네일 없음")
+        
+    def show_gallery_thumbnail(self, number, path, thumb):
+        """만든 썸네일을 메모리에 올리고 타일이 보이면 그림"""
+        try:
+            photo = tk.PhotoImage(file=str(thumb))
+        except tk.TclError:
+            return
+        self.gallery_photos[path] = photo
+        while len(self.gallery_photos) > GALLERY_PHOTO_CACHE:
+            self.gallery_photos.popitem(last=False)
+        if number in self.gallery_tiles:
+            x = (number % self.gallery_columns) * GALLERY_TILE_WIDTH + GALLERY_TILE_WIDTH // 2
+            y = (number // self.gallery_columns) * GALLERY_TILE_HEIGHT + 5 + GALLERY_THUMB_SIZE // 2
+            self.gallery_tiles[number].append(self.gallery_canvas.create_image(x, y, image=photo))
+        
+    def get_organizer(self):
+        """파일 정리 엔진 반환 (GUI 설정 반영)"""
+        with self.organizer_lock:
+            if self.organizer is None:
+                self.organizer = FileOrganizer(self.config_file)
+            self.organizer.config.update(self.config)
+            return self.organizer
+        
+    def log_profile(self, profiler):
+        """프로파일링 결과 표를 로그에 출력"""
+        self.log_message("   ⏱️ 프로파일링 결과:")
+        for line in profiler.format_table():
+            self.log_message(f"      {line}")
+        prof_files = [stats["prof_file"] for stats in profiler.finish().values() if "prof_file" in stats]
+        if prof_files:
+            self.log_message(f"      💾 .prof 파일 {len(prof_files)}개 저장: {Path(prof_files[0]).parent}")
+        
+    def on_organizer_progress(self, phase, message):
+        """파일 정리 엔진 진행 상황 콜백 (작업 스레드에서 호출됨)"""
+        self.log_message(f"   [{phase}] {message}")
+        
+    def preview_plan(self):
+        """실행하지 않고 작업 계획 미리보기 (logs/plan_latest.json에 저장)"""
+        self.save_config()
+        
+        def plan_in_thread():
+            try:
+                self.log_message("🔎 작업 계획을 계산합니다... (파일은 변경되지 않음)")
+                plan = self.get_organizer().create_plan()
+                self.last_plan = plan
+                
+                plan_file = Path("logs") / "plan_latest.json"
+                plan_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(plan_file, 'w', encoding='utf-8') as f:
+                    json.dump(plan, f, indent=2, ensure_ascii=False)
+                
+                summary = plan["summary"]
+                self.log_message(f"📋 작업 계획: {summary['operations']}개 작업 "
+                                 f"(복사 {summary['copy']}, 이동 {summary['move']}, 삭제 {summary['delete']}, "
+                                 f"버전 기록 {summary.get('version', 0)})")
+                self.log_message(f"   📏 데이터: {summary['bytes']:,} bytes, ⏱️ 예상 시간: {summary['estimated_seconds']:.2f}초")
+                for op in plan["operations"][:50]:
+                    target = f" → {op['dst']}" if "dst" in op else ""
+                    self.log_message(f"   [{op['group']}] {op['op']}: {op['src']}{target} ({op['bytes']:,} bytes)")
+                if len(plan["operations"]) > 50:
+                    self.log_message(f"   ... 외 {len(plan['operations']) - 50}개")
+                self.log_message(f"   💾 계획 저장: {plan_file} ('계획 실행' 버튼으로 그대로 실행)")
+                
+            except Exception as e:
+                self.log_message(f"❌ 작업 계획 계산 중 오류 발생: {e}")
+                
+        thread = threading.Thread(target=plan_in_thread)
+        thread.daemon = True
+        thread.start()
+        
+    def execute_last_plan(self):
+        """미리보기한 작업 계획을 다시 검색하지 않고 실행"""
+        plan = self.last_plan
+        if plan is None:
+            messagebox.showinfo("알림", "먼저 '미리보기'로 작업 계획을 만들어주세요.")
+            return
+        self.last_plan = None
+        
+        def execute_in_thread():
+            try:
+                self.log_message(f"▶️ 작업 계획 실행 ({plan['summary']['operations']}개 작업)...")
+                cancel_event = self.begin_run("작업 계획")
+                try:
+                    result = self.get_organizer().execute_plan(
+                        plan, progress_callback=self.on_organizer_progress,
+                        progress_stats=lambda info: self.on_run_progress("작업 계획", info),
+                        cancel_event=cancel_event)
+                finally:
+                    self.end_run(cancel_event, "작업 계획")
+                status = "⏹" if result["cancelled"] else ("✅" if result["success"] else "❌")
+                self.log_message(f"{status} 작업 계획 실행 {'중지' if result['cancelled'] else '완료'}: "
+                                 f"완료 {result['done']}, 건너뜀 {result['skipped']}, 실패 {result['failed']} "
+                                 f"({result['bytes']:,} bytes, {result['total_time']:.2f}초)")
+            except Exception as e:
+                self.log_message(f"❌ 작업 계획 실행 중 오류 발생: {e}")
+                
+        thread = threading.Thread(target=execute_in_thread)
         thread.daemon = True
         thread.start()
         
@@ -1105,14 +2243,20 @@ class FileOrganizerGUI:
             try:
                 self.log_message("📊 현재 상태를 확인합니다...")
                 
-                result = subprocess.run([sys.executable, "file_organizer.py", "--status"], 
-                                      capture_output=True, text=True, 
-                                      encoding='cp949', errors='replace')  # Windows 한글 인코딩
+                status = self.get_organizer().get_status()
+                self.refresh_status_summary(status)
                 
-                if result.stdout:
-                    for line in result.stdout.strip().split('\n'):
-                        if line.strip():
-                            self.log_message(line.strip())
+                self.log_message("=== 현재 설정 ===")
+                for key, value in status["config"].items():
+                    self.log_message(f"  {key}: {value}")
+                    
+                if status["files"]:
+                    self.log_message(f"📁 다운로드 폴더의 {status['config']['file_pattern']} 파일들:")
+                    for file in status["files"]:
+                        mtime = datetime.fromtimestamp(file["mtime"])
+                        self.log_message(f"  - {file['name']} ({file['size']:,} bytes, 수정: {mtime})")
+                else:
+                    self.log_message("📁 다운로드 폴더에 해당 파일이 없습니다.")
                             
             except Exception as e:
                 self.log_message(f"❌ 상태 확인 중 오류 발생: {e}")
@@ -1128,7 +2272,7 @@ class FileOrganizerGUI:
             if os.name == 'nt':  # Windows
                 os.startfile(log_dir)
             else:  # Linux/Mac
-                subprocess.run(["xdg-open", str(log_dir)])
+                subprocess.Popen(["xdg-open", str(log_dir)])
             self.log_message(f"📁 로그 폴더를 열었습니다: {log_dir}")
         else:
             self.log_message("📁 로그 폴더가 존재하지 않습니다.")
@@ -1140,13 +2284,18 @@ class FileOrganizerGUI:
             if os.name == 'nt':  # Windows
                 os.startfile(target_dir)
             else:  # Linux/Mac
-                subprocess.run(["xdg-open", str(target_dir)])
+                subprocess.Popen(["xdg-open", str(target_dir)])
             self.log_message(f"📁 대상 폴더를 열었습니다: {target_dir}")
         else:
             self.log_message("📁 대상 폴더가 존재하지 않습니다.")
 
     def on_window_resize(self, event):
         """창 크기 변경 시 레이아웃 재조정"""
+        # 자식 위젯의 <Configure>도 여기로 전달되므로 창 자체의 크기가 바뀐 경우만 처리
+        if event.widget is not self.root or (event.width, event.height) == getattr(self, "last_window_size", None):
+            return
+        self.last_window_size = (event.width, event.height)
+        
         # 창 크기가 너무 작을 때 최소 크기 유지
         if event.width < 800:
             self.root.geometry("800x600")
@@ -1155,8 +2304,7 @@ class FileOrganizerGUI:
         
         # 로그 텍스트 영역 크기 동적 조정
         try:
-            log_frame = self.root.grid_slaves(row=0, column=1)[0]
-            log_text = log_frame.grid_slaves(row=0, column=0)[0]
+            log_text = self.log_text
             
             # 창 크기에 따라 로그 텍스트 영역 크기 조정
             window_width = self.root.winfo_width()
@@ -1172,9 +2320,14 @@ class FileOrganizerGUI:
             pass  # 위젯이 아직 생성되지 않은 경우 무시
 
 def main():
+    startup_start = time.perf_counter()
     root = tk.Tk()
-    app = FileOrganizerGUI(root)
-    root.mainloop()
+    app = FileOrganizerGUI(root, startup_start)
+    try:
+        root.mainloop()
+    finally:
+        if app.ui_lag_monitor:
+            app.ui_lag_monitor.stop()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
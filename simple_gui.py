@@ -8,11 +8,12 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import json
 import os
+import queue
 import threading
 from datetime import datetime
 from pathlib import Path
-import shutil
-import glob
+
+from file_organizer import FileOrganizer, format_progress
 
 class SimpleFileOrganizerGUI:
     def __init__(self, root):
@@ -25,9 +26,17 @@ class SimpleFileOrganizerGUI:
         self.config_file = "file_organizer_config.json"
         self.config = self.load_config()
         
+        # 파일 정리 엔진 (첫 실행 시 생성)
+        self.organizer = None
+        self.cancel_event = None  # 실행 중인 정리 작업의 취소 신호
+        
+        # 작업 스레드가 요청한 화면 갱신 (Tk 호출은 poll_ui_queue가 Tk 스레드에서 실행)
+        self.ui_queue = queue.Queue()
+        
         # UI 초기화
         self.setup_ui()
         self.load_config_to_ui()
+        self.poll_ui_queue()
         
     def load_config(self):
         """설정 파일 로드"""
@@ -141,14 +150,25 @@ class SimpleFileOrganizerGUI:
         ttk.Button(button_frame, text="설정 저장", command=self.save_config).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="파일 정리 실행", command=self.run_organizer).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="상태 확인", command=self.check_status).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="폴더 열기", command=self.open_folders).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="폴더 열기", command=self.open_folders).pack(side=tk.LEFT, padx=(0, 5))
+        self.cancel_button = ttk.Button(button_frame, text="⏹ 중지", command=self.cancel_organizer, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT)
+        
+        # 진행 상황 (처리한 파일/바이트 기준)
+        progress_frame = ttk.Frame(main_frame)
+        progress_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
+        progress_frame.columnconfigure(0, weight=1)
+        self.progress_bar = ttk.Progressbar(progress_frame, mode="determinate", maximum=100)
+        self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.progress_label = ttk.Label(progress_frame, text="대기 중", foreground="gray")
+        self.progress_label.grid(row=1, column=0, sticky=tk.W)
         
         # 로그 프레임
         log_frame = ttk.LabelFrame(main_frame, text="실행 로그", padding="10")
-        log_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        log_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
-        main_frame.rowconfigure(3, weight=1)
+        main_frame.rowconfigure(4, weight=1)
         
         # 로그 텍스트 영역
         self.log_text = scrolledtext.ScrolledText(log_frame, height=12, width=70)
@@ -189,145 +209,105 @@ class SimpleFileOrganizerGUI:
         """로그 메시지 추가"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
+        if threading.current_thread() is not threading.main_thread():
+            self.call_in_ui(self.append_log, log_entry)
+            return
+        self.append_log(log_entry)
+        self.root.update_idletasks()
+        
+    def append_log(self, log_entry):
+        """로그 창에 한 줄 추가 (Tk 스레드)"""
         self.log_text.insert(tk.END, log_entry)
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
         
-    def find_files(self, pattern):
-        """패턴에 맞는 파일들 찾기"""
-        download_path = Path(self.config["download_folder"])
-        search_pattern = download_path / pattern
+    def call_in_ui(self, func, *args):
+        """Tk 스레드에서 실행할 화면 갱신 예약 (작업 스레드에서 호출)"""
+        self.ui_queue.put((func, args))
         
-        self.log_message(f"파일 검색 패턴: {search_pattern}")
+    def poll_ui_queue(self):
+        """예약된 화면 갱신 실행 (100ms마다, Tk 스레드)"""
+        while True:
+            try:
+                func, args = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            func(*args)
+        self.root.after(100, self.poll_ui_queue)
         
-        files = list(Path(download_path).glob(pattern))
-        files = [f for f in files if f.is_file()]
+    def get_organizer(self):
+        """파일 정리 엔진 반환 (GUI 설정 반영) - 검색/검사/복사/백업은 엔진이 담당"""
+        if self.organizer is None:
+            self.organizer = FileOrganizer(self.config_file)
+        self.organizer.config.update(self.config)
+        return self.organizer
         
-        self.log_message(f"발견된 파일 수: {len(files)}")
-        for file in files:
-            self.log_message(f"  - {file.name}")
-            
-        return files
+    def on_organizer_progress(self, phase, message):
+        """파일 정리 엔진 진행 상황 콜백"""
+        self.log_message(f"  [{phase}] {message}")
         
-    def get_latest_file(self, files):
-        """가장 최신 파일 찾기"""
-        if not files:
-            return None
-            
-        latest_file = max(files, key=lambda x: x.stat().st_mtime)
+    def on_run_progress(self, info):
+        """진행률 콜백 (작업 스레드에서 호출됨) - UI 갱신은 poll_ui_queue가 Tk 스레드에서"""
+        self.call_in_ui(self.show_progress, info)
         
-        self.log_message(f"최신 파일: {latest_file.name}")
-        self.log_message(f"수정 시간: {datetime.fromtimestamp(latest_file.stat().st_mtime)}")
+    def show_progress(self, info):
+        """진행률 막대와 처리량/남은 시간 표시"""
+        text, percent = format_progress("파일 정리", info)
+        self.progress_bar.config(value=percent or 0)
+        self.progress_label.config(text=text)
         
-        return latest_file
+    def finish_run(self, text):
+        """실행 종료 표시 (메인 스레드)"""
+        self.cancel_event = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self.progress_label.config(text=text)
         
-    def validate_json_file(self, file_path):
-        """JSON 파일 유효성 검사"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            required_keys = ['metadata', 'images', 'prompts']
-            if not all(key in data for key in required_keys):
-                self.log_message(f"⚠️ 필수 키가 누락됨: {file_path.name}")
-                return False
-                
-            self.log_message(f"✅ JSON 파일 유효성 검사 통과: {file_path.name}")
-            self.log_message(f"  - 이미지: {len(data.get('images', []))}개")
-            self.log_message(f"  - 프롬프트: {len(data.get('prompts', []))}개")
-            
-            return True
-            
-        except Exception as e:
-            self.log_message(f"❌ JSON 파싱 오류: {file_path.name} - {e}")
-            return False
-            
-    def copy_file(self, source, target):
-        """파일 복사"""
-        try:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, target)
-            self.log_message(f"✅ 파일 복사 완료: {source.name} → {target}")
-            return True
-        except Exception as e:
-            self.log_message(f"❌ 파일 복사 실패: {source.name} → {target} - {e}")
-            return False
-            
-    def backup_files(self, files):
-        """기존 파일들을 백업 폴더로 이동"""
-        if not self.config["backup_old_files"]:
-            return
-            
-        backup_path = Path(self.config["backup_folder"])
-        backup_path.mkdir(parents=True, exist_ok=True)
+    def cancel_organizer(self):
+        """실행 중인 파일 정리 취소 요청 (처리 중인 파일까지 마치고 멈춤)"""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_button.config(state=tk.DISABLED)
+            self.log_message("⏹ 중지 요청 - 처리 중인 파일까지 마치고 멈춥니다.")
         
-        self.log_message(f"📁 백업 폴더: {backup_path}")
-        
-        for file in files:
-            try:
-                backup_file = backup_path / file.name
-                
-                counter = 1
-                while backup_file.exists():
-                    name_parts = file.stem.rsplit('_', 1)
-                    if len(name_parts) > 1 and name_parts[1].isdigit():
-                        base_name = name_parts[0]
-                        counter = int(name_parts[1]) + 1
-                    else:
-                        base_name = file.stem
-                    
-                    backup_file = backup_path / f"{base_name}_{counter}{file.suffix}"
-                    counter += 1
-                
-                shutil.move(str(file), str(backup_file))
-                self.log_message(f"✅ 백업 완료: {file.name} → {backup_file.name}")
-                
-            except Exception as e:
-                self.log_message(f"❌ 백업 실패: {file.name} - {e}")
-                
     def run_organizer(self):
         """파일 정리 실행"""
+        if self.cancel_event is not None:
+            self.log_message("⏭️ 파일 정리가 이미 실행 중입니다.")
+            return
+        cancel_event = threading.Event()
+        self.cancel_event = cancel_event
+        self.cancel_button.config(state=tk.NORMAL)
+        self.progress_bar.config(value=0)
+        self.progress_label.config(text="파일 정리 시작...")
+        
         def run_in_thread():
+            status = "파일 정리 실패"
             try:
                 self.log_message("🔄 파일 정리를 시작합니다...")
                 
                 # 설정 저장
                 self.save_config()
                 
-                # 1. 파일 찾기
-                files = self.find_files(self.config["file_pattern"])
+                # 간단한 GUI는 복사와 백업만 (오래된 백업은 지우지 않음)
+                result = self.get_organizer().run(progress_callback=self.on_organizer_progress,
+                                                  progress_stats=self.on_run_progress,
+                                                  cancel_event=cancel_event, cleanup=False)
+                status = "파일 정리 완료" if result["success"] else (
+                    "파일 정리 취소됨" if result["cancelled"] else "파일 정리 실패")
                 
-                if not files:
-                    self.log_message("⚠️ 정리할 파일이 없습니다.")
-                    return
-                    
-                # 2. 최신 파일 찾기
-                latest_file = self.get_latest_file(files)
-                if not latest_file:
-                    self.log_message("❌ 최신 파일을 찾을 수 없습니다.")
-                    return
-                    
-                # 3. JSON 파일 유효성 검사
-                if not self.validate_json_file(latest_file):
-                    self.log_message("❌ 최신 파일이 유효하지 않습니다.")
-                    return
-                    
-                # 4. 대상 폴더에 복사
-                target_path = Path(self.config["target_folder"]) / self.config["output_filename"]
-                
-                if self.copy_file(latest_file, target_path):
-                    self.log_message(f"✅ 파일 정리 완료: {target_path}")
-                    
-                    # 5. 백업 처리
-                    if self.config["backup_old_files"]:
-                        self.backup_files(files)
-                        
+                if result["cancelled"]:
+                    self.log_message(f"⏹ {result['message']}")
+                elif result["success"]:
+                    if result["backed_up"]:
+                        self.log_message(f"📁 백업 완료: {result['backed_up']}개 → {self.config['backup_folder']}")
+                    self.log_message(f"✅ 파일 정리 완료: {result['target_path']}")
                     self.log_message("🎉 모든 작업이 완료되었습니다!")
                 else:
-                    self.log_message("❌ 파일 정리에 실패했습니다.")
+                    self.log_message(f"❌ 파일 정리에 실패했습니다: {result['message']}")
                     
             except Exception as e:
                 self.log_message(f"❌ 실행 중 오류 발생: {e}")
+            finally:
+                self.call_in_ui(self.finish_run, status)
                 
         thread = threading.Thread(target=run_in_thread)
         thread.daemon = True
@@ -338,18 +318,19 @@ class SimpleFileOrganizerGUI:
         try:
             self.log_message("📊 현재 상태를 확인합니다...")
             
+            status = self.get_organizer().get_status()
+            
             # 설정 표시
             self.log_message("=== 현재 설정 ===")
             for key, value in self.config.items():
                 self.log_message(f"  {key}: {value}")
                 
             # 파일 목록 확인
-            files = self.find_files(self.config["file_pattern"])
-            if files:
+            if status["files"]:
                 self.log_message(f"📁 다운로드 폴더의 {self.config['file_pattern']} 파일들:")
-                for file in sorted(files, key=lambda x: x.stat().st_mtime, reverse=True):
-                    mtime = datetime.fromtimestamp(file.stat().st_mtime)
-                    self.log_message(f"  - {file.name} (수정: {mtime})")
+                for file in status["files"]:
+                    mtime = datetime.fromtimestamp(file["mtime"])
+                    self.log_message(f"  - {file['name']} (수정: {mtime})")
             else:
                 self.log_message("📁 다운로드 폴더에 해당 파일이 없습니다.")
                 